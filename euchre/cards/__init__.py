@@ -1,2 +1,11 @@
 from .card import Card
+from .card import CARDS
 from .deck import Deck
+from .cardset import CardSet
+from .ranking import TRICK_RANKS
+from .ranking import EFFECTIVE_SUITS
+from .ranking import RANK_TABLE
+from .ranking import trick_winner
+from .canonical import canonicalize
+from .canonical import canonicalIndex
+from .canonical import fromCanonicalIndex
@@ -0,0 +1,240 @@
+"""Suit-isomorphism canonicalization and indexing of hands.
+
+Once trump is fixed, the suit of the same color as trump is fixed too (it
+holds the left bower), but the two suits of the other color play the same
+role. A (hand, top card, trump) tuple is canonicalized by relabelling trump
+as clubs, its partner as spades and choosing the labelling of hearts and
+diamonds that gives the smaller index. Equivalent positions then share one
+canonical form and one index.
+
+The index combines the colex rank of the 5 card hand among the C(24, 5)
+hands with the rank of the top card among the 19 cards left in the deck,
+so every index in range(INDEX_COUNT) decodes to a hand and top card.
+"""
+from .card import CARDS
+from .card import SUITS
+from .cardset import CardSet
+
+HAND_SIZE = 5
+DECK_SIZE = len(CARDS)
+RANKS_PER_SUIT = 6
+
+
+def _binomials(n, k):
+    """Table of binomial coefficients, table[i][j] is i choose j."""
+    table = [[0] * (k + 1) for _ in range(n + 1)]
+    for i in range(n + 1):
+        table[i][0] = 1
+        for j in range(1, min(i, k) + 1):
+            table[i][j] = table[i - 1][j - 1] + table[i - 1][j]
+    return table
+
+
+_BINOMIALS = _binomials(DECK_SIZE, HAND_SIZE)
+
+# Number of 5 card hands and number of (hand, top card) indexes
+HAND_COUNT = _BINOMIALS[DECK_SIZE][HAND_SIZE]
+INDEX_COUNT = HAND_COUNT * (DECK_SIZE - HAND_SIZE)
+
+_SUIT_BITS = (1 << RANKS_PER_SUIT) - 1
+
+
+def _suitPermutations(trump):
+    """Suit relabellings that send trump to clubs and keep colors.
+
+    Args:
+        trump (int): Index of trump in SUITS
+
+    Returns:
+        (tuple): Two tuples mapping real suit index to canonical suit index
+    """
+    partner = trump ^ 1
+    other, other_partner = trump ^ 2, trump ^ 3
+    perms = []
+    for hearts, diamonds in [(other, other_partner), (other_partner, other)]:
+        perm = [0] * 4
+        perm[trump] = 0
+        perm[partner] = 1
+        perm[hearts] = 2
+        perm[diamonds] = 3
+        perms.append(tuple(perm))
+    return tuple(perms)
+
+
+_PERMUTATIONS = {suit: _suitPermutations(i) for i, suit in enumerate(SUITS)}
+
+
+def relabelMask(mask, perm):
+    """Relabels the suits of the cards in a mask.
+
+    Args:
+        mask (int): Bitmask of card indexes
+        perm (tuple): Maps real suit index to new suit index
+
+    Returns:
+        (int): Bitmask with each suit block moved to its new suit
+    """
+    relabelled = 0
+    for suit, new_suit in enumerate(perm):
+        block = (mask >> (suit * RANKS_PER_SUIT)) & _SUIT_BITS
+        relabelled |= block << (new_suit * RANKS_PER_SUIT)
+    return relabelled
+
+
+def relabelIndex(index, perm):
+    """Relabels the suit of a single card index.
+
+    Args:
+        index (int): Card index
+        perm (tuple): Maps real suit index to new suit index
+
+    Returns:
+        (int): Card index with the new suit
+    """
+    suit, rank = divmod(index, RANKS_PER_SUIT)
+    return perm[suit] * RANKS_PER_SUIT + rank
+
+
+def rankHand(mask):
+    """Colex rank of a 5 card hand.
+
+    Args:
+        mask (int): Bitmask of the 5 cards in the hand
+
+    Returns:
+        (int): Rank of the hand in range(HAND_COUNT)
+    """
+    rank = 0
+    k = 1
+    while mask:
+        low = mask & -mask
+        rank += _BINOMIALS[low.bit_length() - 1][k]
+        mask ^= low
+        k += 1
+    return rank
+
+
+def unrankHand(rank):
+    """Inverse of rankHand.
+
+    Args:
+        rank (int): Rank of the hand in range(HAND_COUNT)
+
+    Returns:
+        (int): Bitmask of the 5 cards in the hand
+    """
+    mask = 0
+    index = DECK_SIZE - 1
+    for k in range(HAND_SIZE, 0, -1):
+        while _BINOMIALS[index][k] > rank:
+            index -= 1
+        rank -= _BINOMIALS[index][k]
+        mask |= 1 << index
+        index -= 1
+    return mask
+
+
+def _rankTop(hand_mask, top_index):
+    """Rank of the top card among the cards not in the hand."""
+    below = ((1 << top_index) - 1) & ~hand_mask
+    return bin(below).count('1')
+
+
+def _unrankTop(hand_mask, top_rank):
+    """Inverse of _rankTop."""
+    rest = ((1 << DECK_SIZE) - 1) & ~hand_mask
+    for _ in range(top_rank):
+        rest &= rest - 1
+    return (rest & -rest).bit_length() - 1
+
+
+def _checkPosition(mask, top_index):
+    """Raises ValueError unless the hand has 5 cards without the top card."""
+    if bin(mask).count('1') != HAND_SIZE or (mask >> top_index) & 1:
+        raise ValueError("Hand must be 5 cards that don't include the top card")
+
+
+def _index(hand_mask, top_index):
+    """Index of a position without relabelling suits."""
+    return (rankHand(hand_mask) * (DECK_SIZE - HAND_SIZE)
+            + _rankTop(hand_mask, top_index))
+
+
+def canonicalize(hand, top_card, trump):
+    """Maps a position to its canonical form.
+
+    Args:
+        hand (CardSet or list): The 5 cards in the hand
+        top_card (Card): The card turned up in the kitty
+        trump (str): Trump suit
+
+    Returns:
+        hand (CardSet): Canonical hand
+        top_card (Card): Canonical top card
+        trump (str): Canonical trump, always 'C'
+        suits (dict): Maps each real suit to its canonical suit
+    """
+    mask = hand.mask if isinstance(hand, CardSet) else CardSet(hand).mask
+    _checkPosition(mask, top_card.index)
+    best = None
+    for perm in _PERMUTATIONS[trump]:
+        canon_mask = relabelMask(mask, perm)
+        canon_top = relabelIndex(top_card.index, perm)
+        index = _index(canon_mask, canon_top)
+        if best is None or index < best[0]:
+            best = (index, canon_mask, canon_top, perm)
+    _, canon_mask, canon_top, perm = best
+    suits = {suit: SUITS[perm[i]] for i, suit in enumerate(SUITS)}
+    return CardSet.fromMask(canon_mask), CARDS[canon_top], SUITS[0], suits
+
+
+def canonicalIndex(hand, top_card, trump):
+    """Dense index of the canonical form of a position.
+
+    Equivalent positions under suit relabelling share an index.
+
+    Args:
+        hand (CardSet or list): The 5 cards in the hand
+        top_card (Card): The card turned up in the kitty
+        trump (str): Trump suit
+
+    Returns:
+        (int): Index in range(INDEX_COUNT)
+    """
+    mask = hand.mask if isinstance(hand, CardSet) else CardSet(hand).mask
+    top_index = top_card.index
+    _checkPosition(mask, top_index)
+    return min(_index(relabelMask(mask, perm), relabelIndex(top_index, perm))
+               for perm in _PERMUTATIONS[trump])
+
+
+def fromCanonicalIndex(index):
+    """Decodes an index from canonicalIndex.
+
+    Args:
+        index (int): Index in range(INDEX_COUNT)
+
+    Returns:
+        hand (CardSet): The 5 cards in the hand
+        top_card (Card): The card turned up in the kitty
+        trump (str): Trump suit, always 'C'
+    """
+    hand_rank, top_rank = divmod(index, DECK_SIZE - HAND_SIZE)
+    mask = unrankHand(hand_rank)
+    return CardSet.fromMask(mask), CARDS[_unrankTop(mask, top_rank)], SUITS[0]
+
+
+def isCanonicalIndex(index):
+    """Whether an index is the one canonicalIndex picks for its position.
+
+    Most positions have two indexes, one for each labelling of the
+    suits of the other color. Tables only need entries for canonical ones.
+
+    Args:
+        index (int): Index in range(INDEX_COUNT)
+
+    Returns:
+        (bool): True if canonicalIndex maps the decoded position to index
+    """
+    hand, top_card, trump = fromCanonicalIndex(index)
+    return canonicalIndex(hand, top_card, trump) == index
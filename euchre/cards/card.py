@@ -1,65 +1,72 @@
-import random
-
-
 class Card:
     """Card object used to construct a deck.
 
     Contains the shorthand names for the rank and suit of a Card.
 
+    Cards are immutable. The 24 cards of a euchre deck are interned in a
+    module level registry, use Card.str2card, Card.get or Card.fromIndex to
+    fetch those shared instances instead of constructing new ones. Cards
+    fetched from the registry can be compared by identity.
+
     Attributes:
         rank (str): The shorthand rank of the card, i.e. 'Ace' is 'A'.
         suit (str): The shorthand suit of the card, i.e. 'Clubs' is 'C'.
+        index (int): Position of the card in a fresh Deck, 0 to 23.
     """
 
+    __slots__ = ('_rank', '_suit', 'rank', 'suit', 'index')
+
+    # Lookup tables shared by every card
+    _off_suit = {
+        'C': 'S',
+        'S': 'C',
+        'H': 'D',
+        'D': 'H'
+    }
+    _values = {
+        'A': 6,
+        'K': 5,
+        'Q': 4,
+        'J': 3,
+        '10': 2,
+        '9': 1
+    }
+    _symbols = {
+        'C': '♣',
+        'S': '♠',
+        'H': '♥',
+        'D': '♦'
+    }
+
     def __init__(self, rank, suit):
         """
         Args:
             rank (str): Longform rank of card with first character capitalized
             suit (str): Longform suit of card with first character capitalized
         """
-        self._rank = str(rank)
-        self._suit = str(suit)
-        self._off_suit = {
-            'C': 'S',
-            'S': 'C',
-            'H': 'D',
-            'D': 'H'
-        }
-        self._values = {
-            'A': 6,
-            'K': 5,
-            'Q': 4,
-            'J': 3,
-            '10': 2,
-            '9': 1
-        }
-        self._symbols = {
-            'C': '♣',
-            'S': '♠',
-            'H': '♥',
-            'D': '♦'
-        }
-
-    @property
-    def rank(self):
-        """Shorthand rank of card.
-
-        Returns:
-            rank (str): Shorthand rank of the card
+        rank = str(rank)
+        suit = str(suit)
+        short_rank = '10' if rank == '10' else rank[0]
+        short_suit = suit[0]
+        object.__setattr__(self, '_rank', rank)
+        object.__setattr__(self, '_suit', suit)
+        object.__setattr__(self, 'rank', short_rank)
+        object.__setattr__(self, 'suit', short_suit)
+        object.__setattr__(self, 'index',
+                           SUITS.index(short_suit) * 6
+                           + RANKS.index(short_rank))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card objects are immutable")
+
+    def __reduce__(self):
+        """Pickles cards as their index so unpickling returns the shared
+        instance from the registry.
         """
-        if self._rank == '10':
-            return '10'
-        else:
-            return self._rank[0]
-
-    @property
-    def suit(self):
-        """Shorthand suit of the Card.
-
-        Returns:
-            suit (str): Shorthand suit of the Card
-        """
-        return self._suit[0]
+        return (Card.fromIndex, (self.index,))
 
     def getSuit(self, trump_suit):
         """Shorthand suit of the Card given trump.
@@ -108,15 +115,42 @@ class Card:
                 character is the rank and the second is the suit
 
         Returns:
-            (Card): A card object corresponding to the shorthand
+            (Card): The shared card object corresponding to the shorthand
         """
-        rank = shorthand[0]
-        suit = shorthand[1]
+        try:
+            return _BY_SHORTHAND[shorthand]
+        except KeyError:
+            raise ValueError(f"Invalid card shorthand: {shorthand}") from None
 
-        if rank == '1':
-            rank = '10'
+    @classmethod
+    def get(cls, rank, suit):
+        """Fetch the shared card with the given rank and suit.
 
-        return Card(rank, suit)
+        Args:
+            rank (str): Longform or shorthand rank, i.e. 'Ace' or 'A'
+            suit (str): Longform or shorthand suit, i.e. 'Clubs' or 'C'
+
+        Returns:
+            (Card): The shared card object with the rank and suit
+        """
+        rank = str(rank)
+        short_rank = '10' if rank == '10' else rank[0]
+        try:
+            return _BY_RANK_SUIT[(short_rank, str(suit)[0])]
+        except KeyError:
+            raise ValueError(f"Invalid card: {rank} of {suit}") from None
+
+    @classmethod
+    def fromIndex(cls, index):
+        """Fetch the shared card at an index of the registry.
+
+        Args:
+            index (int): Position of the card in a fresh Deck, 0 to 23
+
+        Returns:
+            (Card): The shared card object at the index
+        """
+        return CARDS[index]
 
     def __str__(self):
         """Shorthand name of card.
@@ -127,6 +161,9 @@ class Card:
         """
         return self._rank[0] + self._suit[0]
 
+    def __repr__(self):
+        return f"Card({self._rank!r}, {self._suit!r})"
+
     def value(self, led_suit, trump_suit):
         """Value of card in context of the led suit and the trump suit.
 
@@ -158,10 +195,8 @@ class Card:
         Returns:
             (bool): True if left bower, otherwise False
         """
-        if self.rank == 'J' and self.suit == self._off_suit[trump_suit[0]]:
-            return True
-        else:
-            return False
+        return (self.rank == 'J'
+                and self.suit == self._off_suit[trump_suit[0]])
 
     def isRightBower(self, trump_suit):
         """Whether the card is right bower given the trump suit.
@@ -172,7 +207,20 @@ class Card:
         Returns:
             (bool): True if right bower, otherwise False
         """
-        if self.rank == 'J' and self.suit == trump_suit[0]:
-            return True
-        else:
-            return False
+        return self.rank == 'J' and self.suit == trump_suit[0]
+
+
+# Shorthand suits and ranks in registry order
+SUITS = ('C', 'S', 'H', 'D')
+RANKS = ('A', 'K', 'Q', 'J', '10', '9')
+
+# Registry of the 24 shared cards, ordered like a fresh Deck
+CARDS = tuple(
+    Card(rank, suit)
+    for suit in ('Clubs', 'Spades', 'Hearts', 'Diamonds')
+    for rank in ('Ace', 'King', 'Queen', 'Jack', '10', '9')
+)
+
+_BY_RANK_SUIT = {(card.rank, card.suit): card for card in CARDS}
+_BY_SHORTHAND = {str(card): card for card in CARDS}
+_BY_SHORTHAND.update({card.rank + card.suit: card for card in CARDS})
@@ -0,0 +1,214 @@
+from .card import CARDS
+from .card import SUITS
+
+
+def _buildSuitMasks():
+    """Builds the effective suit masks for every trump.
+
+    Returns:
+        (dict): Maps trump (str or None) to a dict mapping each suit (str) to
+            the bitmask of cards that follow that suit under the trump. The
+            left bower is counted as trump. A trump of None gives the printed
+            suits of the cards.
+    """
+    masks = {}
+    for trump in SUITS + (None,):
+        masks[trump] = {suit: 0 for suit in SUITS}
+        for card in CARDS:
+            suit = card.suit if trump is None else card.getSuit(trump)
+            masks[trump][suit] |= 1 << card.index
+    return masks
+
+
+# Effective suit masks, indexed by trump and then by suit
+SUIT_MASKS = _buildSuitMasks()
+
+# Mask with every card in the deck
+FULL_MASK = (1 << len(CARDS)) - 1
+
+
+class CardSet:
+    """Set of cards backed by a 24-bit integer.
+
+    Bit i of the mask is set when the card with index i (see Card.index) is in
+    the set. Suit queries are single AND operations against SUIT_MASKS, which
+    makes a CardSet a cheap hand, kitty or played pile.
+
+    Iterating a CardSet yields the shared Card instances in index order. Use
+    list(card_set) or CardSet(cards) to convert to and from lists.
+
+    Attributes:
+        mask (int): Bitmask of the cards in the set
+    """
+
+    __slots__ = ('mask',)
+
+    def __init__(self, cards=()):
+        """
+        Args:
+            cards (iterable): Cards to put in the set
+        """
+        mask = 0
+        for card in cards:
+            mask |= 1 << card.index
+        self.mask = mask
+
+    @classmethod
+    def fromMask(cls, mask):
+        """Creates a set from a bitmask.
+
+        Args:
+            mask (int): Bitmask of card indexes
+
+        Returns:
+            (CardSet): Set of the cards in the mask
+        """
+        card_set = cls.__new__(cls)
+        card_set.mask = mask
+        return card_set
+
+    def copy(self):
+        """Shallow copy of the set.
+
+        Returns:
+            (CardSet): New set with the same cards
+        """
+        return CardSet.fromMask(self.mask)
+
+    def toList(self):
+        """Cards in the set as a list, ordered by index.
+
+        Returns:
+            (list): Cards in the set
+        """
+        return list(self)
+
+    # Set operations
+    # -------------------------------------------------------------------------
+    def add(self, card):
+        """Adds a card to the set.
+
+        Args:
+            card (Card): Card to add
+        """
+        self.mask |= 1 << card.index
+
+    def remove(self, card):
+        """Removes a card from the set.
+
+        Args:
+            card (Card): Card to remove
+
+        Raises:
+            KeyError: If the card is not in the set
+        """
+        bit = 1 << card.index
+        if not self.mask & bit:
+            raise KeyError(card)
+        self.mask ^= bit
+
+    def discard(self, card):
+        """Removes a card from the set if it is present.
+
+        Args:
+            card (Card): Card to remove
+        """
+        self.mask &= ~(1 << card.index)
+
+    def pop(self):
+        """Removes and returns the card with the highest index.
+
+        Returns:
+            (Card): Card removed from the set
+
+        Raises:
+            KeyError: If the set is empty
+        """
+        if not self.mask:
+            raise KeyError('pop from an empty CardSet')
+        index = self.mask.bit_length() - 1
+        self.mask ^= 1 << index
+        return CARDS[index]
+
+    # Suit queries
+    # -------------------------------------------------------------------------
+    def ofSuit(self, suit, trump=None):
+        """Cards that belong to a suit given trump.
+
+        Args:
+            suit (str): Shorthand suit
+            trump (str): Trump suit, the left bower counts as trump. None
+                uses the printed suits of the cards
+
+        Returns:
+            (CardSet): Cards of the effective suit
+        """
+        return CardSet.fromMask(self.mask & SUIT_MASKS[trump][suit])
+
+    def hasSuit(self, suit, trump=None):
+        """Whether any card in the set follows the suit given trump.
+
+        Args:
+            suit (str): Shorthand suit
+            trump (str): Trump suit
+
+        Returns:
+            (bool): True if the set can follow the suit, otherwise False
+        """
+        return bool(self.mask & SUIT_MASKS[trump][suit])
+
+    def legalPlays(self, led_suit, trump):
+        """Cards that can legally be played to a trick.
+
+        Args:
+            led_suit (str): Effective suit of the card led, None when leading
+            trump (str): Trump suit
+
+        Returns:
+            (CardSet): Cards following the led suit, or every card if none
+                follow or nothing was led
+        """
+        if led_suit is None:
+            return CardSet.fromMask(self.mask)
+        following = self.mask & SUIT_MASKS[trump][led_suit]
+        return CardSet.fromMask(following if following else self.mask)
+
+    # Python protocols
+    # -------------------------------------------------------------------------
+    def __iter__(self):
+        mask = self.mask
+        while mask:
+            low = mask & -mask
+            yield CARDS[low.bit_length() - 1]
+            mask ^= low
+
+    def __len__(self):
+        return bin(self.mask).count('1')
+
+    def __bool__(self):
+        return self.mask != 0
+
+    def __contains__(self, card):
+        return (self.mask >> card.index) & 1 == 1
+
+    def __eq__(self, other):
+        if not isinstance(other, CardSet):
+            return NotImplemented
+        return self.mask == other.mask
+
+    __hash__ = None
+
+    def __or__(self, other):
+        return CardSet.fromMask(self.mask | other.mask)
+
+    def __and__(self, other):
+        return CardSet.fromMask(self.mask & other.mask)
+
+    def __sub__(self, other):
+        return CardSet.fromMask(self.mask & ~other.mask)
+
+    def __str__(self):
+        return '[' + ', '.join(str(card) for card in self) + ']'
+
+    def __repr__(self):
+        return f"CardSet({self})"
@@ -1,6 +1,12 @@
-import random
+import numpy as np
 
 from .card import Card
+from .card import CARDS
+
+# Column layout of the deals returned by Deck.deal_batch
+HAND_COLUMNS = (slice(0, 5), slice(5, 10), slice(10, 15), slice(15, 20))
+UP_CARD_COLUMN = 20
+KITTY_COLUMNS = slice(21, 24)
 
 
 class Deck:
@@ -9,21 +15,24 @@ class Deck:
     Attributes:
         ranks (list): All possible ranks (str) for the game of Euchre
         suits (list): All possible suits (str) for the game of Euchre
-        cards (list): Every unique card that can be made from ranks and suits
+        cards (list): Every unique card that can be made from ranks and suits,
+            these are the shared Card instances from the registry
         size (int): Number of cards in the deck
+        rng (numpy.random.Generator): Random generator used to shuffle
+
+    Args:
+        rng (numpy.random.Generator): Random generator used to shuffle,
+                default is None which means a freshly seeded generator
     """
 
     ranks = ['Ace', 'King', 'Queen', 'Jack', '10', '9']
     suits = ['Clubs', 'Spades', 'Hearts', 'Diamonds']
 
-    def __init__(self):
-        self.cards: List[Card] = []
+    def __init__(self, rng=None):
+        # Deck holds the shared cards, so no cards are created per deck
+        self.cards = list(CARDS)
         self.size = 24
-
-        # Construct deck with each card.
-        for suit in Deck.suits:
-            for rank in Deck.ranks:
-                self.cards.append(Card(rank, suit))
+        self.rng = np.random.default_rng() if rng is None else rng
 
     def deal(self):
         """Deals four hands and a kitty selected in order from the deck
@@ -40,10 +49,65 @@ class Deck:
             hands[i % 5].append(self.cards[i])
         return hands
 
+    @staticmethod
+    def deal_batch(n, rng=None):
+        """Deals n shuffled decks at once.
+
+        Each row is a permutation of the card indexes (see Card.index) laid
+        out as four hands of five cards, the up card and the three other
+        kitty cards: columns 0-4, 5-9, 10-14 and 15-19 are the hands,
+        column 20 is the up card and columns 21-23 are the rest of the kitty.
+        Use HAND_COLUMNS, UP_CARD_COLUMN and KITTY_COLUMNS to slice them, or
+        Deck.splitBatch for views of each part.
+
+        Args:
+            n (int): Number of deals
+            rng (numpy.random.Generator): Random generator, default is a
+                freshly seeded generator
+
+        Returns:
+            deals (numpy.ndarray): (n, 24) uint8 array of card indexes
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        deals = np.tile(np.arange(len(CARDS), dtype=np.uint8), (n, 1))
+        return rng.permuted(deals, axis=1, out=deals)
+
+    @staticmethod
+    def splitBatch(deals):
+        """Splits deals from Deck.deal_batch into views of each part.
+
+        Args:
+            deals (numpy.ndarray): (n, 24) array from Deck.deal_batch
+
+        Returns:
+            hands (numpy.ndarray): (n, 4, 5) view of the hands
+            up_cards (numpy.ndarray): (n,) view of the up cards
+            kitties (numpy.ndarray): (n, 3) view of the rest of the kitties
+        """
+        hands = deals[:, :UP_CARD_COLUMN].reshape(-1, 4, 5)
+        return hands, deals[:, UP_CARD_COLUMN], deals[:, KITTY_COLUMNS]
+
+    @staticmethod
+    def handsFromRow(row):
+        """Converts one deal from Deck.deal_batch to the structure returned
+        by Deck.deal.
+
+        Args:
+            row (numpy.ndarray): One row of Deck.deal_batch
+
+        Returns:
+            hands (list): Four hands of five cards followed by the kitty,
+                the first card of the kitty is the up card
+        """
+        cards = [CARDS[i] for i in row.tolist()]
+        return [cards[0:5], cards[5:10], cards[10:15], cards[15:20],
+                cards[20:24]]
+
     def shuffle(self):
         """Randomizes the order of the cards in the deck.
         """
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def print(self):
         """Prints the cards in the deck using card shorthand, i.e. 'AC'
@@ -56,4 +120,4 @@ class Deck:
         """Prints the cards in the deck using long form, i.e. 'Ace of Clubs'
         """
         for card in self.cards:
-            print(card.toString())
+            print(card.name)
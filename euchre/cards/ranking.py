@@ -0,0 +1,56 @@
+from .card import CARDS
+from .card import SUITS
+
+
+def _buildTrickRanks():
+    """Builds the rank of every card for every trump and led suit.
+
+    Returns:
+        (dict): Maps trump (str) to a dict mapping led suit (str) to a tuple
+            of Card.value for each card index
+    """
+    return {
+        trump: {
+            led: tuple(card.value(led, trump) for card in CARDS)
+            for led in SUITS
+        }
+        for trump in SUITS
+    }
+
+
+# Rank of each card index in a trick, indexed by trump and then led suit.
+# Values match Card.value so higher beats lower and 0 can't take the trick.
+TRICK_RANKS = _buildTrickRanks()
+
+# Effective suit of each card index, indexed by trump (left bower is trump)
+EFFECTIVE_SUITS = {
+    trump: tuple(card.getSuit(trump) for card in CARDS) for trump in SUITS
+}
+
+# Integer form of TRICK_RANKS, RANK_TABLE[trump][led][index], where suits are
+# numbered by their position in SUITS
+RANK_TABLE = tuple(
+    tuple(TRICK_RANKS[trump][led] for led in SUITS) for trump in SUITS
+)
+
+
+def trick_winner(cards, led, trump):
+    """Finds the card that takes a trick.
+
+    Args:
+        cards (list): Cards played to the trick
+        led (str): Effective suit of the card led
+        trump (str): Trump suit
+
+    Returns:
+        (int): Position in cards of the card that takes the trick
+    """
+    ranks = TRICK_RANKS[trump][led]
+    winner = 0
+    best = -1
+    for i, card in enumerate(cards):
+        rank = ranks[card.index]
+        if rank > best:
+            best = rank
+            winner = i
+    return winner
@@ -0,0 +1,82 @@
+import random
+import unittest
+
+from euchre import Card
+from euchre.cards import CARDS
+from euchre.cards import CardSet
+from euchre.cards import canonicalize
+from euchre.cards import canonicalIndex
+from euchre.cards import fromCanonicalIndex
+from euchre.cards.canonical import HAND_COUNT
+from euchre.cards.canonical import INDEX_COUNT
+from euchre.cards.canonical import isCanonicalIndex
+from euchre.cards.canonical import rankHand
+from euchre.cards.canonical import unrankHand
+
+
+class TestCanonical(unittest.TestCase):
+
+    suits = ['C', 'S', 'H', 'D']
+
+    def randomPosition(self, rng):
+        cards = rng.sample(CARDS, 6)
+        return CardSet(cards[:5]), cards[5], rng.choice(self.suits)
+
+    def test_hand_rank(self):
+        """
+        Test hand ranks are a bijection onto range(HAND_COUNT).
+        """
+        self.assertEqual(HAND_COUNT, 42504)
+        for rank in [0, 1, 1000, HAND_COUNT - 1]:
+            mask = unrankHand(rank)
+            self.assertEqual(bin(mask).count('1'), 5)
+            self.assertEqual(rankHand(mask), rank)
+
+    def test_round_trip(self):
+        """
+        Test canonical indexes decode to the canonical form.
+        """
+        rng = random.Random(0)
+        for _ in range(300):
+            hand, top_card, trump = self.randomPosition(rng)
+            index = canonicalIndex(hand, top_card, trump)
+            self.assertTrue(0 <= index < INDEX_COUNT)
+            self.assertTrue(isCanonicalIndex(index))
+            canon_hand, canon_top, canon_trump, suits = \
+                canonicalize(hand, top_card, trump)
+            self.assertEqual(fromCanonicalIndex(index),
+                             (canon_hand, canon_top, canon_trump))
+            self.assertEqual(suits[trump], 'C')
+            self.assertEqual(Card.get(top_card.rank, suits[top_card.suit]),
+                             canon_top)
+
+    def test_isomorphic_positions(self):
+        """
+        Test positions equal up to suit relabelling share an index.
+        """
+        hand = [Card.str2card(s) for s in ['JH', 'JD', 'AH', 'KS', '9C']]
+        top_card = Card.str2card('QH')
+        index = canonicalIndex(hand, top_card, 'H')
+
+        # Swap hearts with clubs and diamonds with spades
+        swap = {'H': 'C', 'D': 'S', 'C': 'H', 'S': 'D'}
+        relabelled = [Card.get(card.rank, swap[card.suit]) for card in hand]
+        relabelled_top = Card.get(top_card.rank, swap[top_card.suit])
+        self.assertEqual(canonicalIndex(relabelled, relabelled_top, 'C'),
+                         index)
+
+        # Swapping the suits of the other color keeps the index
+        swap = {'H': 'H', 'D': 'D', 'C': 'S', 'S': 'C'}
+        relabelled = [Card.get(card.rank, swap[card.suit]) for card in hand]
+        self.assertEqual(canonicalIndex(relabelled, top_card, 'H'), index)
+
+        # Changing trump to the same color changes the index
+        self.assertNotEqual(canonicalIndex(hand, top_card, 'D'), index)
+
+    def test_invalid_position(self):
+        """
+        Test the top card can't be in the hand.
+        """
+        hand = [Card.str2card(s) for s in ['JH', 'JD', 'AH', 'KS', '9C']]
+        with self.assertRaises(ValueError):
+            canonicalIndex(hand, hand[0], 'H')
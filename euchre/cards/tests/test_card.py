@@ -1,6 +1,9 @@
+import pickle
 import unittest
 
 from euchre import Card
+from euchre import Deck
+from euchre.cards import CARDS
 
 
 class TestCard(unittest.TestCase):
@@ -90,3 +93,29 @@ class TestCard(unittest.TestCase):
         left_bower_value = Card("Jack", "Spades").value(led_suit, trump_suit)
         right_bower_value = Card("Jack", "Clubs").value(led_suit, trump_suit)
         self.assertTrue(left_bower_value < right_bower_value)
+
+    def test_registry(self):
+        """
+        Test the registry of shared cards.
+        """
+        self.assertEqual(len(CARDS), 24)
+        self.assertEqual(len({str(card) for card in CARDS}), 24)
+
+        for i, card in enumerate(CARDS):
+            self.assertEqual(card.index, i)
+            self.assertIs(Card.fromIndex(i), card)
+            self.assertIs(Card.str2card(str(card)), card)
+            self.assertIs(Card.get(card.rank, card.suit), card)
+
+        self.assertIs(Card.get('Ace', 'Spades'), Card.str2card('AS'))
+        self.assertIs(Card.str2card('10H'), Card.str2card('1H'))
+        self.assertIs(Deck().cards[5], CARDS[5])
+
+    def test_immutable(self):
+        """
+        Test that cards can't be modified and pickle to the shared card.
+        """
+        card = Card.str2card('JD')
+        with self.assertRaises(AttributeError):
+            card._rank = 'A'
+        self.assertIs(pickle.loads(pickle.dumps(card)), card)
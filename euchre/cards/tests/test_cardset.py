@@ -0,0 +1,65 @@
+import unittest
+
+from euchre import Card
+from euchre.cards import CardSet
+
+
+class TestCardSet(unittest.TestCase):
+
+    hand = [Card.str2card(s) for s in ['JS', 'AC', '9H', 'KD', '1S']]
+
+    def test_conversion(self):
+        """
+        Test converting between lists and card sets.
+        """
+        card_set = CardSet(self.hand)
+        self.assertEqual(len(card_set), 5)
+        self.assertEqual(sorted(self.hand, key=lambda card: card.index),
+                         card_set.toList())
+        self.assertEqual(CardSet(list(card_set)), card_set)
+        self.assertEqual(CardSet.fromMask(card_set.mask), card_set)
+
+    def test_add_remove(self):
+        """
+        Test adding and removing cards.
+        """
+        card_set = CardSet(self.hand)
+        card = Card.str2card('JS')
+        card_set.remove(card)
+        self.assertNotIn(card, card_set)
+        with self.assertRaises(KeyError):
+            card_set.remove(card)
+        card_set.add(card)
+        self.assertIn(card, card_set)
+        popped = card_set.pop()
+        self.assertNotIn(popped, card_set)
+        self.assertEqual(len(card_set), 4)
+
+    def test_of_suit(self):
+        """
+        Test effective suits with the left bower.
+        """
+        card_set = CardSet(self.hand)
+        clubs = [str(card) for card in card_set.ofSuit('C', 'C')]
+        self.assertEqual(clubs, ['AC', 'JS'])
+        spades = [str(card) for card in card_set.ofSuit('S', 'C')]
+        self.assertEqual(spades, ['1S'])
+        self.assertEqual(len(card_set.ofSuit('S')), 2)
+        left_bower = CardSet([Card.str2card('JS')])
+        self.assertFalse(left_bower.hasSuit('S', 'C'))
+        self.assertTrue(left_bower.hasSuit('C', 'C'))
+
+    def test_legal_plays(self):
+        """
+        Test legal plays follow suit when possible.
+        """
+        card_set = CardSet(self.hand)
+        for card in CardSet(Card.str2card(s) for s in ['AS', 'AC', 'AH']):
+            led_suit = card.getSuit('C')
+            legal = card_set.legalPlays(led_suit, 'C')
+            for played in card_set:
+                follows = played.getSuit('C') == led_suit
+                self.assertEqual(played in legal, follows)
+        # Can't follow hearts, anything is legal
+        black = CardSet(Card.str2card(s) for s in ['JS', 'AC', '1S'])
+        self.assertEqual(black.legalPlays('H', 'C'), black)
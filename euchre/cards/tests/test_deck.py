@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from euchre import Deck
+from euchre.cards import CARDS
+
+
+class TestDeck(unittest.TestCase):
+
+    def test_deal(self):
+        """
+        Test dealing a deck.
+        """
+        deck = Deck()
+        deck.shuffle()
+        hands = deck.deal()
+        self.assertEqual([len(hand) for hand in hands], [5, 5, 5, 5, 4])
+        dealt = {str(card) for hand in hands for card in hand}
+        self.assertEqual(len(dealt), 24)
+
+    def test_deal_batch(self):
+        """
+        Test batches of deals are permutations of the deck.
+        """
+        deals = Deck.deal_batch(1000, np.random.default_rng(0))
+        self.assertEqual(deals.shape, (1000, 24))
+        self.assertEqual(deals.dtype, np.uint8)
+        self.assertTrue((np.sort(deals, axis=1) == np.arange(24)).all())
+
+        hands, up_cards, kitties = Deck.splitBatch(deals)
+        self.assertEqual(hands.shape, (1000, 4, 5))
+        self.assertTrue((up_cards == deals[:, 20]).all())
+        self.assertTrue((kitties == deals[:, 21:]).all())
+
+        same = Deck.deal_batch(1000, np.random.default_rng(0))
+        self.assertTrue((deals == same).all())
+
+    def test_hands_from_row(self):
+        """
+        Test converting a batch row to the hands of Deck.deal.
+        """
+        row = Deck.deal_batch(1)[0]
+        hands = Deck.handsFromRow(row)
+        self.assertEqual([len(hand) for hand in hands], [5, 5, 5, 5, 4])
+        self.assertIs(hands[4][0], CARDS[row[20]])
+        self.assertIs(hands[1][0], CARDS[row[5]])
@@ -0,0 +1,50 @@
+import random
+import unittest
+
+from euchre import Card
+from euchre.cards import CARDS
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import RANK_TABLE
+from euchre.cards import TRICK_RANKS
+from euchre.cards import trick_winner
+
+
+class TestRanking(unittest.TestCase):
+
+    suits = ['C', 'S', 'H', 'D']
+
+    def test_tables_match_card(self):
+        """
+        Test the rank tables against Card.value and Card.getSuit.
+        """
+        for t, trump in enumerate(self.suits):
+            for l, led in enumerate(self.suits):
+                for card in CARDS:
+                    value = card.value(led, trump)
+                    self.assertEqual(TRICK_RANKS[trump][led][card.index],
+                                     value)
+                    self.assertEqual(RANK_TABLE[t][l][card.index], value)
+            for card in CARDS:
+                self.assertEqual(EFFECTIVE_SUITS[trump][card.index],
+                                 card.getSuit(trump))
+
+    def test_trick_winner(self):
+        """
+        Test trick winner against the highest Card.value.
+        """
+        rng = random.Random(0)
+        for _ in range(500):
+            trick = rng.sample(CARDS, 4)
+            trump = rng.choice(self.suits)
+            led = trick[0].getSuit(trump)
+            expected = max(range(4),
+                           key=lambda i: trick[i].value(led, trump))
+            self.assertEqual(trick_winner(trick, led, trump), expected)
+
+    def test_left_bower_led(self):
+        """
+        Test that a led left bower is beaten by the right bower only.
+        """
+        trick = [Card.str2card(s) for s in ['JD', 'AD', 'AH', 'JH']]
+        self.assertEqual(trick_winner(trick[:3], 'H', 'H'), 0)
+        self.assertEqual(trick_winner(trick, 'H', 'H'), 3)
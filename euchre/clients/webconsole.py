@@ -309,6 +309,17 @@ class WebConsole:
                 print(
                     "Must call valid suit ['C','S','H','D'] that does not match the suit of the top card")
 
+            def claimMsg():
+                print("The rest of the round is decided")
+                for player, card in message_dict['plays']:
+                    card = Card.str2card(card)
+                    print(f"{player} played {card.prettyString()}")
+                for taker in message_dict['takers']:
+                    print(f"{taker} takes the hand")
+
+            def invalidCardMsg():
+                print("Must play a card in your hand that follows the suit led")
+
             def trickStartMsg():
                 print()
 
@@ -351,6 +362,8 @@ class WebConsole:
                 'card_played': playedMsg,
                 'renege': penaltyMsg,
                 'invalid_suit': invalidSuitMsg,
+                'invalid_card': invalidCardMsg,
+                'claim': claimMsg,
                 'trick_start': trickStartMsg,
                 'new_trump':  newTrumpMsg,
                 'taker': takerMsg,
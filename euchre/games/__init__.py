@@ -1 +1,16 @@
 from .standardgame import StandardGame
+from .engine import DecisionRequest
+from .engine import GameEngine
+from .gamestate import GameState
+from .instrumentation import Instrumentation
+from .logsink import GameLogSink
+from .logsink import GzipJsonlSink
+from .logsink import JsonlSink
+from .logsink import NullSink
+from .seeding import gameRng
+from .seeding import gameSeedSequence
+from .seeding import shardRange
+from .solver import DoubleDummySolver
+from .vectorized import TrumpCountPolicy
+from .vectorized import VectorizedGames
+from .vectorized import VectorPolicy
@@ -0,0 +1,395 @@
+"""Training datasets of the decisions made in self-play games.
+
+Every decision a player makes (see euchre.games.engine.DecisionRequest) is
+encoded as a fixed size int8 feature vector from the point of view of the
+player deciding, with the answer it gave and the points its team won minus
+the points the other team won in the round, for value targets. FEATURES
+maps the name of each block of the vector to its slice.
+
+Games are played by worker processes, like euchre.games.tournament, and the
+main process hands the decisions to a ShardWriter whose thread writes them
+to shard-NNNNN.npz files in a directory, with a manifest.json listing the
+shards. Writing doesn't hold up the workers, and the chunks in flight, the
+queue of the writer and the shard being filled are bounded, so memory
+doesn't grow with the number of games. A dataset is appended to by
+generating into its directory again, new games continue the numbering of
+the manifest.
+
+Each shard holds the arrays:
+    features: int8 (rows, FEATURE_SIZE)
+    actions: int8 (rows,) card index of playCard and discardCard, suit
+        index in SUITS of callTrump, 0 or 1 for the other decisions
+    kinds: int8 (rows,) index of the decision kind in DECISIONS
+    rewards: int8 (rows,) points won by the team deciding in the round
+        minus points won by the other team
+    games: int64 (rows,) index of the game, played with gameRng(seed, game)
+"""
+import concurrent.futures
+import json
+import os
+import queue
+import threading
+
+import click
+import numpy as np
+
+from euchre.cards.card import SUITS
+from euchre.games.engine import DECISIONS
+from euchre.games.engine import GameEngine
+from euchre.games.engine import askPlayer
+from euchre.games.seeding import gameRng
+from euchre.games.tournament import PlayerFactory
+from euchre.players.team import Team
+
+_BLOCKS = (
+    ('hand', 24), # Cards held
+    ('seen', 24), # Cards played earlier in the round
+    ('trick', 24), # Cards played to the current trick
+    ('top_card', 24),
+    ('seat', 4), # Seat of the player, 0 is left of the dealer
+    ('kind', len(DECISIONS)),
+    ('trump', 4), # Suit in SUITS, zeros while bidding
+    ('maker', 4), # Seat of the maker, zeros while bidding
+    ('alone', 1),
+    ('score', 2), # Points of the team deciding, then of the other team
+)
+FEATURES = {}
+for _name, _size in _BLOCKS:
+    _start = sum(block.stop - block.start for block in FEATURES.values())
+    FEATURES[_name] = slice(_start, _start + _size)
+FEATURE_SIZE = sum(size for _, size in _BLOCKS)
+
+_BITS = np.arange(24, dtype=np.int64)
+_KINDS = {kind: i for i, kind in enumerate(DECISIONS)}
+MANIFEST = 'manifest.json'
+
+
+def encodeDecision(engine, request):
+    """Features of a decision from the point of view of the player deciding.
+
+    Args:
+        engine (GameEngine): Game the request was yielded by
+        request (DecisionRequest): Decision to encode
+
+    Returns:
+        (numpy.ndarray): int8 vector of FEATURE_SIZE, see FEATURES
+    """
+    gs = engine.gs
+    player = gs['players'][request.seat]
+    table = gs['table']
+    seat = table.index(player)
+    row = np.zeros(FEATURE_SIZE, dtype=np.int8)
+    row[FEATURES['hand']] = (request.observation['hand'].mask >> _BITS) & 1
+    row[FEATURES['top_card']][gs['top_card'].index] = 1
+    row[FEATURES['seat']][seat] = 1
+    row[FEATURES['kind']][_KINDS[request.kind]] = 1
+
+    if request.kind == 'playCard':
+        plays = gs['round_plays']
+        trick_size = len(request.observation['cards_played'])
+        trick_start = len(plays) - len(plays) % trick_size
+        row[FEATURES['seen']][plays[:trick_start]] = 1
+        row[FEATURES['trick']][plays[trick_start:]] = 1
+    if request.kind in ('goAlone', 'playCard'):
+        row[FEATURES['trump']][SUITS.index(gs['trump'])] = 1
+        row[FEATURES['maker']][table.index(gs['maker'])] = 1
+        row[FEATURES['alone']] = bool(gs['going_alone'])
+
+    team = player.team
+    row[FEATURES['score']] = (team.points, engine.oppo_team[team].points)
+    return row
+
+
+def encodeAction(request, answer):
+    """Answer to a decision as an int, see the actions of a shard."""
+    if request.kind in ('playCard', 'discardCard'):
+        return answer.index
+    if request.kind == 'callTrump':
+        return SUITS.index(answer)
+    return int(bool(answer))
+
+
+def playGame(engine):
+    """Plays a game and encodes the decisions of its players.
+
+    Args:
+        engine (GameEngine): Game to play, with no decision made yet
+
+    Returns:
+        (tuple): Lists of the features, actions, kinds and rewards of the
+            decisions, in the order they were made
+    """
+    teams = engine.gs['teams']
+    features, actions, kinds, rewards = [], [], [], []
+    round_teams = [] # Team of each decision of the current round
+    points = None # Points of the teams when the round started
+
+    def endRound():
+        won = {team: team.points - before
+               for team, before in zip(teams, points)}
+        rewards.extend(won[team] - won[engine.oppo_team[team]]
+                       for team in round_teams)
+        round_teams.clear()
+
+    steps = engine.steps()
+    previous_kind = None
+    try:
+        request = next(steps)
+        while True:
+            # Rounds start with orderUp, and only the first orderUp of a
+            # round follows another kind of decision
+            if request.kind == 'orderUp' and previous_kind != 'orderUp':
+                if points is not None:
+                    endRound()
+                points = [team.points for team in teams]
+            previous_kind = request.kind
+
+            # Encoded before asking, players may change their hand
+            player = engine.gs['players'][request.seat]
+            features.append(encodeDecision(engine, request))
+            answer = askPlayer(player, request)
+            actions.append(encodeAction(request, answer))
+            kinds.append(_KINDS[request.kind])
+            round_teams.append(player.team)
+            request = steps.send(answer)
+    except StopIteration:
+        pass
+    if points is not None:
+        endRound()
+    return features, actions, kinds, rewards
+
+
+def generateChunk(factories, seed, start, stop):
+    """Plays a chunk of seeded games and encodes their decisions.
+
+    The players are created for every game, like
+    euchre.games.tournament.playChunk, so the decisions don't depend on how
+    the games are chunked.
+
+    Args:
+        factories (tuple): Two PlayerFactory, one per team
+        seed (int): Root seed, game i is played with gameRng(seed, i)
+        start, stop (int): Range of game indexes to play
+
+    Returns:
+        (dict): Arrays of the decisions, see the shards of the module
+    """
+    features, actions, kinds, rewards, games = [], [], [], [], []
+    for game_index in range(start, stop):
+        players = [factories[team](f"{factories[team]}{team}{i}")
+                   for team in range(2) for i in range(2)]
+        engine = GameEngine(Team(players[0], players[1]),
+                            Team(players[2], players[3]),
+                            rng=gameRng(seed, game_index))
+        decisions = playGame(engine)
+        for chunk_list, game_list in zip(
+                (features, actions, kinds, rewards), decisions):
+            chunk_list.extend(game_list)
+        games.extend([game_index] * len(decisions[0]))
+
+    return {
+        'features': np.array(features, dtype=np.int8).reshape(
+            -1, FEATURE_SIZE),
+        'actions': np.array(actions, dtype=np.int8),
+        'kinds': np.array(kinds, dtype=np.int8),
+        'rewards': np.array(rewards, dtype=np.int8),
+        'games': np.array(games, dtype=np.int64),
+    }
+
+
+class ShardWriter:
+    """Writes decisions to the shards of a dataset from a thread.
+
+    Decisions are added a chunk at a time and queued, the thread gathers
+    them into shards of shard_size rows. The manifest is rewritten after
+    every shard, so it lists the shards written so far if generation is
+    interrupted.
+
+    Args:
+        directory (path): Dataset directory, created if it doesn't exist and
+            appended to if it has a manifest
+        shard_size (int): Rows per shard, the last shard may have fewer
+        max_queued (int): Chunks queued before add blocks
+
+    Attributes:
+        manifest (dict): Contents of manifest.json
+    """
+
+    def __init__(self, directory, shard_size=1 << 18, max_queued=8):
+        self.directory = directory
+        self.shard_size = shard_size
+        os.makedirs(directory, exist_ok=True)
+        self.manifest = readManifest(directory) or {
+            'feature_size': FEATURE_SIZE,
+            'features': {name: [block.start, block.stop]
+                         for name, block in FEATURES.items()},
+            'decisions': list(DECISIONS),
+            'games': 0,
+            'rows': 0,
+            'shards': [],
+        }
+        if self.manifest['feature_size'] != FEATURE_SIZE:
+            raise ValueError(f"{directory} has features of size "
+                             f"{self.manifest['feature_size']}, not "
+                             f"{FEATURE_SIZE}")
+        self.buffer = [] # Chunks of the shard being filled
+        self.buffered = 0 # Rows in buffer
+        self.queue = queue.Queue(max_queued)
+        self.thread = threading.Thread(target=self.writeLoop, daemon=True)
+        self.thread.start()
+
+    def add(self, chunk, games=0):
+        """Queues the decisions of a chunk of games.
+
+        Args:
+            chunk (dict): Arrays of the decisions, see generateChunk
+            games (int): Number of games in the chunk
+        """
+        self.queue.put((chunk, games))
+
+    def writeLoop(self):
+        """Gathers queued chunks into shards until None is queued."""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            chunk, games = item
+            self.manifest['games'] += games
+            self.buffer.append(chunk)
+            self.buffered += len(chunk['kinds'])
+            while self.buffered >= self.shard_size:
+                self.writeShard(self.shard_size)
+        if self.buffered:
+            self.writeShard(self.buffered)
+        else:
+            self.writeManifest()
+
+    def writeShard(self, rows):
+        """Writes the first rows of the buffer to a new shard."""
+        arrays = {name: np.concatenate([chunk[name] for chunk in self.buffer])
+                  for name in self.buffer[0]}
+        rest = {name: array[rows:] for name, array in arrays.items()}
+        self.buffer = [rest] if len(rest['kinds']) else []
+        self.buffered -= rows
+
+        name = f"shard-{len(self.manifest['shards']):05d}.npz"
+        path = os.path.join(self.directory, name)
+        np.savez(path + '.tmp.npz',
+                 **{key: array[:rows] for key, array in arrays.items()})
+        os.replace(path + '.tmp.npz', path)
+        self.manifest['shards'].append({'file': name, 'rows': rows})
+        self.manifest['rows'] += rows
+        self.writeManifest()
+
+    def writeManifest(self):
+        path = os.path.join(self.directory, MANIFEST)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(self.manifest, f, indent=1)
+        os.replace(path + '.tmp', path)
+
+    def close(self):
+        """Writes the remaining decisions and waits for the thread."""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def readManifest(directory):
+    """Manifest of a dataset, None if the directory has none."""
+    path = os.path.join(directory, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def readShards(directory):
+    """Loads the shards of a dataset one at a time.
+
+    Yields:
+        (dict): Arrays of a shard, see the module
+    """
+    for shard in readManifest(directory)['shards']:
+        with np.load(os.path.join(directory, shard['file'])) as arrays:
+            yield {name: arrays[name] for name in arrays.files}
+
+
+def generateDataset(factories, n_games, directory, seed=0, workers=None,
+                    chunk_size=100, shard_size=1 << 18, callback=None):
+    """Plays self-play games across worker processes and writes the
+    decisions to a dataset.
+
+    Args:
+        factories (tuple): Two PlayerFactory, one per team
+        n_games (int): Number of games to add to the dataset
+        directory (path): Dataset directory, see ShardWriter
+        seed (int): Root seed, games are numbered after those already in
+            the dataset and game i is played with gameRng(seed, i)
+        workers (int): Number of worker processes, default is the CPU count
+        chunk_size (int): Number of games per task
+        shard_size (int): Rows per shard
+        callback (function): Called with the manifest every time a chunk is
+            queued to be written
+
+    Returns:
+        (dict): Manifest of the dataset
+    """
+    with ShardWriter(directory, shard_size) as writer, \
+            concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        first = writer.manifest['games']
+        chunks = iter([(i, min(i + chunk_size, first + n_games))
+                       for i in range(first, first + n_games, chunk_size)])
+        # Keep two chunks per worker in flight so finished chunks don't
+        # pile up while the writer catches up
+        max_pending = 2 * (workers or os.cpu_count() or 1)
+        pending = {}
+        while True:
+            for start, stop in chunks:
+                future = executor.submit(generateChunk, tuple(factories),
+                                         seed, start, stop)
+                pending[future] = stop - start
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                break
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                writer.add(future.result(), pending.pop(future))
+                if callback is not None:
+                    callback(writer.manifest)
+    return writer.manifest
+
+
+@click.command()
+@click.argument("directory")
+@click.option("--team1", "team1", default='euchre.players.TableAIPlayer')
+@click.option("--team2", "team2", default=None)
+@click.option("--games", "-n", "n_games", default=1000)
+@click.option("--seed", "seed", default=0)
+@click.option("--workers", "workers", default=None, type=int)
+@click.option("--chunk-size", "chunk_size", default=100)
+@click.option("--shard-size", "shard_size", default=1 << 18)
+def main(directory, team1, team2, n_games, seed, workers, chunk_size,
+         shard_size):
+    """Adds the decisions of N_GAMES self-play games to the dataset in
+    DIRECTORY.
+
+    TEAM1 and TEAM2 are the import paths of the Player class of each team,
+    TEAM2 defaults to TEAM1.
+    """
+    factories = (PlayerFactory(team1), PlayerFactory(team2 or team1))
+    manifest = generateDataset(factories, n_games, directory, seed,
+                               workers, chunk_size, shard_size)
+    print(f"{manifest['games']} games, {manifest['rows']} decisions in "
+          f"{len(manifest['shards'])} shards")
+
+
+if __name__ == "__main__":
+    main()
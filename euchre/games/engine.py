@@ -0,0 +1,845 @@
+"""Step-based engine for a standard game of euchre.
+
+GameEngine never calls the decision methods of the players. Its steps are
+generators that yield a DecisionRequest whenever a player has to decide and
+are resumed, with send, with the answer. A single loop can then interleave
+any number of games, or collect the decisions of many games and answer them
+in a batch:
+
+    steps = engine.steps()
+    request = next(steps)
+    while True:
+        try:
+            request = steps.send(answer(request))
+        except StopIteration:
+            break
+
+Notifications (the *Msg methods) don't return anything, so the engine still
+sends them to the players directly. StandardGame drives the engine by asking
+the players, see askPlayer.
+"""
+from collections import namedtuple
+import time
+
+import numpy as np
+
+from euchre.cards import CARDS
+from euchre.cards import CardSet
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import trick_winner
+from euchre.cards import Deck
+from euchre.cards.card import SUITS
+from euchre.games.gamestate import GameState
+from euchre.games.gamestate import decidedTricks
+from euchre.games.legality import LegalMoves
+from euchre.games.logsink import JsonlSink
+from euchre.players import Player
+
+# Kinds of decisions, named after the Player methods that make them
+DECISIONS = ('orderUp', 'discardCard', 'orderTrump', 'callTrump', 'goAlone',
+             'playCard')
+
+# Options of the yes or no decisions
+BOOLEAN = (False, True)
+
+# Shorthand names of the cards by index, for the logs
+CARD_NAMES = tuple(str(card) for card in CARDS)
+
+
+class DecisionRequest(namedtuple('_DecisionRequestFields', [
+        'seat', 'kind', 'options', 'observation'])):
+    """Decision the engine waits on.
+
+    Attributes:
+        seat (int): Index of the deciding player in gs['players'], which
+            doesn't change during a game
+        kind (str): One of DECISIONS, the answer is what the Player method
+            of the same name returns
+        options (tuple or CardSet): Legal answers. Any card in the hand is
+            accepted for playCard unless reneges are enforced, and any card
+            at all for discardCard
+        observation (dict): What the player knows when deciding, 'hand' is
+            the player's cards and the other keys depend on kind, see
+            askPlayer. The values are shared with the engine, don't modify
+            them
+    """
+
+    __slots__ = ()
+
+
+def askPlayer(player, request):
+    """Answers a request by calling the player's decision method.
+
+    Args:
+        player (Player): Player at request.seat
+        request (DecisionRequest): Request yielded by a GameEngine
+
+    Returns:
+        Answer to send back to the engine
+    """
+    kind = request.kind
+    observation = request.observation
+    if kind == 'playCard':
+        return player.playCard(observation['leader'],
+                               observation['cards_played'],
+                               observation['trump'])
+    if kind == 'discardCard':
+        return player.discardCard(observation['top_card'])
+    if kind == 'callTrump':
+        return player.callTrump(observation['top_card'].suit)
+    return getattr(player, kind)()
+
+
+def fallbackAnswer(request):
+    """Answers a request like BasicAIPlayer, without asking anyone.
+
+    Passes when bidding, doesn't go alone, calls the first suit it can and
+    plays or discards the first card it can. Used for players that miss the
+    deadline of a decision.
+
+    Args:
+        request (DecisionRequest): Request yielded by a GameEngine
+
+    Returns:
+        Legal answer to send back to the engine
+    """
+    kind = request.kind
+    if kind == 'playCard':
+        return next(iter(request.options))
+    if kind == 'discardCard':
+        return next(iter(request.observation['hand']))
+    if kind == 'callTrump':
+        return request.options[0]
+    return False
+
+
+class GameEngine:
+    """Standard game of euchre, played by answering DecisionRequests.
+
+    Source: https://en.wikipedia.org/wiki/Euchre
+
+    Args:
+        team1, team2 (Team): Teams to seat around table, players on same team
+                are seated opposite of each other
+        log_file (path): Path to of file to log to, default is None which means
+                no logging. The rounds are written after each round and the
+                file is closed when the game ends, or by close
+        log_sink (GameLogSink): Sink to log to instead of log_file, it can be
+                shared by many games and is left open at the end of the game
+        rng (numpy.random.Generator): Random generator for seating and
+                shuffling, default is None which means a freshly seeded
+                generator. Use euchre.games.gameRng for reproducible games
+        reneges (str): How plays that don't follow suit are handled. 'flag'
+                penalizes reneges at the end of the round, 'enforce' asks the
+                player for another card and 'off' lets them through
+        claims (bool): Whether trickSteps resolves the rest of a round
+                without asking the players once the tricks each team takes no
+                longer depend on the cards played, default is False
+        instrumentation (Instrumentation): Records the time spent in each
+                phase of the game, default is None which means no timing,
+                see euchre.games.instrumentation
+    """
+
+    RENEGE_MODES = ('flag', 'enforce', 'off')
+
+    # Tricks left when trickSteps starts checking for claims
+    CLAIM_DEPTH = 3
+
+    def __init__(self, team1, team2, log_file=None, rng=None, reneges='flag',
+                 claims=False, instrumentation=None, log_sink=None):
+        # Game info
+        if reneges not in self.RENEGE_MODES:
+            raise ValueError(f"reneges must be one of {self.RENEGE_MODES}")
+        self.reneges = reneges
+        self.claims = claims
+        self.instrumentation = instrumentation
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.deck = Deck(self.rng)
+        self.legal_moves = None # LegalMoves of the round being played
+        self.oppo_team = {team1: team2, team2: team1}
+
+        # Game state
+        self.gs = {
+            'players': [], # List of players, initially equivelant to self.gs['table']
+            'teams': (team1, team2),
+            'table': [], # Ordered players where index 3 is dealer
+            'play_order': [], # Ordered players where index 0 is leader
+            'trick_play_orders': None,
+            'kitty': CardSet(),
+            'discard': None, # Card the dealer discarded, None if trump was called
+            'hands': None, # Maps players to hands, kept up to date while bidding
+            'round_start': None, # GameState the trick playing phase started from
+            'round_plays': None, # Card indexes played since round_start
+            'maker': None,
+            'trump': None,
+            'top_card': None,
+            'going_alone': None,
+            'cards_played': None,
+            'tricks_taken': None,
+            'leader_list': None,
+            'renegers': None,
+            'takers': None,
+        }
+
+        # Randomly seat players around the table
+        self.seatPlayers()
+
+        # Sink to log to, a sink made for log_file is closed by the game
+        self.log_file = log_file
+        self.owns_log_sink = log_sink is None and log_file is not None
+        self.log_sink = JsonlSink(log_file) if self.owns_log_sink \
+            else log_sink
+
+    def steps(self):
+        """Plays a game of euchre until a team reaches 10 points.
+
+        Yields:
+            (DecisionRequest): Decisions of the players, send the answers
+        """
+        if len(self.gs['players']) != 4:
+            raise AssertionError(f"Euchre requires 4 players to play")
+
+        try:
+            # Game loop
+            while not self.getWinner():
+                yield from self.roundSteps()
+
+            winning_team = self.getWinner()
+            if winning_team:
+                for p in self.subscribers['gameResultsMsg']:
+                    p.gameResultsMsg(winning_team)
+        finally:
+            self.close()
+
+    def close(self):
+        """Closes the sink made for log_file, a log_sink is left open."""
+        if self.owns_log_sink:
+            self.log_sink.close()
+
+    def roundSteps(self, deal=None):
+        """Plays a round and passes the deal to the next dealer.
+
+        Args:
+            deal (list): Cards to deal instead of shuffling, see dealSteps
+
+        Yields:
+            (DecisionRequest): Decisions of the players, send the answers
+
+        Returns:
+            (bool): True if trump was made, False if there was a misdeal
+        """
+        # Inform players of current game state
+        for p in self.subscribers['pointsMsg']: p.pointsMsg(*self.gs['teams'])
+        for p in self.subscribers['dealerMsg']: p.dealerMsg(self.gs['table'][3])
+
+        # Enter dealing phase
+        maker_selected = yield from self.dealSteps(deal)
+
+        if maker_selected:
+            # Enter playing stage
+            steps = self.trickSteps()
+            if self.instrumentation is not None:
+                steps = self.instrumentation.timeSteps('tricks', steps)
+            yield from steps
+        else:
+            # Inform players about misdeal
+            for p in self.subscribers['misdealMsg']: p.misdealMsg()
+
+        # Save game state
+        if self.instrumentation is None:
+            self.logGameState(maker_selected)
+        else:
+            begin = time.perf_counter_ns()
+            self.logGameState(maker_selected)
+            self.instrumentation.recordPhase(
+                'log', time.perf_counter_ns() - begin)
+        # Rounds logged to log_file are kept if the game stops midway
+        if self.owns_log_sink:
+            self.log_sink.flush()
+
+        # Update dealer
+        self.updateTableOrder()
+        return maker_selected
+
+    def dealSteps(self, deal=None):
+        """Deals cards and determines trump.
+
+        Args:
+            deal (list): Cards to deal instead of shuffling, in the format of
+                Deck.deal: the hands of the players from left of the dealer
+                to the dealer, then the top card followed by the kitty.
+                Default is None which means a shuffled deck
+
+        Yields:
+            (DecisionRequest): Bidding decisions of the players
+
+        Returns:
+            (bool): True if trump was made, False if there was a misdeal
+        """
+        # Distribute Cards
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            begin = time.perf_counter_ns()
+        if deal is None:
+            self.deck.shuffle()
+            hands = self.deck.deal()
+        else:
+            hands = deal
+        self.gs['kitty'] = CardSet(hands[4][1:])
+        self.gs['top_card'] = hands[4][0]
+        self.gs['discard'] = None
+        self.gs['hands'] = {}
+        self.gs['round_start'] = None
+        self.gs['round_plays'] = None
+        # Deal from the player left of the dealer
+        self.updatePlayOrder(self.gs['table'][0])
+        for i in range(4):
+            self.gs['hands'][self.gs['play_order'][i]] = CardSet(hands[i])
+            self.gs['play_order'][i].updateHand(hands[i])
+        for p in self.subscribers['topCardMsg']: p.topCardMsg(self.gs['top_card'])
+        if instrumentation is not None:
+            instrumentation.recordPhase('deal', time.perf_counter_ns() - begin)
+
+        # Ask players to order up
+        steps = self.orderSteps()
+        if instrumentation is not None:
+            steps = instrumentation.timeSteps('order', steps)
+        all_passed = yield from steps
+
+        # Everyone passed ordering up
+        if all_passed:
+            # Ask players to order trump
+            steps = self.trumpSteps()
+            if instrumentation is not None:
+                steps = instrumentation.timeSteps('trump', steps)
+            all_passed = yield from steps
+
+        return not all_passed
+
+    def biddingRequest(self, player, kind, options):
+        """Request for a decision made while bidding."""
+        return DecisionRequest(self.seats[player], kind, options, {
+            'hand': self.gs['hands'][player],
+            'top_card': self.gs['top_card'],
+            'dealer': self.gs['table'][3],
+        })
+
+    def orderSteps(self):
+        """Asks all players if they want to order up the top card.
+
+        Yields:
+            (DecisionRequest): orderUp of each player, then discardCard of
+                the dealer if one orders up
+
+        Returns:
+            (bool): True if everyone passes ordering up, otherwise False.
+        """
+        for player in self.gs['table']:
+            # Ask players if they want to order up top card
+            order_up = yield self.biddingRequest(player, 'orderUp', BOOLEAN)
+
+            # Someone ordered up
+            if order_up:
+                # Update game state and inform players
+                self.gs['maker'] = player
+                self.gs['trump'] = self.gs['top_card'].suit
+                for p in self.subscribers['orderUpMsg']:
+                    if p is not self.gs['maker']:
+                        p.orderUpMsg(self.gs['maker'], self.gs['top_card'])
+                for p in self.subscribers['newTrumpMsg']:
+                    p.newTrumpMsg(self.gs['trump'])
+
+                # Have dealer discard a card
+                dealer = self.gs['table'][3]
+                hand = self.gs['hands'][dealer]
+                discard_card = yield self.biddingRequest(
+                    dealer, 'discardCard',
+                    hand | CardSet([self.gs['top_card']]))
+                self.gs['kitty'].add(discard_card)
+                self.gs['discard'] = discard_card
+                hand.add(self.gs['top_card'])
+                hand.discard(discard_card)
+                return False
+
+            # Inform players that player denied up
+            for p in self.subscribers['deniedUpMsg']: p.deniedUpMsg(player)
+        return True
+
+    def trumpSteps(self):
+        """Asks all players if they want to order trump.
+
+        Yields:
+            (DecisionRequest): orderTrump of each player, then callTrump of
+                the player that orders trump until the suit is valid
+
+        Returns:
+            (bool): True if everyone passes ordering trump, otherwise False.
+        """
+        # Ask players if they want to call trump
+        for player in self.gs['table']:
+            order_trump = yield self.biddingRequest(player, 'orderTrump',
+                                                    BOOLEAN)
+
+            # Player calls trump
+            if order_trump:
+                request = self.biddingRequest(
+                    player, 'callTrump',
+                    tuple(suit for suit in SUITS
+                          if suit != self.gs['top_card'].suit))
+                call = yield request
+
+                # Require valid trump that isn't top card suit
+                while not self.validTrump(call):
+                    player.invalidSuitMsg()
+                    call = yield request
+
+                # Update game state and inform players
+                self.gs['maker'] = player
+                self.gs['trump'] = call
+                for p in self.subscribers['orderedTrumpMsg']:
+                    if p is not self.gs['maker']:
+                        p.orderedTrumpMsg(self.gs['maker'], self.gs['trump'])
+                for p in self.subscribers['newTrumpMsg']:
+                    p.newTrumpMsg(self.gs['trump'])
+                return False
+
+            # Player denies trump
+            else:
+                for p in self.subscribers['deniedTrumpMsg']: p.deniedTrumpMsg(player)
+        return True
+
+    def trickSteps(self, state=None):
+        """Plays 5 tricks.
+
+        Args:
+            state (GameState): Position to play the round out from, see
+                importState. Default is None which means the start of the
+                round, after asking the maker to go alone
+
+        Yields:
+            (DecisionRequest): goAlone of the maker when starting the round,
+                then playCard of each player in turn
+        """
+        table = self.gs['table']
+        if state is None:
+            maker = self.gs['maker']
+            going_alone = yield DecisionRequest(
+                self.seats[maker], 'goAlone', BOOLEAN,
+                {'hand': self.gs['hands'][maker], 'trump': self.gs['trump']})
+            state = GameState.initial(
+                [self.gs['hands'][player] for player in table],
+                self.gs['trump'], table.index(maker), going_alone)
+        going_alone = state.alone
+        self.gs['round_start'] = state
+        self.gs['round_plays'] = []
+        self.legal_moves = LegalMoves(
+            {player: state.hands[seat] for seat, player in enumerate(table)},
+            state.trump)
+        reneges = [] # (player, card) of each renege
+
+        # Initialize trick information
+        # Skip teammate of player going alone
+        cards_played = {} # Maps player to cards played
+        tricks_taken = {} # Maps players to tricks taken
+        takers = [] # Who took what trick, ordered by trick number
+        trick_play_orders = []  # Order that tricks are played
+        for player in self.gs['play_order']:
+            if not (going_alone and self.gs['maker'].getTeammate() is player):
+                cards_played[player] = []
+                tricks_taken[player] = 0
+
+        # Resuming from a state, credit tricks already taken to a player of
+        # each team and restore the cards played to the current trick
+        for team, team_tricks in enumerate(state.tricks):
+            seat = next(s for s in state.play_order if s % 2 == team)
+            tricks_taken[table[seat]] += team_tricks
+        for seat, index in zip(state.play_order, state.trick):
+            cards_played[table[seat]].append(CARDS[index])
+
+        # Init list of leaders for each trick
+        taker = table[state.leader]
+        leader_list = []
+        for p in self.subscribers['leaderMsg']: p.leaderMsg(taker)
+
+        # Play tricks
+        led_suit = state.led_suit
+        claim_state = None # Set once the rest of the round is claimed
+        claimed = [] # (player, card) played by the claim
+        claim_takers = [] # Takers of the claimed tricks
+        tricks_left = 5 - sum(state.tricks)
+        for j in range(tricks_left):
+
+            # Taker of previous round leads
+            leader_list.append(taker)
+            self.updatePlayOrder(taker)
+            if j > 0:
+                led_suit = None
+
+            # Claim the rest of the round once its outcome is decided
+            if self.claims and claim_state is None \
+                    and tricks_left - j <= self.CLAIM_DEPTH:
+                current = self.exportState()
+                if decidedTricks(current) is not None:
+                    claim_state = current
+
+            # Inform players of trick start
+            if claim_state is None:
+                for p in self.subscribers['trickStartMsg']: p.trickStartMsg()
+
+            # Play a trick
+            for player in self.gs['play_order']:
+                if going_alone and self.gs['maker'].getTeammate() is player:
+                    # Skip teammate of player going alone
+                    continue
+                if len(cards_played[player]) > j:
+                    # Played before the state was imported
+                    continue
+                if claim_state is None:
+                    request = self.cardRequest(player, taker, cards_played,
+                                               led_suit)
+                    card = yield request
+                    while not self.acceptsCard(player, card, led_suit):
+                        player.invalidCardMsg()
+                        player.updateHand(
+                            self.legal_moves.hand(player).toList())
+                        card = yield request
+                else:
+                    card = CARDS[claim_state.legal_moves()[0]]
+                    claim_state = claim_state.apply(card)
+                    claimed.append((player, card))
+                if not self.legal_moves.play(player, card, led_suit) \
+                        and self.reneges == 'flag':
+                    reneges.append((player, card))
+                if led_suit is None:
+                    led_suit = EFFECTIVE_SUITS[self.gs['trump']][card.index]
+                cards_played[player].append(card)
+                self.gs['round_plays'].append(card.index)
+                if claim_state is not None:
+                    continue
+                for p in self.subscribers['playedMsg']:
+                    if p is not player:
+                        p.playedMsg(player, card)
+
+
+            # Decide Taker
+            trick_players = list(cards_played)
+            trick = [cards_played[player][j] for player in trick_players]
+            led_suit = EFFECTIVE_SUITS[self.gs['trump']][
+                cards_played[taker][j].index]
+            taker = trick_players[
+                trick_winner(trick, led_suit, self.gs['trump'])]
+            if claim_state is None:
+                for p in self.subscribers['takerMsg']: p.takerMsg(taker)
+            else:
+                claim_takers.append(taker)
+            tricks_taken[taker] += 1
+            takers.append(taker)
+            trick_play_orders.append(self.gs['play_order'][:])
+
+        # Sum up the claimed tricks in a single notification
+        if claimed:
+            for p in self.subscribers['claimMsg']:
+                p.claimMsg(claimed, claim_takers)
+
+        # Penalize any players that reneged, otherwise score round normally
+        renegers = []
+        for player, card in reneges:
+            # Inform players that they reneged
+            for p in self.subscribers['penaltyMsg']:
+                p.penaltyMsg(player, card)
+            renegers.append(player) if player not in renegers else None
+        if renegers:
+            self.penalize(renegers, going_alone)
+        else:
+            self.scoreRound(tricks_taken, going_alone)
+
+        # Log game state
+        self.gs['going_alone'] = going_alone
+        self.gs['cards_played'] = cards_played
+        self.gs['tricks_taken'] = tricks_taken
+        self.gs['leader_list'] = leader_list
+        self.gs['renegers'] = renegers
+        self.gs['takers'] = takers
+        self.gs['trick_play_orders'] = trick_play_orders
+
+    def cardRequest(self, player, leader, cards_played, led_suit):
+        """Request for the card a player plays to the current trick.
+
+        Args:
+            player (Player): Player to play
+            leader (Player): Player that leads the trick
+            cards_played (dict): Maps players to the cards they played
+            led_suit (str): Effective suit led, None when leading
+
+        Returns:
+            (DecisionRequest): playCard of the player, the observation has
+                the leader, cards_played, trump and led_suit
+        """
+        hand = self.legal_moves.index[player]
+        # Built with tuple.__new__, a card is requested 200 times a game
+        return tuple.__new__(DecisionRequest, (
+            self.seats[player], 'playCard',
+            CardSet.fromMask(hand.legal(led_suit)), {
+                'hand': CardSet.fromMask(hand.mask),
+                'leader': leader,
+                'cards_played': cards_played,
+                'trump': self.gs['trump'],
+                'led_suit': led_suit,
+            }))
+
+    def acceptsCard(self, player, card, led_suit):
+        """Whether a card a player played is accepted.
+
+        The player must hold the card, and it must follow the led suit when
+        reneges are enforced. A refused player is sent invalidCardMsg, has
+        its hand restored and is asked again.
+        """
+        hand = self.legal_moves.index[player]
+        return hand.holds(card) \
+            and (self.reneges != 'enforce' or hand.isLegal(card, led_suit))
+
+    def exportState(self):
+        """Snapshot of the round being played.
+
+        The state is rebuilt from the plays of the round, so exporting is
+        only paid for by callers that need it.
+
+        Returns:
+            (GameState): Current position of the trick playing phase, seats
+                are indexes into self.gs['table']. None before trump is made
+        """
+        state = self.gs['round_start']
+        if state is not None:
+            for index in self.gs['round_plays']:
+                state = state.apply(index)
+        return state
+
+    def importState(self, state):
+        """Sets up the game at a position of the trick playing phase.
+
+        Hands players the cards of their seat and sets trump and the maker.
+        Call trickSteps(state) to play the round out from the position.
+
+        Args:
+            state (GameState): Position to set up, seats are indexes into
+                self.gs['table']
+        """
+        table = self.gs['table']
+        self.gs['trump'] = state.trump
+        self.gs['maker'] = table[state.maker]
+        self.gs['going_alone'] = state.alone
+        self.gs['round_start'] = state
+        self.gs['round_plays'] = []
+        for seat, player in enumerate(table):
+            player.updateHand(state.hand(seat).toList())
+
+    def validTrump(self, suit):
+        """Checks if a trump call is valid.
+
+        A trump call is valid if it is a valid suit and isn't the same suit
+        as the top card.
+
+        Args:
+            suit (str): The suit that a player has called.
+
+        Returns:
+            (bool): True if the trump is valid, otherwise False.
+        """
+        if not suit in ['C', 'S', 'H', 'D']:
+            return False
+        return suit != self.gs['top_card'].suit
+
+    def scoreRound(self, tricks_taken, going_alone):
+        """Messages players winner and points won.
+
+        Args:
+            tricks_taken (dict): Tricks taken by team
+            going_alone (bool): Whether the maker went alone
+        """
+        # Count tricks taken per team
+        team_tricks = {team: 0 for team in self.gs['teams']}
+        for player, taken in tricks_taken.items():
+            team_tricks[player.team] += taken
+        teaking_team = max(team_tricks, key=team_tricks.get)
+
+        # Figure out points
+        points = 1
+        if self.gs['maker'] in teaking_team.players:
+            if going_alone and team_tricks[teaking_team] == 5:
+                points = 4
+            elif team_tricks[teaking_team] == 5:
+                points = 2
+        else:
+            points = 2
+
+        # Finalize results
+        teaking_team.points += points
+        for p in self.subscribers['roundResultsMsg']:
+            p.roundResultsMsg(teaking_team, points, team_tricks[teaking_team])
+
+    def penalize(self, renegers, going_alone):
+        """Penalizes the renegers.
+
+        Penalizes the team only once even if player(s) renege multiple times.
+        Penalizes twice as much when a player is going alone.
+        Doesn't penalize anyone if both teams renege.
+
+        Args:
+            renegers (list): Players to be penalized
+        """
+        # Use sets to figure out teams to give points to,
+        #   if both teams renege no one gets points
+        reneging_teams = {player.team for player in renegers}
+        teams = {team for team in self.gs['teams']}
+        for team in teams - reneging_teams:
+            if going_alone:
+                team.points += 4
+            else:
+                team.points += 2
+
+    def seatPlayers(self, order=None):
+        """Seats the players randomly around table (preserving teams).
+
+        Args:
+            order (list): Players to seat in table order instead, the dealer
+                last, teammates must be across from each other
+
+        Modifies:
+            self.gs['players']
+            self.gs['table']
+            self.gs['play_order']
+            self.seats
+            self.subscribers
+        """
+        self.gs['players'] = []
+        if order is not None:
+            self.gs['players'] = list(order)
+        else:
+            t1 = self.gs['teams'][0].players
+            t2 = self.gs['teams'][1].players
+
+            # Shuffle within each team
+            self.rng.shuffle(t1)
+            self.rng.shuffle(t2)
+
+            # Shuffle order of teams
+            teams = [t1, t2]
+            self.rng.shuffle(teams)
+
+            # Teammates must be across from each other
+            self.gs['players'].append(teams[0][0])
+            self.gs['players'].append(teams[1][0])
+            self.gs['players'].append(teams[0][1])
+            self.gs['players'].append(teams[1][1])
+
+        # Table order is initially just the players in order
+        #   where the 0th index is for the dealer
+        self.gs['table'] = self.gs['players'].copy()
+
+        # The player left of the dealer (at 3rd index) should start the trick
+        #   (be at the 0th index)
+        self.gs['play_order'] = []
+        self.gs['play_order'] = self.gs['players'].copy()
+        new_leader = self.gs['play_order'].pop(0)
+        self.gs['play_order'].append(new_leader)
+
+        # Seats of the players in DecisionRequests
+        self.seats = {player: seat
+                      for seat, player in enumerate(self.gs['players'])}
+
+        # Only notify players of the events they consume
+        self.subscribers = {
+            name: [p for p in self.gs['players'] if p.subscribes(name)]
+            for name in Player.NOTIFICATIONS
+        }
+
+    def updatePlayOrder(self, taker):
+        """Updates the play order so the taker of the previous trick goes first.
+
+        Modifies:
+            self.gs['play_order']
+
+        Args:
+            taker (Player): Player that won the previous trick
+        """
+        while self.gs['play_order'][0] is not taker:
+            new_leader = self.gs['play_order'].pop(0)
+            self.gs['play_order'].append(new_leader)
+
+    def updateTableOrder(self):
+        """Selects the new dealer.
+
+        Rotates the player order so the player to the left of the dealer
+        is the new dealer.
+
+        Modifies:
+            self.gs['table']
+        """
+        new_dealer = self.gs['table'].pop(0)
+        self.gs['table'].append(new_dealer)
+
+    def getWinner(self):
+        """Fetches the winning team.
+
+        The team to reach 10 points first wins. A round can take a team from
+        below 10 to past it.
+
+        Returns:
+            (Team): Team that won, otherwise None
+        """
+        for team in self.gs['teams']:
+            if team.points >= 10:
+                return team
+        return None
+
+    def logGameState(self, maker_selected=False):
+        """Logs the final gamestate of a round.
+
+        Writes a record to self.log_sink, or does nothing if there is no
+        sink or it doesn't keep records.
+
+        The record has the players' names, the table order (dealer last),
+        the dealer, the hands the tricks were played with, the card the
+        dealer discarded (None if trump was called), the kitty, the trump
+        and maker, the cards each player played, the takers of the tricks
+        and the players that reneged. A misdeal is logged as 'misdeal'.
+        """
+        sink = self.log_sink
+        if sink is None or not sink.active:
+            return
+
+        # Simply log 'misdeal' if a misdeal
+        if not maker_selected:
+            sink.write('misdeal')
+            return
+
+        names = {player: str(player) for player in self.gs['players']}
+        start = self.gs['round_start']
+        team1 = [names[player] for player in self.gs['teams'][0].players]
+        team2 = [names[player] for player in self.gs['teams'][1].players]
+        discard = self.gs['discard']
+
+        loggable_gs = {
+            'players': [names[player] for player in self.gs['players']],
+            'teams': (team1, team2),
+            'table': [names[player] for player in self.gs['table']],
+            'dealer': names[self.gs['table'][3]],
+            'play_order': [names[player] for player in self.gs['play_order']],
+            'hands': {names[player]: [CARD_NAMES[card.index]
+                                      for card in start.hand(seat)]
+                      for seat, player in enumerate(self.gs['table'])},
+            'discard': None if discard is None else CARD_NAMES[discard.index],
+            'kitty': [CARD_NAMES[card.index] for card in self.gs['kitty']],
+            'maker': names[self.gs['maker']],
+            'trump': self.gs['trump'],
+            'top_card': CARD_NAMES[self.gs['top_card'].index],
+            'going_alone': self.gs['going_alone'],
+            'cards_played': {
+                names[player]: [CARD_NAMES[card.index] for card in cards]
+                for player, cards in self.gs['cards_played'].items()},
+            'renegers': [names[player] for player in self.gs['renegers']],
+            'takers': [names[player] for player in self.gs['takers']],
+            'trick_play_orders': [[names[player] for player in players]
+                                  for players in self.gs['trick_play_orders']],
+        }
+        sink.write(loggable_gs)
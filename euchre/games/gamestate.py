@@ -0,0 +1,206 @@
+"""Immutable snapshot of a round being played, for search-based players.
+
+A GameState is a tuple of ints and strings, so copying one is free and
+apply returns a new state that shares everything it didn't change. Seats
+are positions at the table for the round: 0 is left of the dealer and 3 is
+the dealer, seats 0 and 2 are one team and seats 1 and 3 the other. Hands
+are bitmasks of card indexes (see Card.index) and moves are card indexes.
+"""
+from collections import namedtuple
+
+from euchre.cards import CARDS
+from euchre.cards import CardSet
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import TRICK_RANKS
+from euchre.cards.cardset import SUIT_MASKS
+
+
+def _playOrder(leader, sitting_out):
+    """Seats playing a trick in order, skipping the sitting out seat."""
+    return tuple(seat for seat in ((leader + k) % 4 for k in range(4))
+                 if seat != sitting_out)
+
+
+# _PLAY_ORDERS[sitting_out + 1][leader], sitting_out is -1 if nobody is
+_PLAY_ORDERS = tuple(tuple(_playOrder(leader, sitting_out)
+                           for leader in range(4))
+                     for sitting_out in range(-1, 4))
+
+
+def _indexes(mask):
+    """Card indexes in a bitmask, lowest first."""
+    indexes = []
+    while mask:
+        low = mask & -mask
+        indexes.append(low.bit_length() - 1)
+        mask ^= low
+    return tuple(indexes)
+
+
+_GameStateFields = namedtuple('_GameStateFields', [
+    'hands', 'trump', 'maker', 'alone', 'leader', 'trick', 'tricks'])
+
+
+class GameState(_GameStateFields):
+    """Position in the trick playing phase of a round.
+
+    Attributes:
+        hands (tuple): Bitmask of the cards held by each seat
+        trump (str): Trump suit
+        maker (int): Seat of the player that made trump
+        alone (bool): Whether the maker is going alone
+        leader (int): Seat leading the current trick
+        trick (tuple): Card indexes played to the current trick, in order
+        tricks (tuple): Tricks taken by seats 0 and 2 and by seats 1 and 3
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def initial(cls, hands, trump, maker, alone=False):
+        """State at the start of the first trick.
+
+        Args:
+            hands (list): Hands of each seat, as bitmasks, lists of cards or
+                CardSets
+            trump (str): Trump suit
+            maker (int): Seat of the player that made trump
+            alone (bool): Whether the maker is going alone
+
+        Returns:
+            (GameState): The player left of the dealer leads, or the next
+                player if they sit out
+        """
+        masks = tuple(hand.mask if isinstance(hand, CardSet)
+                      else hand if isinstance(hand, int)
+                      else CardSet(hand).mask for hand in hands)
+        sitting_out = (maker + 2) % 4 if alone else -1
+        leader = 1 if sitting_out == 0 else 0
+        return cls(masks, trump, maker, bool(alone), leader, (), (0, 0))
+
+    @property
+    def sitting_out(self):
+        """Seat of the partner of a maker going alone, -1 if nobody is."""
+        return (self.maker + 2) % 4 if self.alone else -1
+
+    @property
+    def play_order(self):
+        """Seats playing the current trick, in order."""
+        return _PLAY_ORDERS[self.sitting_out + 1][self.leader]
+
+    @property
+    def to_move(self):
+        """Seat of the player to play next."""
+        return self.play_order[len(self.trick)]
+
+    @property
+    def led_suit(self):
+        """Effective suit led to the current trick, None when leading."""
+        if not self.trick:
+            return None
+        return EFFECTIVE_SUITS[self.trump][self.trick[0]]
+
+    def isTerminal(self):
+        """Whether all 5 tricks have been played."""
+        return self.tricks[0] + self.tricks[1] == 5
+
+    def hand(self, seat):
+        """Cards held by a seat.
+
+        Returns:
+            (CardSet): Copy of the seat's hand
+        """
+        return CardSet.fromMask(self.hands[seat])
+
+    def legal_moves(self):
+        """Cards the player to move can play without reneging.
+
+        Returns:
+            (tuple): Card indexes, lowest first
+        """
+        hand = self.hands[self.to_move]
+        if self.trick:
+            led = EFFECTIVE_SUITS[self.trump][self.trick[0]]
+            following = hand & SUIT_MASKS[self.trump][led]
+            if following:
+                return _indexes(following)
+        return _indexes(hand)
+
+    def apply(self, move):
+        """Plays a card for the player to move.
+
+        Any card in the hand can be played, reneges included.
+
+        Args:
+            move (int or Card): Card index, or Card, to play
+
+        Returns:
+            (GameState): State after the card is played, the trick is
+                resolved once every player has played to it
+        """
+        if move.__class__ is not int:
+            move = move.index
+        hands, trump, maker, alone, leader, trick, tricks = self
+        order = _PLAY_ORDERS[(maker + 2) % 4 + 1 if alone else 0][leader]
+        trick += (move,)
+        seat = order[len(trick) - 1]
+        if not (hands[seat] >> move) & 1:
+            raise ValueError(f"Seat {seat} doesn't hold {CARDS[move]}")
+        hands = list(hands)
+        hands[seat] ^= 1 << move
+        hands = tuple(hands)
+
+        if len(trick) < len(order):
+            return tuple.__new__(GameState, (
+                hands, trump, maker, alone, leader, trick, tricks))
+
+        # Resolve the trick, the taker leads the next one
+        ranks = TRICK_RANKS[trump][EFFECTIVE_SUITS[trump][trick[0]]]
+        taken = 0
+        for i in range(1, len(trick)):
+            if ranks[trick[i]] > ranks[trick[taken]]:
+                taken = i
+        taker = order[taken]
+        tricks = (tricks[0] + 1, tricks[1]) if taker % 2 == 0 \
+            else (tricks[0], tricks[1] + 1)
+        return tuple.__new__(GameState, (
+            hands, trump, maker, alone, taker, (), tricks))
+
+    def __repr__(self):
+        hands = ' '.join(str(self.hand(seat)) for seat in range(4))
+        trick = ' '.join(str(CARDS[i]) for i in self.trick)
+        return (f"GameState(hands={hands}, trump={self.trump}, "
+                f"maker={self.maker}, alone={self.alone}, "
+                f"leader={self.leader}, trick=[{trick}], "
+                f"tricks={self.tricks})")
+
+
+def decidedTricks(state):
+    """Tricks each team ends the round with, if the round is decided.
+
+    A round is decided when every legal way of playing it out ends with the
+    same tricks for each team, for instance when every play left is forced
+    or when a team holds every remaining winner. Every continuation is
+    searched, so only call it with a few tricks left.
+
+    Args:
+        state (GameState): Position to play out
+
+    Returns:
+        (tuple): Final tricks of each team, None if they depend on the
+            cards played
+    """
+    outcome = None
+    seen = set()
+    stack = [state]
+    while stack:
+        state = stack.pop()
+        if state.isTerminal():
+            if outcome is None:
+                outcome = state.tricks
+            elif state.tricks != outcome:
+                return None
+        elif state not in seen:
+            seen.add(state)
+            stack.extend(state.apply(move) for move in state.legal_moves())
+    return outcome
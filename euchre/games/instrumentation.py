@@ -0,0 +1,179 @@
+"""Opt-in timing of games, by phase and by player decision.
+
+Pass an Instrumentation to a game (or to a tournament, see
+euchre.games.tournament) to record how long each phase of every round and
+each decision of every player takes. Durations are monotonic nanoseconds
+counted into histograms with power of two buckets, so recording is an
+int.bit_length and a list increment, and instrumentations from many games
+or processes merge by adding counts.
+
+The phases of a round are 'deal' (shuffling and dealing), 'order' (ordering
+up the top card and the dealer's discard), 'trump' (calling trump after
+everyone passed), 'tricks' (going alone and playing the tricks) and 'log'
+(logGameState). Phases are timed from start to end, so they include the
+time spent waiting on the decisions made during them.
+"""
+import time
+
+BUCKETS = 64
+
+
+class LatencyHistogram:
+    """Durations counted into power of two buckets.
+
+    Bucket b counts the durations d with d.bit_length() == b, that is
+    2 ** (b - 1) <= d < 2 ** b nanoseconds.
+
+    Attributes:
+        counts (list): Number of durations in each bucket
+        count (int): Number of durations recorded
+        total (int): Sum of the durations, in nanoseconds
+        max (int): Longest duration, in nanoseconds
+    """
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, ns):
+        """Counts a duration.
+
+        Args:
+            ns (int): Duration in nanoseconds
+        """
+        self.counts[ns.bit_length()] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def merge(self, other):
+        """Adds the durations of other to this histogram."""
+        for bucket, count in enumerate(other.counts):
+            self.counts[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def mean(self):
+        """Mean duration in nanoseconds, 0 if nothing was recorded."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q):
+        """Upper bound of the q-th percentile of the durations.
+
+        Args:
+            q (float): Percentile, between 0 and 100
+
+        Returns:
+            (int): Upper bound of the bucket holding the percentile, in
+                nanoseconds, capped to the longest duration
+        """
+        rank = q / 100 * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(1 << bucket, self.max)
+        return self.max
+
+
+def _formatNs(ns):
+    """Duration with a unit that keeps it short."""
+    if ns >= 1e9:
+        return f"{ns / 1e9:.2f}s"
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f}ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.1f}us"
+    return f"{ns:.0f}ns"
+
+
+class Instrumentation:
+    """Timing histograms of the phases and decisions of games.
+
+    Attributes:
+        phases (dict): Maps phase names, like 'tricks', to their
+            LatencyHistogram
+        decisions (dict): Maps (player class name, decision kind) to the
+            LatencyHistogram of the decisions, kinds are named after the
+            Player methods (see euchre.games.engine.DECISIONS)
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.decisions = {}
+
+    def recordPhase(self, phase, ns):
+        """Counts the duration of a phase.
+
+        Args:
+            phase (str): Name of the phase
+            ns (int): Duration in nanoseconds
+        """
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = LatencyHistogram()
+        histogram.record(ns)
+
+    def recordDecision(self, player, kind, ns):
+        """Counts the duration of a decision.
+
+        Args:
+            player (Player): Player that decided
+            kind (str): Kind of decision
+            ns (int): Duration in nanoseconds
+        """
+        key = (type(player).__name__, kind)
+        histogram = self.decisions.get(key)
+        if histogram is None:
+            histogram = self.decisions[key] = LatencyHistogram()
+        histogram.record(ns)
+
+    def timeSteps(self, phase, steps):
+        """Wraps engine steps to record how long they take to finish.
+
+        Args:
+            phase (str): Name of the phase
+            steps (generator): Steps of a GameEngine
+
+        Returns:
+            (generator): Steps yielding the same requests and returning the
+                same value
+        """
+        begin = time.perf_counter_ns()
+        result = yield from steps
+        self.recordPhase(phase, time.perf_counter_ns() - begin)
+        return result
+
+    def merge(self, other):
+        """Adds the histograms of other to this instrumentation."""
+        for mine, theirs in ((self.phases, other.phases),
+                             (self.decisions, other.decisions)):
+            for key, histogram in theirs.items():
+                if key not in mine:
+                    mine[key] = LatencyHistogram()
+                mine[key].merge(histogram)
+
+    def prettyString(self):
+        """Table of the histograms, longest total time first."""
+        rows = [(name, histogram)
+                for name, histogram in self.phases.items()]
+        rows += [(f"{player}.{kind}", histogram)
+                 for (player, kind), histogram in self.decisions.items()]
+        width = max([len(name) for name, _ in rows] + [len('timer')])
+        lines = [f"{'timer':<{width}} {'count':>9} {'total':>9} "
+                 f"{'mean':>9} {'p50':>9} {'p99':>9} {'max':>9}"]
+        for name, histogram in sorted(rows, key=lambda row: -row[1].total):
+            lines.append(
+                f"{name:<{width}} {histogram.count:>9} "
+                f"{_formatNs(histogram.total):>9} "
+                f"{_formatNs(histogram.mean()):>9} "
+                f"{_formatNs(histogram.percentile(50)):>9} "
+                f"{_formatNs(histogram.percentile(99)):>9} "
+                f"{_formatNs(histogram.max):>9}")
+        return '\n'.join(lines)
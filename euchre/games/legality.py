@@ -0,0 +1,131 @@
+"""Legal-move service for the trick playing phase.
+
+Every hand is indexed by effective suit once trump is made, and the index
+is updated card by card as the hand is played, so finding the cards that
+follow the led suit or checking a play for a renege is a single lookup.
+"""
+from euchre.cards import CardSet
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards.card import SUITS
+from euchre.cards.cardset import SUIT_MASKS
+
+
+class HandIndex:
+    """Cards of a hand grouped by effective suit.
+
+    Args:
+        cards (CardSet, list or int): Cards in the hand, or their bitmask
+        trump (str): Trump suit, the left bower is indexed as trump
+
+    Attributes:
+        trump (str): Trump suit
+        mask (int): Bitmask of every card in the hand
+        suits (dict): Maps each effective suit to the bitmask of the cards
+            of that suit in the hand
+    """
+
+    __slots__ = ('trump', 'mask', 'suits')
+
+    def __init__(self, cards, trump):
+        if isinstance(cards, CardSet):
+            mask = cards.mask
+        elif isinstance(cards, int):
+            mask = cards
+        else:
+            mask = CardSet(cards).mask
+        self.trump = trump
+        self.mask = mask
+        self.suits = {suit: mask & SUIT_MASKS[trump][suit] for suit in SUITS}
+
+    def holds(self, card):
+        """Whether the hand holds a card."""
+        return bool((self.mask >> card.index) & 1)
+
+    def remove(self, card):
+        """Removes a card from the hand.
+
+        Raises:
+            KeyError: The hand doesn't hold the card
+        """
+        if not (self.mask >> card.index) & 1:
+            raise KeyError(card)
+        self.suits[EFFECTIVE_SUITS[self.trump][card.index]] ^= 1 << card.index
+        self.mask ^= 1 << card.index
+
+    def legal(self, led_suit):
+        """Bitmask of the cards that can be played without reneging.
+
+        Args:
+            led_suit (str): Effective suit led, None when leading
+        """
+        if led_suit is not None and self.suits[led_suit]:
+            return self.suits[led_suit]
+        return self.mask
+
+    def isLegal(self, card, led_suit):
+        """Whether playing a held card follows the led suit when it can.
+
+        Args:
+            card (Card): Card held in the hand
+            led_suit (str): Effective suit led, None when leading
+        """
+        return bool((self.legal(led_suit) >> card.index) & 1)
+
+
+class LegalMoves:
+    """Hands of the players of a round, indexed for legality checks.
+
+    Args:
+        hands (dict): Maps players to their cards, see HandIndex
+        trump (str): Trump suit
+    """
+
+    def __init__(self, hands, trump):
+        self.trump = trump
+        self.index = {player: HandIndex(cards, trump)
+                      for player, cards in hands.items()}
+
+    def hand(self, player):
+        """Cards a player still holds.
+
+        Returns:
+            (CardSet): Copy of the player's hand
+        """
+        return CardSet.fromMask(self.index[player].mask)
+
+    def holds(self, player, card):
+        """Whether a player holds a card."""
+        return self.index[player].holds(card)
+
+    def legalPlays(self, player, led_suit):
+        """Cards a player can play without reneging.
+
+        Args:
+            player (Player): Player to play
+            led_suit (str): Effective suit led, None when leading
+
+        Returns:
+            (CardSet): Cards of the led suit if the player holds any,
+                otherwise every card in the hand
+        """
+        return CardSet.fromMask(self.index[player].legal(led_suit))
+
+    def isLegal(self, player, card, led_suit):
+        """Whether a player can play a held card without reneging."""
+        return self.index[player].isLegal(card, led_suit)
+
+    def play(self, player, card, led_suit):
+        """Removes a played card from the player's hand.
+
+        Args:
+            player (Player): Player that played the card
+            card (Card): Card played, must be held by the player
+            led_suit (str): Effective suit led, None when leading
+
+        Returns:
+            (bool): False if the play is a renege
+        """
+        index = self.index[player]
+        legal = index.isLegal(card, led_suit)
+        index.remove(card)
+        return legal
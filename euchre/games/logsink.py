@@ -0,0 +1,159 @@
+"""Writers for the round logs of games.
+
+A GameLogSink takes the record of every round a game logs (see
+GameEngine.logGameState) and writes them in batches, so the file is opened
+once and written once per batch instead of once per round. Sinks are
+thread safe, so one sink can be shared by every game played in a process.
+
+With background=True a daemon thread writes the batches, every
+flush_interval seconds or as soon as a batch is full, and the games only
+append records to a list.
+"""
+import abc
+import gzip
+import json
+import threading
+
+
+class GameLogSink(abc.ABC):
+    """Destination of round records.
+
+    Attributes:
+        active (bool): Whether the sink keeps records, games don't build
+            records for a sink that doesn't
+    """
+
+    active = True
+
+    @abc.abstractmethod
+    def write(self, record):
+        """Adds the record of a round.
+
+        Args:
+            record (dict or str): JSON serializable record of the round,
+                'misdeal' for a misdeal
+        """
+        pass
+
+    def flush(self):
+        """Writes the records that are buffered."""
+        pass
+
+    def close(self):
+        """Flushes and releases the file, the sink can't be written to
+        after."""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class NullSink(GameLogSink):
+    """Sink that drops every record."""
+
+    active = False
+
+    def write(self, record):
+        pass
+
+
+class JsonlSink(GameLogSink):
+    """Sink appending one JSON line per round to a file.
+
+    Args:
+        path (path): File to append to
+        batch_size (int): Records buffered before they are written
+        background (bool): Whether a daemon thread writes the batches
+        flush_interval (float): Seconds between writes of the background
+            thread when batches don't fill up
+    """
+
+    def __init__(self, path, batch_size=256, background=False,
+                 flush_interval=1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.closed = False
+        self.lock = threading.Lock() # Guards buffer and closed
+        # Held from taking a batch to writing it, so batches are written
+        # whole and in order. Taken before lock
+        self.file_lock = threading.Lock()
+        self.file = self.open(path)
+        self.thread = None
+        if background:
+            self.wakeup = threading.Condition(self.lock)
+            self.thread = threading.Thread(target=self.flushLoop, daemon=True)
+            self.thread.start()
+
+    def open(self, path):
+        """Opens the file to append the lines to."""
+        return open(path, 'a')
+
+    def write(self, record):
+        with self.lock:
+            if self.closed:
+                raise ValueError(f"{self.path} sink is closed")
+            self.buffer.append(record)
+            if len(self.buffer) < self.batch_size:
+                return
+            if self.thread is not None:
+                self.wakeup.notify()
+                return
+        self.writeBuffer()
+
+    def writeBuffer(self):
+        """Takes the buffered records and writes them as one batch."""
+        with self.file_lock:
+            with self.lock:
+                batch, self.buffer = self.buffer, []
+            if batch:
+                self.writeBatch(batch)
+
+    def writeBatch(self, batch):
+        """Encodes a batch of records and writes it to the file, called
+        with file_lock held."""
+        self.file.write(''.join(json.dumps(record) + '\n'
+                                for record in batch))
+
+    def flush(self):
+        self.writeBuffer()
+        with self.file_lock:
+            self.file.flush()
+
+    def flushLoop(self):
+        """Writes batches until the sink is closed."""
+        closed = False
+        while not closed:
+            with self.lock:
+                if not self.closed:
+                    self.wakeup.wait(self.flush_interval)
+                closed = self.closed
+            self.writeBuffer()
+
+    def close(self):
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            if self.thread is not None:
+                self.wakeup.notify()
+        if self.thread is not None:
+            self.thread.join()
+        self.flush()
+        with self.file_lock:
+            self.file.close()
+
+
+class GzipJsonlSink(JsonlSink):
+    """JsonlSink writing a gzip compressed file.
+
+    Every time the sink is opened a new gzip member is appended, which
+    readers like gzip.open read through as one file.
+    """
+
+    def open(self, path):
+        return gzip.open(path, 'at')
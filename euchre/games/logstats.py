@@ -0,0 +1,274 @@
+"""Statistics of round logs, computed across worker processes.
+
+Reads JSONL logs (see euchre.games.logsink, gzip compressed if they end with
+.gz) and round record files (see euchre.games.roundrecords). Files are split
+into chunks, byte ranges of JSONL logs and record ranges of round record
+files, and every chunk is counted by a worker into a LogStats. Workers read
+their chunk a batch of rounds at a time and LogStats only holds counts, so
+memory doesn't grow with the size of the logs. Gzip files can't be seeked
+and are one chunk each.
+
+JSONL records are encoded with roundrecords.encodeRound, so both formats are
+counted by the same NumPy code.
+"""
+import concurrent.futures
+import gzip
+import json
+import os
+
+import click
+import numpy as np
+
+from euchre.cards.card import SUITS
+from euchre.games import roundrecords
+from euchre.games.roundrecords import MAGIC
+from euchre.games.roundrecords import ROUND_DTYPE
+
+BATCH_SIZE = 4096
+
+
+class LogStats:
+    """Counts over the rounds of logs.
+
+    Seats are positions at the table, 0 is left of the dealer and 3 is the
+    dealer. Trump is ordered up when it is the suit of the top card, and
+    called otherwise.
+
+    Attributes:
+        rounds (int): Number of rounds, misdeals included
+        misdeals (int): Number of misdeals
+        calls (numpy.ndarray): Trump made, indexed by ordered up (0) or
+            called (1), maker seat and trump suit index in SUITS
+        made (numpy.ndarray): Rounds the makers took 3 tricks or more, by
+            maker seat
+        marched (numpy.ndarray): Rounds the makers took the 5 tricks, by
+            maker seat
+        alone (numpy.ndarray): Rounds the maker went alone, by maker seat
+        alone_made (numpy.ndarray): Rounds a maker going alone took 3 tricks
+            or more, by maker seat
+        alone_marched (numpy.ndarray): Rounds a maker going alone took the 5
+            tricks, by maker seat
+        reneges (numpy.ndarray): Rounds each seat reneged in
+        renege_rounds (int): Rounds with at least one renege
+    """
+
+    COUNTS = ('made', 'marched', 'alone', 'alone_made', 'alone_marched',
+              'reneges')
+
+    def __init__(self):
+        self.rounds = 0
+        self.misdeals = 0
+        self.renege_rounds = 0
+        self.calls = np.zeros((2, 4, 4), dtype=np.int64)
+        for name in self.COUNTS:
+            setattr(self, name, np.zeros(4, dtype=np.int64))
+
+    def addRounds(self, rounds):
+        """Counts rounds.
+
+        Args:
+            rounds (numpy.ndarray): Records in ROUND_DTYPE
+        """
+        self.rounds += len(rounds)
+        misdealt = roundrecords.misdeals(rounds)
+        self.misdeals += int(misdealt.sum())
+        rounds = rounds[~misdealt]
+
+        makers = roundrecords.makerSeats(rounds).astype(np.intp)
+        trumps = roundrecords.trumpSuits(rounds).astype(np.intp)
+        called = trumps != rounds['top_card'] // 6
+        self.calls += np.bincount((called * 4 + makers) * 4 + trumps,
+                                  minlength=32).reshape(2, 4, 4)
+
+        # Seats 0 and 2 are a team, as are seats 1 and 3
+        maker_tricks = ((roundrecords.trickTakers(rounds) & 1)
+                        == (makers[:, None] & 1)).sum(axis=1)
+        alone = roundrecords.goingAlone(rounds)
+        for name, mask in (('made', maker_tricks >= 3),
+                           ('marched', maker_tricks == 5),
+                           ('alone', alone),
+                           ('alone_made', alone & (maker_tricks >= 3)),
+                           ('alone_marched', alone & (maker_tricks == 5))):
+            getattr(self, name)[:] += np.bincount(makers[mask], minlength=4)
+
+        reneged = roundrecords.reneged(rounds)
+        self.reneges += reneged.sum(axis=0)
+        self.renege_rounds += int(reneged.any(axis=1).sum())
+
+    def merge(self, other):
+        """Adds the counts of other to these counts."""
+        self.rounds += other.rounds
+        self.misdeals += other.misdeals
+        self.renege_rounds += other.renege_rounds
+        self.calls += other.calls
+        for name in self.COUNTS:
+            getattr(self, name)[:] += getattr(other, name)
+
+    def prettyString(self):
+        """Tables of the rates by seat and of the trump calls."""
+        played = self.rounds - self.misdeals
+
+        def rate(count, total):
+            return f"{count / total:.1%}" if total else '-'
+
+        makes = self.calls.sum(axis=(0, 2))
+        lines = [f"{self.rounds} rounds, {self.misdeals} misdeals "
+                 f"({rate(self.misdeals, self.rounds)}), reneges in "
+                 f"{self.renege_rounds} rounds "
+                 f"({rate(self.renege_rounds, played)})",
+                 '',
+                 f"{'seat':<6} {'makes':>8} {'made':>7} {'marched':>8} "
+                 f"{'alone':>8} {'made':>7} {'marched':>8} {'reneges':>8}"]
+        for seat in range(4):
+            lines.append(
+                f"{seat:<6} {makes[seat]:>8} "
+                f"{rate(self.made[seat], makes[seat]):>7} "
+                f"{rate(self.marched[seat], makes[seat]):>8} "
+                f"{self.alone[seat]:>8} "
+                f"{rate(self.alone_made[seat], self.alone[seat]):>7} "
+                f"{rate(self.alone_marched[seat], self.alone[seat]):>8} "
+                f"{rate(self.reneges[seat], played):>8}")
+
+        lines += ['', f"{'trump':<11} "
+                  + ' '.join(f"{suit:>7}" for suit in SUITS)
+                  + f" {'total':>7}"]
+        total = self.calls.sum()
+        for called, how in enumerate(('ordered up', 'called')):
+            by_suit = self.calls[called].sum(axis=0)
+            lines.append(f"{how:<11} "
+                         + ' '.join(f"{rate(count, total):>7}"
+                                    for count in by_suit)
+                         + f" {rate(by_suit.sum(), total):>7}")
+        return '\n'.join(lines)
+
+
+def isRoundRecords(path):
+    """Whether a file is a round record file rather than a JSONL log."""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _encodeLines(lines):
+    """ROUND_DTYPE records of JSONL lines, blank lines skipped. Stats are
+    counted by seat, so the players are left out of the records."""
+    return np.array([roundrecords.encodeRound(json.loads(line))
+                     for line in lines if line.strip()], dtype=ROUND_DTYPE)
+
+
+def statsChunk(path, start, stop):
+    """Counts the rounds of a chunk of a log in the current process.
+
+    Args:
+        path (path): JSONL log or round record file
+        start, stop (int): Range of rounds of a round record file, or range
+            of bytes of a JSONL log holding the start of the lines counted.
+            Gzip logs are counted whole
+
+    Returns:
+        (LogStats): Counts of the rounds in the chunk
+    """
+    stats = LogStats()
+    if isRoundRecords(path):
+        _, rounds = roundrecords.readRounds(path)
+        for i in range(start, stop, BATCH_SIZE):
+            stats.addRounds(np.array(rounds[i:min(i + BATCH_SIZE, stop)]))
+        return stats
+
+    if str(path).endswith('.gz'):
+        with gzip.open(path, 'rb') as f:
+            batch = []
+            for line in f:
+                batch.append(line)
+                if len(batch) == BATCH_SIZE:
+                    stats.addRounds(_encodeLines(batch))
+                    batch = []
+            stats.addRounds(_encodeLines(batch))
+        return stats
+
+    with open(path, 'rb') as f:
+        if start > 0:
+            # Skip the line started in the previous chunk
+            f.seek(start - 1)
+            f.readline()
+        position = f.tell()
+        batch = []
+        while position < stop:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            batch.append(line)
+            if len(batch) == BATCH_SIZE:
+                stats.addRounds(_encodeLines(batch))
+                batch = []
+        stats.addRounds(_encodeLines(batch))
+    return stats
+
+
+def logChunks(path, chunk_bytes=64 << 20):
+    """Splits a log into the chunks counted by statsChunk.
+
+    Args:
+        path (path): JSONL log or round record file
+        chunk_bytes (int): Approximate size of the chunks
+
+    Returns:
+        (list): (path, start, stop) of every chunk
+    """
+    size = os.path.getsize(path)
+    if isRoundRecords(path):
+        count = len(roundrecords.readRounds(path)[1])
+        step = max(chunk_bytes // ROUND_DTYPE.itemsize, 1)
+        return [(path, i, min(i + step, count))
+                for i in range(0, count, step)]
+    if str(path).endswith('.gz'):
+        return [(path, 0, size)]
+    return [(path, i, min(i + chunk_bytes, size))
+            for i in range(0, size, chunk_bytes)]
+
+
+def logStats(paths, workers=None, chunk_bytes=64 << 20, callback=None):
+    """Counts the rounds of logs across a pool of worker processes.
+
+    Args:
+        paths (list): JSONL logs and round record files
+        workers (int): Number of worker processes, default is the CPU count
+        chunk_bytes (int): Approximate size of the chunk of a file given to
+            a worker at once
+        callback (function): Called with the merged LogStats every time a
+            chunk finishes
+
+    Returns:
+        (LogStats): Counts of the rounds of every log
+    """
+    stats = LogStats()
+    chunks = [chunk for path in paths
+              for chunk in logChunks(path, chunk_bytes)]
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(statsChunk, *chunk) for chunk in chunks]
+        for future in concurrent.futures.as_completed(futures):
+            stats.merge(future.result())
+            if callback is not None:
+                callback(stats)
+    return stats
+
+
+@click.command()
+@click.argument("paths", nargs=-1, required=True)
+@click.option("--workers", "workers", default=None, type=int)
+@click.option("--chunk-mb", "chunk_mb", default=64)
+def main(paths, workers, chunk_mb):
+    """Prints statistics of the rounds in PATHS.
+
+    PATHS are JSONL round logs, gzip compressed if they end with .gz, or
+    round record files. Rates are by seat, 0 is left of the dealer: makes
+    is the number of times each seat made trump, made and marched the
+    rates its team took 3 and 5 tricks, alone the same for a maker going
+    alone, and reneges the rate of rounds the seat reneged in.
+    """
+    stats = logStats(paths, workers, chunk_mb << 20)
+    print(stats.prettyString())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+"""Replays rounds of a JSONL game log.
+
+A RoundLog seeks straight to any round of a log through a sidecar index
+of line offsets (the log path with .idx appended), built the first time the
+log is opened and extended when the log grows. Logs are expected to only be
+appended to, delete the index of a log that is rewritten.
+
+replayRound feeds a logged round back through StandardGame with
+ScriptedPlayers making the logged decisions, and returns the record the
+engine logs for it, so a change in the engine shows up as a replayed record
+that differs from the log. replayRange replays a range of rounds across
+worker processes, to bisect which rounds a change affects.
+
+Only logs written since the table order, the hands and the discard were
+logged can be replayed, and misdeals aren't since their hands aren't
+logged.
+"""
+import concurrent.futures
+import json
+import os
+import tempfile
+
+import click
+import numpy as np
+
+from euchre.cards import CARDS
+from euchre.cards import Card
+from euchre.cards import CardSet
+from euchre.games.logsink import GameLogSink
+from euchre.games.standardgame import StandardGame
+from euchre.players.player import Player
+from euchre.players.team import Team
+
+INDEX_SUFFIX = '.idx'
+
+
+def buildIndex(path):
+    """Offsets of the lines of a log, updating its sidecar index.
+
+    A last line without a newline is still being written and isn't
+    indexed. The index is written to a temporary file that replaces the
+    sidecar, so processes indexing the same log at once don't clash.
+
+    Args:
+        path (path): JSONL log, uncompressed so it can be seeked
+
+    Returns:
+        (numpy.ndarray): Offset of every line followed by the offset the
+            index stops at, read only
+    """
+    index_path = str(path) + INDEX_SUFFIX
+    size = os.path.getsize(path)
+    offsets = np.zeros(1, dtype=np.uint64)
+    if os.path.exists(index_path):
+        offsets = np.load(index_path, mmap_mode='r')
+        if offsets[-1] == size:
+            return offsets
+        if offsets[-1] > size:
+            # The log was rewritten, start over
+            offsets = np.zeros(1, dtype=np.uint64)
+
+    # Index the lines after the last indexed one
+    new_offsets = []
+    with open(path, 'rb') as f:
+        offset = int(offsets[-1])
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            offset += len(line)
+            new_offsets.append(offset)
+    if not new_offsets and len(offsets) > 1:
+        return offsets
+    offsets = np.concatenate([offsets, np.array(new_offsets,
+                                                dtype=np.uint64)])
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(index_path) or '.', suffix=INDEX_SUFFIX)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, offsets)
+        os.replace(temp_path, index_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return np.load(index_path, mmap_mode='r')
+
+
+class RoundLog:
+    """Random access to the rounds of a JSONL log.
+
+    Args:
+        path (path): JSONL log written by JsonlSink
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offsets = buildIndex(path)
+        self.file = open(path, 'rb')
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, n):
+        """Record of round n, 'misdeal' for a misdeal."""
+        if not 0 <= n < len(self):
+            raise IndexError(f"round {n} isn't in {self.path}")
+        self.file.seek(int(self.offsets[n]))
+        return json.loads(self.file.read(int(self.offsets[n + 1]
+                                             - self.offsets[n])))
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ScriptedPlayer(Player):
+    """Player making decisions read from a script.
+
+    Args:
+        name (str): Name of the player
+        script (dict): Maps decision kinds (see DecisionRequest) to the
+            answers of the player, in the order they are asked
+    """
+
+    subscriptions = frozenset()
+
+    def __init__(self, name, script):
+        Player.__init__(self, name)
+        self.script = {kind: list(answers)
+                       for kind, answers in script.items()}
+
+    def answer(self, kind):
+        """Next scripted answer to a decision.
+
+        Raises:
+            ValueError: The script has no answer left for the decision
+        """
+        answers = self.script.get(kind)
+        if not answers:
+            raise ValueError(f"{self} has no scripted answer to {kind}")
+        return answers.pop(0)
+
+    def orderUp(self):
+        return self.answer('orderUp')
+
+    def orderTrump(self):
+        return self.answer('orderTrump')
+
+    def callTrump(self, up_suit):
+        return self.answer('callTrump')
+
+    def goAlone(self):
+        return self.answer('goAlone')
+
+    def discardCard(self, top_card):
+        return self.answer('discardCard')
+
+    def playCard(self, leader, cards_played, trump):
+        return self.answer('playCard')
+
+    def updateHand(self, cards):
+        self.hand = CardSet(cards)
+
+    def pointsMsg(self, team1, team2):
+        pass
+
+    def dealerMsg(self, dealer):
+        pass
+
+    def topCardMsg(self, top_card):
+        pass
+
+    def roundResultsMsg(self, taking_team, points_scored, team_tricks):
+        pass
+
+    def orderUpMsg(self, player, top_card):
+        pass
+
+    def deniedUpMsg(self, player):
+        pass
+
+    def orderedTrumpMsg(self, player, trump_suit):
+        pass
+
+    def deniedTrumpMsg(self, player):
+        pass
+
+    def gameResultsMsg(self, winning_team):
+        pass
+
+    def misdealMsg(self):
+        pass
+
+    def leaderMsg(self, leader):
+        pass
+
+    def playedMsg(self, player, card):
+        pass
+
+    def takerMsg(self, taker):
+        pass
+
+    def penaltyMsg(self, player, card):
+        pass
+
+    def invalidSuitMsg(self):
+        pass
+
+    def trickStartMsg(self):
+        pass
+
+    def newTrumpMsg(self, trump_suit):
+        pass
+
+
+class RecordingSink(GameLogSink):
+    """Sink keeping the records in a list."""
+
+    def __init__(self):
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+
+def roundScripts(record):
+    """Decisions of each player in a logged round.
+
+    Args:
+        record (dict): Round logged by GameEngine.logGameState
+
+    Returns:
+        (dict): Maps player names to their script, see ScriptedPlayer
+    """
+    table = record['table']
+    maker = record['maker']
+    ordered_up = record['trump'] == Card.str2card(record['top_card']).suit
+    scripts = {name: {'orderUp': [], 'orderTrump': []} for name in table}
+
+    # Everyone before the maker passed, everyone passed ordering up if
+    # trump was called
+    for name in table[:table.index(maker)]:
+        scripts[name]['orderUp' if ordered_up else 'orderTrump'].append(False)
+    if ordered_up:
+        scripts[maker]['orderUp'].append(True)
+        scripts[table[3]]['discardCard'] = [Card.str2card(record['discard'])]
+    else:
+        for name in table:
+            scripts[name]['orderUp'].append(False)
+        scripts[maker]['orderTrump'].append(True)
+        scripts[maker]['callTrump'] = [record['trump']]
+    scripts[maker]['goAlone'] = [record['going_alone']]
+    for name, cards in record['cards_played'].items():
+        scripts[name]['playCard'] = [Card.str2card(card) for card in cards]
+    return scripts
+
+
+def roundDeal(record):
+    """Cards dealt in a logged round, in the format of Deck.deal."""
+    table = record['table']
+    hands = [CardSet([Card.str2card(card) for card in record['hands'][name]])
+             for name in table]
+    top_card = Card.str2card(record['top_card'])
+    if record['discard'] not in (None, record['top_card']):
+        # The dealer picked up the top card and discarded another card
+        hands[3].remove(top_card)
+        hands[3].add(Card.str2card(record['discard']))
+    dealt = CardSet([top_card])
+    for hand in hands:
+        dealt = dealt | hand
+    kitty = [card for card in CARDS if card not in dealt]
+    return [hand.toList() for hand in hands] + [[top_card] + kitty]
+
+
+def replayRound(record, **kwargs):
+    """Plays a logged round again with the logged decisions.
+
+    Args:
+        record (dict): Round logged by GameEngine.logGameState, with the
+            table order, hands and discard
+        kwargs (dict): Options of StandardGame, like reneges or claims
+
+    Returns:
+        (dict): Record the engine logs for the replayed round, equal to the
+            logged one unless the engine plays the round differently
+
+    Raises:
+        ValueError: The record is a misdeal or was logged without the
+            hands, or the engine asks for a decision that wasn't logged
+    """
+    if record == 'misdeal' or 'hands' not in record:
+        raise ValueError("Only rounds logged with their hands are replayed")
+    scripts = roundScripts(record)
+    players = {name: ScriptedPlayer(name, scripts[name])
+               for name in record['table']}
+    teams = [Team(*(players[name] for name in team))
+             for team in record['teams']]
+    sink = RecordingSink()
+    game = StandardGame(teams[0], teams[1], log_sink=sink,
+                        rng=np.random.default_rng(0), **kwargs)
+    game.seatPlayers([players[name] for name in record['table']])
+    game.playRound(roundDeal(record))
+    replayed = sink.records[0]
+    # Teams and players are logged in the order of the game being played
+    replayed['teams'] = record['teams']
+    replayed['players'] = record['players']
+    return replayed
+
+
+def replayChunk(path, start, stop, kwargs=None):
+    """Replays a range of rounds of a log in the current process.
+
+    Returns:
+        (list): Numbers of the rounds whose replay differs from the log or
+            can't be replayed, misdeals excluded
+    """
+    differing = []
+    with RoundLog(path) as log:
+        for n in range(start, stop):
+            record = log[n]
+            if record == 'misdeal':
+                continue
+            try:
+                replayed = replayRound(record, **(kwargs or {}))
+            except ValueError:
+                differing.append(n)
+                continue
+            if json.loads(json.dumps(replayed)) != record:
+                differing.append(n)
+    return differing
+
+
+def replayRange(path, start=0, stop=None, workers=None, chunk_size=1000,
+                **kwargs):
+    """Replays a range of rounds of a log across worker processes.
+
+    Args:
+        path (path): JSONL log
+        start, stop (int): Range of round numbers, default is every round
+        workers (int): Number of worker processes, default is the CPU count
+        chunk_size (int): Number of rounds per task
+        kwargs (dict): Options of StandardGame the rounds are replayed with
+
+    Returns:
+        (list): Sorted numbers of the rounds whose replay differs from the
+            log, see replayChunk
+    """
+    # Index the log before the workers open it
+    rounds = len(buildIndex(path)) - 1
+    stop = rounds if stop is None else min(stop, rounds)
+    differing = []
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(replayChunk, path, i,
+                                   min(i + chunk_size, stop), kwargs)
+                   for i in range(start, stop, chunk_size)]
+        for future in concurrent.futures.as_completed(futures):
+            differing.extend(future.result())
+    return sorted(differing)
+
+
+@click.command()
+@click.argument("path")
+@click.option("--start", "start", default=0)
+@click.option("--stop", "stop", default=None, type=int)
+@click.option("--workers", "workers", default=None, type=int)
+@click.option("--chunk-size", "chunk_size", default=1000)
+@click.option("--reneges", "reneges", default='flag')
+def main(path, start, stop, workers, chunk_size, reneges):
+    """Replays the rounds of the JSONL log PATH and prints the rounds that
+    don't replay the way they were logged."""
+    differing = replayRange(path, start, stop, workers, chunk_size,
+                            reneges=reneges)
+    for n in differing:
+        print(n)
+    print(f"{len(differing)} rounds differ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""Compact binary log of rounds, readable with a memory map.
+
+A round record file starts with a fixed size header holding the names of
+the players in the file, followed by one fixed width record per round (see
+ROUND_DTYPE). Records refer to players by their index in the name table and
+to cards by their index (see Card.index). Seats are positions at the table
+for the round: 0 is left of the dealer and 3 is the dealer, as in GameState.
+
+Record fields:
+    players: Name index of the player in each seat
+    hands: Bitmask of the cards each seat played the round with, after the
+        dealer picked up the top card and discarded
+    top_card, discard: Card indexes, discard is NO_CARD if trump was called
+    cards: Card each seat played to each trick, NO_CARD for the partner of
+        a maker going alone
+    takers: Seat that took each trick, 2 bits per trick
+    flags: Maker seat (bits 0-1), trump suit index (bits 2-3), going alone
+        (bit 4), seats that reneged (bits 5-8, one per seat) and misdeal
+        (bit 9). A misdeal record has no other field set
+
+100M rounds take 5 GB. readRounds maps a file without reading it, and the
+flag helpers below filter rounds with NumPy instead of parsing them.
+"""
+import gzip
+import json
+import os
+import threading
+
+import click
+import numpy as np
+
+from euchre.cards import Card
+from euchre.cards.card import SUITS
+from euchre.games.logsink import GameLogSink
+
+MAGIC = b'EUCHRR01'
+MAX_NAMES = 256
+NAME_BYTES = 32
+# Magic, name count, then the name table
+HEADER_SIZE = len(MAGIC) + 4 + MAX_NAMES * NAME_BYTES
+
+NO_CARD = 255
+
+ROUND_DTYPE = np.dtype([
+    ('players', '<u2', (4,)),
+    ('hands', '<u4', (4,)),
+    ('top_card', 'u1'),
+    ('discard', 'u1'),
+    ('cards', 'u1', (5, 4)),
+    ('takers', '<u2'),
+    ('flags', '<u2'),
+])
+
+ALONE_FLAG = 1 << 4
+RENEGE_SHIFT = 5
+MISDEAL_FLAG = 1 << 9
+
+
+def makerSeats(rounds):
+    """Seat of the maker of each round."""
+    return rounds['flags'] & 3
+
+
+def trumpSuits(rounds):
+    """Index of the trump suit of each round in euchre.cards.card.SUITS."""
+    return (rounds['flags'] >> 2) & 3
+
+
+def goingAlone(rounds):
+    """Whether the maker of each round went alone."""
+    return (rounds['flags'] & ALONE_FLAG) != 0
+
+
+def reneged(rounds):
+    """Whether each seat reneged in each round, shape (rounds, 4)."""
+    return (rounds['flags'][:, None] >> (RENEGE_SHIFT + np.arange(4))) & 1 \
+        != 0
+
+
+def misdeals(rounds):
+    """Whether each round was a misdeal."""
+    return (rounds['flags'] & MISDEAL_FLAG) != 0
+
+
+def trickTakers(rounds):
+    """Seat that took each trick of each round, shape (rounds, 5)."""
+    return (rounds['takers'][:, None] >> (2 * np.arange(5))) & 3
+
+
+def _cardIndex(name):
+    return Card.str2card(name).index
+
+
+def _tableOrder(record):
+    """Names of the players in seat order.
+
+    Logs written before the table order was logged correctly only have
+    the play order of the first trick, which starts at seat 0 unless seat 0
+    sits out for a maker going alone.
+    """
+    if 'dealer' in record:
+        return record['table']
+    order = record['trick_play_orders'][0]
+    maker = record['maker']
+    partner = next(name for team in record['teams'] if maker in team
+                   for name in team if name != maker)
+    if record['going_alone'] and order[-1] == partner:
+        return [order[-1]] + order[:-1]
+    return order
+
+
+def encodeRound(record, name_ids=None):
+    """Record of a round in ROUND_DTYPE.
+
+    Args:
+        record (dict or str): Round as logged by GameEngine.logGameState
+        name_ids (dict): Maps player names to their index in the name
+            table, new names are added to it. None to leave the players
+            out, they are all index 0
+
+    Returns:
+        (tuple): Fields of the record in ROUND_DTYPE order
+
+    Raises:
+        ValueError: A name is longer than NAME_BYTES in UTF-8, or the name
+            table is full
+    """
+    if record == 'misdeal':
+        return ((0,) * 4, (0,) * 4, NO_CARD, NO_CARD,
+                ((NO_CARD,) * 4,) * 5, 0, MISDEAL_FLAG)
+
+    table = _tableOrder(record)
+    seats = {name: seat for seat, name in enumerate(table)}
+    if name_ids is None:
+        players = (0,) * 4
+    else:
+        for name in table:
+            if name not in name_ids \
+                    and len(name.encode('utf-8')) > NAME_BYTES:
+                raise ValueError(f"Player name {name!r} is longer than "
+                                 f"{NAME_BYTES} bytes")
+        for name in table:
+            if name not in name_ids:
+                if len(name_ids) == MAX_NAMES:
+                    raise ValueError(f"More than {MAX_NAMES} player names")
+                name_ids[name] = len(name_ids)
+        players = tuple(name_ids[name] for name in table)
+
+    played = record['cards_played']
+    hands = record.get('hands') or played
+    masks = [0] * 4
+    for name, cards in hands.items():
+        for card in cards:
+            masks[seats[name]] |= 1 << _cardIndex(card)
+    cards = [[NO_CARD] * 4 for _ in range(5)]
+    for name, plays in played.items():
+        for trick, card in enumerate(plays):
+            cards[trick][seats[name]] = _cardIndex(card)
+
+    takers = 0
+    for trick, name in enumerate(record['takers']):
+        takers |= seats[name] << (2 * trick)
+    flags = seats[record['maker']] | SUITS.index(record['trump']) << 2
+    if record['going_alone']:
+        flags |= ALONE_FLAG
+    for name in record['renegers']:
+        flags |= 1 << (RENEGE_SHIFT + seats[name])
+    discard = record.get('discard')
+
+    return (players, tuple(masks),
+            _cardIndex(record['top_card']),
+            NO_CARD if discard is None else _cardIndex(discard),
+            tuple(tuple(trick) for trick in cards), takers, flags)
+
+
+def readNames(path):
+    """Name table of a round record file.
+
+    Returns:
+        (list): Player names, records refer to them by index
+    """
+    with open(path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) != HEADER_SIZE or not header.startswith(MAGIC):
+        raise ValueError(f"{path} is not a round record file")
+    count = int.from_bytes(header[len(MAGIC):len(MAGIC) + 4], 'little')
+    start = len(MAGIC) + 4
+    return [header[start + i * NAME_BYTES:start + (i + 1) * NAME_BYTES]
+            .rstrip(b'\0').decode('utf-8') for i in range(count)]
+
+
+def readRounds(path):
+    """Maps the records of a round record file without reading them.
+
+    Returns:
+        names (list): Player names, records refer to them by index
+        rounds (numpy.ndarray): Read only memmap of ROUND_DTYPE records
+    """
+    names = readNames(path)
+    if os.path.getsize(path) == HEADER_SIZE:
+        return names, np.zeros(0, dtype=ROUND_DTYPE)
+    return names, np.memmap(path, dtype=ROUND_DTYPE, mode='r',
+                            offset=HEADER_SIZE)
+
+
+class RoundRecordSink(GameLogSink):
+    """Sink writing rounds as binary records.
+
+    Appends to the file if it already holds records. Records are buffered
+    and written in batches, the name table is rewritten with every batch.
+    The sink is thread safe like JsonlSink.
+
+    Args:
+        path (path): Round record file to write
+        batch_size (int): Records buffered before they are written
+    """
+
+    def __init__(self, path, batch_size=4096):
+        self.path = path
+        self.batch_size = batch_size
+        self.buffer = []
+        self.name_ids = {}
+        self.lock = threading.Lock() # Guards buffer, name_ids and file
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self.name_ids = {name: i
+                             for i, name in enumerate(readNames(path))}
+            self.file = open(path, 'r+b')
+        else:
+            self.file = open(path, 'w+b')
+            self.writeHeader()
+
+    def writeHeader(self):
+        """Writes the magic and the name table at the start of the file."""
+        table = bytearray(MAX_NAMES * NAME_BYTES)
+        for name, i in self.name_ids.items():
+            encoded = name.encode('utf-8')
+            table[i * NAME_BYTES:i * NAME_BYTES + len(encoded)] = encoded
+        self.file.seek(0)
+        self.file.write(MAGIC + len(self.name_ids).to_bytes(4, 'little')
+                        + bytes(table))
+
+    def write(self, record):
+        with self.lock:
+            if self.file.closed:
+                raise ValueError(f"{self.path} sink is closed")
+            self.buffer.append(encodeRound(record, self.name_ids))
+            if len(self.buffer) >= self.batch_size:
+                self.writeBuffer()
+
+    def writeBuffer(self):
+        """Appends the buffered records and rewrites the name table, called
+        with lock held."""
+        if self.buffer:
+            batch = np.array(self.buffer, dtype=ROUND_DTYPE)
+            self.buffer = []
+            self.file.seek(0, os.SEEK_END)
+            self.file.write(batch.tobytes())
+            self.writeHeader()
+
+    def flush(self):
+        with self.lock:
+            self.writeBuffer()
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            if self.file.closed:
+                return
+            self.writeBuffer()
+            self.file.close()
+
+
+def convertJsonl(jsonl_path, path):
+    """Converts a JSONL round log to a round record file.
+
+    Args:
+        jsonl_path (path): Log written by JsonlSink or GzipJsonlSink, read
+            as gzip if it ends with .gz
+        path (path): Round record file to append to
+
+    Returns:
+        (int): Number of rounds converted
+    """
+    opener = gzip.open if str(jsonl_path).endswith('.gz') else open
+    count = 0
+    with opener(jsonl_path, 'rt') as f, RoundRecordSink(path) as sink:
+        for line in f:
+            if line.strip():
+                sink.write(json.loads(line))
+                count += 1
+    return count
+
+
+@click.command()
+@click.argument("jsonl_path")
+@click.argument("path")
+def main(jsonl_path, path):
+    """Converts the JSONL round log JSONL_PATH to the round record file
+    PATH."""
+    count = convertJsonl(jsonl_path, path)
+    print(f"converted {count} rounds")
+
+
+if __name__ == "__main__":
+    main()
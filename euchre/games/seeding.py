@@ -0,0 +1,54 @@
+"""Seeded random streams for reproducible games.
+
+Every game of a simulation gets its own generator derived from a root seed
+and the index of the game. The streams don't overlap and don't depend on
+which worker plays the game, so a sharded simulation gives the same results
+no matter how the games are split up.
+"""
+import numpy as np
+
+
+def gameSeedSequence(seed, game_index):
+    """Seed sequence of one game in a seeded simulation.
+
+    Equivalent to np.random.SeedSequence(seed).spawn(n)[game_index] without
+    spawning the sequences of the other games.
+
+    Args:
+        seed (int): Root seed of the simulation
+        game_index (int): Index of the game in the simulation
+
+    Returns:
+        (numpy.random.SeedSequence): Independent child sequence of the game
+    """
+    return np.random.SeedSequence(seed, spawn_key=(game_index,))
+
+
+def gameRng(seed, game_index):
+    """Random generator of one game in a seeded simulation.
+
+    Args:
+        seed (int): Root seed of the simulation
+        game_index (int): Index of the game in the simulation
+
+    Returns:
+        (numpy.random.Generator): Generator to pass to StandardGame
+    """
+    return np.random.default_rng(gameSeedSequence(seed, game_index))
+
+
+def shardRange(n_games, n_shards, shard):
+    """Game indexes played by one shard of a simulation.
+
+    Args:
+        n_games (int): Number of games in the simulation
+        n_shards (int): Number of shards the simulation is split into
+        shard (int): Index of the shard
+
+    Returns:
+        (range): Indexes of the games in the shard
+    """
+    per_shard, extra = divmod(n_games, n_shards)
+    start = shard * per_shard + min(shard, extra)
+    stop = start + per_shard + (1 if shard < extra else 0)
+    return range(start, stop)
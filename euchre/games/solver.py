@@ -0,0 +1,375 @@
+"""Double dummy solver for the trick playing phase of a round.
+
+Given every hand, the solver finds how many tricks each team takes when
+both teams play perfectly. It searches GameState positions with alpha-beta
+on the tricks of seats 0 and 2, and:
+
+    - Plays one card of each run of equivalent cards. Cards of a player are
+      equivalent when they are in the same effective suit and every card
+      ranked between them is already played, like the right bower, the left
+      bower and the ace of trump held together, or the king and queen of a
+      suit once the ace is out.
+    - Keeps the bounds of positions at the start of tricks in a
+      transposition table keyed by Zobrist hashes. The table has a fixed
+      number of slots, a slot holds one position and is reused by a
+      position of an earlier solve, or by a position with at least as many
+      cards left, so the positions that saved the most search stay.
+
+Positions are worth the same in every round they come up in, so a solver
+keeps its table between solves, which helps when solving many deals that
+share cards like the samples of a PIMC player.
+
+Cards are ranked with TRICK_RANKS, which is built from Card.value, so tricks
+are taken the way StandardGame has them taken.
+"""
+import random
+
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import TRICK_RANKS
+from euchre.cards.card import SUITS
+from euchre.cards.cardset import SUIT_MASKS
+from euchre.games.gamestate import _PLAY_ORDERS
+from euchre.games.gamestate import GameState
+
+_rng = random.Random(0x5eed)
+# Zobrist keys of each seat holding each card, of each leader, of each trump
+# and of each seat sitting out (index sitting_out + 1)
+_CARD_KEYS = tuple(tuple(_rng.getrandbits(64) for _ in range(24))
+                   for _ in range(4))
+_LEADER_KEYS = tuple(_rng.getrandbits(64) for _ in range(4))
+_TRUMP_KEYS = {trump: _rng.getrandbits(64) for trump in SUITS}
+_SITTING_OUT_KEYS = tuple(_rng.getrandbits(64) for _ in range(5))
+
+
+def _suitOrders(trump):
+    """Card indexes of each effective suit, highest first."""
+    return {suit: tuple(sorted(
+        (i for i in range(24) if EFFECTIVE_SUITS[trump][i] == suit),
+        key=lambda i: -TRICK_RANKS[trump][suit][i])) for suit in SUITS}
+
+
+# _SUIT_ORDERS[trump][suit], cards of an effective suit highest first
+_SUIT_ORDERS = {trump: _suitOrders(trump) for trump in SUITS}
+
+# distinctMoves of each trump, by hand << 24 | live, cleared when full
+_MOVE_CACHES = {trump: {} for trump in SUITS}
+_MOVE_CACHE_SIZE = 1 << 18
+
+
+def zobristKey(state):
+    """Zobrist hash of the hands, leader, trump and sitting out seat of a
+    state at the start of a trick."""
+    key = _LEADER_KEYS[state.leader] ^ _TRUMP_KEYS[state.trump] \
+        ^ _SITTING_OUT_KEYS[state.sitting_out + 1]
+    for seat, hand in enumerate(state.hands):
+        keys = _CARD_KEYS[seat]
+        while hand:
+            low = hand & -hand
+            key ^= keys[low.bit_length() - 1]
+            hand ^= low
+    return key
+
+
+def distinctMoves(hand, live, trump):
+    """Cards of a hand that aren't equivalent to a higher card in it.
+
+    Args:
+        hand (int): Bitmask of the cards the player can play
+        live (int): Bitmask of the cards not played yet, in any hand or in
+            the current trick
+        trump (str): Trump suit
+
+    Returns:
+        (tuple): Card indexes, highest first within each effective suit
+    """
+    moves = []
+    for order in _SUIT_ORDERS[trump].values():
+        in_run = False # Whether the cards since the last move are played
+        for card in order:
+            bit = 1 << card
+            if hand & bit:
+                if not in_run:
+                    moves.append(card)
+                    in_run = True
+            elif live & bit:
+                in_run = False
+    return tuple(moves)
+
+
+class DoubleDummySolver:
+    """Alpha-beta search of rounds played with every hand visible.
+
+    Args:
+        table_bits (int): The transposition table has 2 ** table_bits slots
+
+    Attributes:
+        nodes (int): Positions searched since the solver was made
+    """
+
+    def __init__(self, table_bits=16):
+        self.mask = (1 << table_bits) - 1
+        self.table = [None] * (1 << table_bits)
+        self.generation = 0
+        self.nodes = 0
+
+    def solve(self, hands, trump, leader, maker, alone=False):
+        """Tricks each team takes in a round played perfectly.
+
+        Args:
+            hands (list): Hands of each seat, as bitmasks, lists of cards or
+                CardSets, 0 is left of the dealer
+            trump (str): Trump suit
+            leader (int): Seat leading the first trick
+            maker (int): Seat of the player that made trump
+            alone (bool): Whether the maker is going alone
+
+        Returns:
+            (tuple): Tricks of seats 0 and 2 and tricks of seats 1 and 3
+        """
+        state = GameState.initial(hands, trump, maker, alone)
+        return self.solveState(state._replace(leader=leader))
+
+    def solveState(self, state):
+        """Tricks each team ends the round with when the rest of the round
+        is played perfectly.
+
+        Args:
+            state (GameState): Position to play out
+
+        Returns:
+            (tuple): Tricks of seats 0 and 2 and tricks of seats 1 and 3,
+                including the tricks already taken
+        """
+        self.generation += 1
+        won = self.search(state, 0, 5)
+        return (state.tricks[0] + won, state.tricks[1] + 5
+                - sum(state.tricks) - won)
+
+    def moveValues(self, state):
+        """Tricks the team to move ends the round with after each move.
+
+        Equivalent moves (see distinctMoves) have the same value, each one
+        is listed.
+
+        Args:
+            state (GameState): Position to play out, not terminal
+
+        Returns:
+            (dict): Maps the legal card indexes to the final tricks of the
+                team of the player to move
+        """
+        team = state.to_move % 2
+        values = {}
+        for move in state.legal_moves():
+            values[move] = self.solveState(state.apply(move))[team]
+        return values
+
+    def search(self, state, alpha, beta):
+        """Tricks of seats 0 and 2 in the rest of the round, with alpha-beta
+        bounds.
+
+        Returns:
+            (int): Tricks left to seats 0 and 2, exact if strictly between
+                alpha and beta, otherwise a bound on the side of the window
+                it falls on
+        """
+        hands, trump, maker, alone, leader, trick, tricks = state
+        sitting_out = (maker + 2) % 4 if alone else -1
+        orders = _PLAY_ORDERS[sitting_out + 1]
+        # The leader is hashed in at trick starts
+        key = zobristKey(state) ^ _LEADER_KEYS[leader]
+        # Cards of the sitting out seat are never played
+        live_hands = 0
+        for seat in orders[leader]:
+            live_hands |= hands[seat]
+        trick_mask = 0
+        for card in trick:
+            trick_mask |= 1 << card
+
+        table = self.table
+        mask = self.mask
+        generation = self.generation
+        effective = EFFECTIVE_SUITS[trump]
+        follow_masks = SUIT_MASKS[trump]
+        suit_masks = tuple(follow_masks.values())
+        ranks = TRICK_RANKS[trump]
+        trumps = _SUIT_ORDERS[trump][trump]
+        move_cache = _MOVE_CACHES[trump]
+        if len(move_cache) > _MOVE_CACHE_SIZE:
+            move_cache.clear()
+        leader_keys = _LEADER_KEYS
+        card_keys = _CARD_KEYS
+        nodes = 0
+
+        def lastTrick(hands, leader):
+            # Every player has one card left
+            order = orders[leader]
+            first = hands[order[0]]
+            led_ranks = ranks[effective[first.bit_length() - 1]]
+            best = -1
+            for seat in order:
+                rank = led_ranks[hands[seat].bit_length() - 1]
+                if rank > best:
+                    best = rank
+                    taker = seat
+            return 1 if taker % 2 == 0 else 0
+
+        def startTrick(hands, leader, key, live, left, alpha, beta):
+            # Searches a trick start, left is the number of tricks left
+            nonlocal nodes
+            if left == 1:
+                return lastTrick(hands, leader)
+            nodes += 1
+            position = key ^ leader_keys[leader]
+            slot = position & mask
+            entry = table[slot]
+            if entry is not None and entry[0] == position:
+                lower, upper = entry[1], entry[2]
+            else:
+                entry = None
+                lower, upper = 0, left
+                # A player holding the highest trumps left takes a trick
+                # with each of them
+                holder = None
+                run = 0
+                for card in trumps:
+                    bit = 1 << card
+                    if not live & bit:
+                        continue
+                    if holder is None:
+                        holder = next(seat for seat in orders[leader]
+                                      if hands[seat] & bit)
+                    elif not hands[holder] & bit:
+                        break
+                    run += 1
+                if holder is not None:
+                    if holder % 2 == 0:
+                        lower = run
+                    else:
+                        upper = left - run
+            if lower >= beta or lower == upper:
+                return lower
+            if upper <= alpha:
+                return upper
+            low, high = max(alpha, lower), min(beta, upper)
+
+            value = playCard(hands, orders[leader], 0, None, 0, -1, leader,
+                             0, key, live, left, low, high)
+
+            if value <= low:
+                upper = min(upper, value)
+            elif value >= high:
+                lower = max(lower, value)
+            else:
+                lower = upper = value
+            stored = table[slot]
+            if entry is not None or stored is None \
+                    or stored[3] != generation or stored[4] <= left:
+                table[slot] = (position, lower, upper, generation, left)
+            return value
+
+        def playCard(hands, order, position, led_ranks, follow, best_rank,
+                     winner, trick_mask, key, live, left, alpha, beta):
+            # Searches the play of the next card of a trick. led_ranks and
+            # follow are the ranks and the mask of the suit led, best_rank
+            # the rank of the card of the winner and live holds the cards of
+            # the trick
+            nonlocal nodes
+            nodes += 1
+            seat = order[position]
+            hand = hands[seat]
+            if hand & follow:
+                hand &= follow
+                relevant = follow
+            else:
+                relevant = 0
+                for suit_mask in suit_masks:
+                    if hand & suit_mask:
+                        relevant |= suit_mask
+            # Only the cards of the suits of the hand tell moves apart
+            cache_key = (hand << 24) | (live & relevant)
+            moves = move_cache.get(cache_key)
+            if moves is None:
+                # Highest first, trumps before the other suits
+                moves = move_cache[cache_key] = tuple(sorted(
+                    distinctMoves(hand, live, trump),
+                    key=lambda card: -ranks[effective[card]][card]))
+            if led_ranks is not None and len(moves) > 1:
+                # Give the lowest card when the partner takes the trick,
+                # otherwise try to take it with the lowest card that does.
+                # Moves are ranked highest first in the led suit as well
+                if winner % 2 == seat % 2:
+                    moves = moves[::-1]
+                else:
+                    taking = 0
+                    for card in moves:
+                        if led_ranks[card] <= best_rank:
+                            break
+                        taking += 1
+                    moves = moves[taking - 1::-1] + moves[:taking - 1:-1] \
+                        if taking else moves[::-1]
+
+            maximizing = seat % 2 == 0
+            best = -1 if maximizing else 6
+            last = position == len(order) - 1
+            for card in moves:
+                bit = 1 << card
+                played = hands.copy()
+                played[seat] ^= bit
+                played_key = key ^ card_keys[seat][card]
+                if led_ranks is None:
+                    suit = effective[card]
+                    card_ranks = ranks[suit]
+                    value = playCard(played, order, 1, card_ranks,
+                                     follow_masks[suit], card_ranks[card],
+                                     seat, bit, played_key, live, left,
+                                     alpha, beta)
+                else:
+                    rank = led_ranks[card]
+                    if rank > best_rank:
+                        taker, taker_rank = seat, rank
+                    else:
+                        taker, taker_rank = winner, best_rank
+                    if last:
+                        won = 1 if taker % 2 == 0 else 0
+                        value = won + startTrick(
+                            played, taker, played_key,
+                            live & ~(trick_mask | bit), left - 1,
+                            alpha - won, beta - won)
+                    else:
+                        value = playCard(played, order, position + 1,
+                                         led_ranks, follow, taker_rank,
+                                         taker, trick_mask | bit, played_key,
+                                         live, left, alpha, beta)
+                if maximizing:
+                    if value > best:
+                        best = value
+                        if best > alpha:
+                            alpha = best
+                else:
+                    if value < best:
+                        best = value
+                        if best < beta:
+                            beta = best
+                if alpha >= beta:
+                    break
+            return best
+
+        left = 5 - tricks[0] - tricks[1]
+        if left == 0:
+            return 0
+        live = live_hands | trick_mask
+        if trick:
+            order = orders[leader]
+            suit = effective[trick[0]]
+            led_ranks = ranks[suit]
+            winner = max(range(len(trick)), key=lambda i: led_ranks[trick[i]])
+            value = playCard(list(hands), order, len(trick), led_ranks,
+                             follow_masks[suit], led_ranks[trick[winner]],
+                             order[winner], trick_mask, key, live, left,
+                             alpha, beta)
+        else:
+            value = startTrick(list(hands), leader, key, live, left,
+                               alpha, beta)
+        self.nodes += nodes
+        return value
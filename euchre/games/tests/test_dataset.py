@@ -0,0 +1,99 @@
+import tempfile
+import unittest
+
+import numpy as np
+
+from euchre.games.dataset import FEATURES
+from euchre.games.dataset import FEATURE_SIZE
+from euchre.games.dataset import ShardWriter
+from euchre.games.dataset import generateChunk
+from euchre.games.dataset import generateDataset
+from euchre.games.dataset import readManifest
+from euchre.games.dataset import readShards
+from euchre.games.engine import DECISIONS
+from euchre.games.tournament import PlayerFactory
+
+FACTORIES = (PlayerFactory('euchre.players.TableAIPlayer'),
+             PlayerFactory('euchre.players.TableAIPlayer'))
+
+
+class TestDataset(unittest.TestCase):
+
+    def test_chunk(self):
+        """
+        Test decisions are encoded from the view of the player deciding.
+        """
+        chunk = generateChunk(FACTORIES, 0, 0, 3)
+        features = chunk['features']
+        rows = len(features)
+        self.assertEqual(features.shape, (rows, FEATURE_SIZE))
+        for name in ('actions', 'kinds', 'rewards', 'games'):
+            self.assertEqual(chunk[name].shape, (rows,))
+        self.assertEqual(set(chunk['games']), {0, 1, 2})
+        self.assertTrue((features[:, FEATURES['seat']].sum(axis=1) == 1)
+                        .all())
+
+        plays = chunk['kinds'] == DECISIONS.index('playCard')
+        hands = features[plays][:, FEATURES['hand']]
+        actions = chunk['actions'][plays]
+        # Cards are played from the hand, and weren't seen before
+        self.assertTrue((hands[np.arange(len(actions)), actions] == 1).all())
+        seen = (features[plays][:, FEATURES['seen']]
+                | features[plays][:, FEATURES['trick']])
+        self.assertTrue((seen[np.arange(len(actions)), actions] == 0).all())
+        self.assertTrue((features[plays][:, FEATURES['trump']].sum(axis=1)
+                         == 1).all())
+
+        # Rewards are the points a round is won or lost by
+        self.assertTrue((np.abs(chunk['rewards']) <= 4).all())
+        self.assertTrue((chunk['rewards'] != 0).any())
+
+    def test_generate(self):
+        """
+        Test datasets are written to shards and appended to.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = generateDataset(FACTORIES, 5, directory, workers=2,
+                                       chunk_size=2, shard_size=100)
+            self.assertEqual(manifest['games'], 5)
+            self.assertEqual(manifest, readManifest(directory))
+            shards = list(readShards(directory))
+            self.assertEqual([len(shard['kinds']) for shard in shards],
+                             [shard['rows'] for shard in manifest['shards']])
+            self.assertTrue(all(len(shard['kinds']) == 100
+                                for shard in shards[:-1]))
+            games = np.concatenate([shard['games'] for shard in shards])
+            self.assertEqual(set(games), set(range(5)))
+
+            # Appended games continue the numbering
+            expected = generateChunk(FACTORIES, 0, 5, 7)
+            manifest = generateDataset(FACTORIES, 2, directory, workers=1,
+                                       shard_size=100)
+            self.assertEqual(manifest['games'], 7)
+            shards = list(readShards(directory))
+            self.assertEqual(sum(len(shard['kinds']) for shard in shards),
+                             manifest['rows'])
+            games = np.concatenate([shard['games'] for shard in shards])
+            np.testing.assert_array_equal(
+                np.concatenate([shard['features'] for shard in shards])[
+                    games >= 5], expected['features'])
+
+    def test_writer_bounds(self):
+        """
+        Test the writer writes full shards as chunks come in.
+        """
+        chunk = generateChunk(FACTORIES, 0, 0, 1)
+        rows = len(chunk['kinds'])
+        with tempfile.TemporaryDirectory() as directory:
+            with ShardWriter(directory, shard_size=rows // 2 + 1) as writer:
+                for _ in range(3):
+                    writer.add(chunk, 1)
+            manifest = readManifest(directory)
+            self.assertEqual(manifest['rows'], 3 * rows)
+            self.assertEqual(manifest['games'], 3)
+            self.assertTrue(all(shard['rows'] == rows // 2 + 1
+                                for shard in manifest['shards'][:-1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
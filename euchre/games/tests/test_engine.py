@@ -0,0 +1,103 @@
+import unittest
+
+from euchre import Team
+from euchre.cards import CARDS
+from euchre.games import DecisionRequest
+from euchre.games import GameEngine
+from euchre.games import StandardGame
+from euchre.games import gameRng
+from euchre.games.engine import askPlayer
+from euchre.games.tests.test_standardgame import OrderingAIPlayer
+
+
+def makeTeams():
+    players = [OrderingAIPlayer('AI' + str(i)) for i in range(4)]
+    return Team(players[0], players[1]), Team(players[2], players[3])
+
+
+class TestGameEngine(unittest.TestCase):
+
+    def test_interleaved_games(self):
+        """
+        Test games interleaved in one loop play like StandardGame.play.
+        """
+        expected = []
+        for game_index in range(8):
+            team1, team2 = makeTeams()
+            StandardGame(team1, team2, rng=gameRng(5, game_index)).play()
+            expected.append((team1.points, team2.points))
+
+        # Answer one decision of every running game per pass
+        games = []
+        for game_index in range(8):
+            team1, team2 = makeTeams()
+            engine = GameEngine(team1, team2, rng=gameRng(5, game_index))
+            steps = engine.steps()
+            games.append([engine, steps, next(steps)])
+        running = list(games)
+        while running:
+            for game in list(running):
+                engine, steps, request = game
+                self.assertIsInstance(request, DecisionRequest)
+                player = engine.gs['players'][request.seat]
+                try:
+                    game[2] = steps.send(askPlayer(player, request))
+                except StopIteration:
+                    running.remove(game)
+
+        results = [tuple(team.points for team in engine.gs['teams'])
+                   for engine, _, _ in games]
+        self.assertEqual(results, expected)
+
+    def test_requests(self):
+        """
+        Test requests offer the legal answers to the player deciding.
+        """
+        team1, team2 = makeTeams()
+        engine = GameEngine(team1, team2, rng=gameRng(0, 0))
+        kinds = set()
+        steps = engine.steps()
+        request = next(steps)
+        try:
+            while True:
+                kinds.add(request.kind)
+                player = engine.gs['players'][request.seat]
+                self.assertTrue(set(request.observation['hand'])
+                                <= set(player.hand))
+                if request.kind == 'playCard':
+                    self.assertTrue(set(request.options)
+                                    <= set(request.observation['hand']))
+                    card = askPlayer(player, request)
+                    self.assertIn(card, request.options)
+                else:
+                    card = askPlayer(player, request)
+                request = steps.send(card)
+        except StopIteration:
+            pass
+        self.assertEqual(kinds, {'orderUp', 'discardCard', 'goAlone',
+                                 'playCard'})
+
+    def test_refused_answer(self):
+        """
+        Test a refused card is asked for again with the same request.
+        """
+        team1, team2 = makeTeams()
+        engine = GameEngine(team1, team2, rng=gameRng(0, 0),
+                            reneges='enforce')
+        steps = engine.steps()
+        request = next(steps)
+        while request.kind != 'playCard':
+            player = engine.gs['players'][request.seat]
+            request = steps.send(askPlayer(player, request))
+
+        held = set(request.observation['hand'])
+        missing = next(card for card in CARDS if card not in held)
+        self.assertIs(steps.send(missing), request)
+        legal = next(iter(request.options))
+        self.assertIsNot(steps.send(legal), request)
+        self.assertNotIn(legal, engine.legal_moves.hand(
+            engine.gs['players'][request.seat]))
+
+
+if __name__ == '__main__':
+    unittest.main()
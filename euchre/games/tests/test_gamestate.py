@@ -0,0 +1,173 @@
+import random
+import unittest
+
+from euchre import Team
+from euchre.cards import CARDS
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import trick_winner
+from euchre.games import GameState
+from euchre.games import StandardGame
+from euchre.games import gameRng
+from euchre.games.gamestate import decidedTricks
+from euchre.games.tests.test_standardgame import OrderingAIPlayer
+
+
+def randomState(rng, alone=False):
+    """Start of a round with random hands, trump and maker."""
+    deck = list(range(24))
+    rng.shuffle(deck)
+    hands = [sum(1 << i for i in deck[k * 5:k * 5 + 5]) for k in range(4)]
+    return GameState.initial(hands, rng.choice('CSHD'), rng.randrange(4),
+                             alone)
+
+
+class TestGameState(unittest.TestCase):
+
+    def test_immutable(self):
+        """
+        Test states can't be modified and apply leaves the state unchanged.
+        """
+        state = randomState(random.Random(0))
+        with self.assertRaises(AttributeError):
+            state.leader = 2
+        after = state.apply(state.legal_moves()[0])
+        self.assertEqual(state.trick, ())
+        self.assertEqual(len(after.trick), 1)
+        self.assertIs(after.hands[1], state.hands[1])
+        self.assertEqual(hash(state), hash(randomState(random.Random(0))))
+
+    def test_legal_moves(self):
+        """
+        Test players must follow the led suit when they can.
+        """
+        rng = random.Random(1)
+        for _ in range(50):
+            state = randomState(rng)
+            state = state.apply(rng.choice(state.legal_moves()))
+            led = state.led_suit
+            hand = state.hand(state.to_move)
+            following = hand.ofSuit(led, state.trump)
+            expected = following if following else hand
+            self.assertEqual(set(state.legal_moves()),
+                             {card.index for card in expected})
+
+    def test_playout(self):
+        """
+        Test random playouts take 5 tricks with the same takers as
+        trick_winner.
+        """
+        rng = random.Random(2)
+        for alone in (False, True):
+            for _ in range(50):
+                state = randomState(rng, alone)
+                while not state.isTerminal():
+                    order = state.play_order
+                    self.assertNotIn(state.sitting_out, order)
+                    trick = []
+                    for _ in order:
+                        move = rng.choice(state.legal_moves())
+                        trick.append(CARDS[move])
+                        state = state.apply(move)
+                    led = EFFECTIVE_SUITS[state.trump][trick[0].index]
+                    self.assertEqual(
+                        state.leader,
+                        order[trick_winner(trick, led, state.trump)])
+                self.assertEqual(sum(state.tricks), 5)
+                self.assertEqual(state.hands[state.maker], 0)
+
+    def test_apply_requires_card_in_hand(self):
+        """
+        Test playing a card the player doesn't hold raises ValueError.
+        """
+        state = randomState(random.Random(3))
+        missing = next(i for i in range(24)
+                       if not (state.hands[state.to_move] >> i) & 1)
+        with self.assertRaises(ValueError):
+            state.apply(missing)
+
+
+class TestDecidedTricks(unittest.TestCase):
+
+    def test_last_trick(self):
+        """
+        Test the last trick is always decided.
+        """
+        rng = random.Random(5)
+        for _ in range(20):
+            state = randomState(rng)
+            while sum(state.tricks) < 4:
+                state = state.apply(rng.choice(state.legal_moves()))
+            final = decidedTricks(state)
+            while not state.isTerminal():
+                state = state.apply(state.legal_moves()[0])
+            self.assertEqual(final, state.tricks)
+
+    def test_undecided(self):
+        """
+        Test undecided rounds return None and decided ones match every
+        playout.
+        """
+        rng = random.Random(6)
+        outcomes = set()
+        for _ in range(30):
+            state = randomState(rng)
+            while sum(state.tricks) < 2:
+                state = state.apply(rng.choice(state.legal_moves()))
+            final = decidedTricks(state)
+            outcomes.add(final is None)
+            if final is not None:
+                for _ in range(10):
+                    playout = state
+                    while not playout.isTerminal():
+                        playout = playout.apply(
+                            rng.choice(playout.legal_moves()))
+                    self.assertEqual(playout.tricks, final)
+        self.assertEqual(outcomes, {True, False})
+
+
+class TestEngineState(unittest.TestCase):
+
+    def makeGame(self):
+        players = [OrderingAIPlayer('AI' + str(i)) for i in range(4)]
+        team1 = Team(players[0], players[1])
+        team2 = Team(players[2], players[3])
+        return StandardGame(team1, team2, rng=gameRng(0, 0))
+
+    def test_export(self):
+        """
+        Test the engine exports the state of the round it played.
+        """
+        game = self.makeGame()
+        self.assertIsNone(game.exportState())
+        game.dealPhase()
+        state = game.exportState()
+        self.assertIsNone(state)
+        game.playTricks()
+        state = game.exportState()
+        self.assertTrue(state.isTerminal())
+        self.assertEqual(game.gs['table'][state.maker], game.gs['maker'])
+        self.assertEqual(sum(state.tricks),
+                         sum(game.gs['tricks_taken'].values()))
+
+    def test_import(self):
+        """
+        Test the engine plays a round out from an imported mid-round state.
+        """
+        game = self.makeGame()
+        rng = random.Random(4)
+        state = randomState(rng)
+        for _ in range(6):
+            state = state.apply(state.legal_moves()[0])
+        game.importState(state)
+        self.assertEqual(game.exportState(), state)
+        for seat, player in enumerate(game.gs['table']):
+            self.assertEqual(set(player.hand), set(state.hand(seat)))
+        game.playTricks(state)
+        final = game.exportState()
+        self.assertTrue(final.isTerminal())
+        self.assertEqual(sum(game.gs['tricks_taken'].values()), 5)
+        self.assertTrue(sum(team.points for team in game.gs['teams']) > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import pickle
+import unittest
+
+from euchre import StandardGame
+from euchre import Team
+from euchre.games import Instrumentation
+from euchre.games import gameRng
+from euchre.games.instrumentation import LatencyHistogram
+from euchre.games.tests.test_standardgame import OrderingAIPlayer
+from euchre.games.tournament import PlayerFactory
+from euchre.games.tournament import playChunk
+
+ORDERING = 'euchre.games.tests.test_standardgame:OrderingAIPlayer'
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_buckets(self):
+        """
+        Test durations land in power of two buckets and merge by adding.
+        """
+        histogram = LatencyHistogram()
+        for ns in [1, 3, 100, 1000, 1000]:
+            histogram.record(ns)
+        self.assertEqual(histogram.counts[1], 1)
+        self.assertEqual(histogram.counts[2], 1)
+        self.assertEqual(histogram.counts[10], 2)
+        self.assertEqual(histogram.count, 5)
+        self.assertEqual(histogram.max, 1000)
+        self.assertEqual(histogram.mean(), 2104 / 5)
+        self.assertEqual(histogram.percentile(50), 128)
+        self.assertEqual(histogram.percentile(100), 1000)
+
+        other = pickle.loads(pickle.dumps(histogram))
+        other.merge(histogram)
+        self.assertEqual(other.count, 10)
+        self.assertEqual(other.counts[10], 4)
+        self.assertEqual(other.total, 2 * histogram.total)
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_game(self):
+        """
+        Test an instrumented game times its phases and decisions and plays
+        like an untimed game.
+        """
+        instrumentation = Instrumentation()
+        points = []
+        for timer in [instrumentation, None]:
+            players = [OrderingAIPlayer('AI' + str(i)) for i in range(4)]
+            team1 = Team(players[0], players[1])
+            team2 = Team(players[2], players[3])
+            StandardGame(team1, team2, rng=gameRng(0, 0),
+                         instrumentation=timer).play()
+            points.append((team1.points, team2.points))
+        self.assertEqual(points[0], points[1])
+
+        phases = instrumentation.phases
+        self.assertEqual(set(phases), {'deal', 'order', 'tricks', 'log'})
+        self.assertEqual(phases['deal'].count, phases['order'].count)
+        self.assertEqual(phases['tricks'].count, phases['log'].count)
+        decisions = instrumentation.decisions
+        self.assertEqual(decisions['OrderingAIPlayer', 'goAlone'].count,
+                         phases['tricks'].count)
+        self.assertTrue(decisions['OrderingAIPlayer', 'playCard'].count
+                        >= 15 * phases['tricks'].count)
+        self.assertIn('OrderingAIPlayer.playCard',
+                      instrumentation.prettyString())
+
+    def test_tournament(self):
+        """
+        Test tournament chunks return timings that merge.
+        """
+        factories = (PlayerFactory(ORDERING), PlayerFactory(ORDERING))
+        results = playChunk(factories, 0, 0, 2, instrument=True)
+        self.assertIsNone(playChunk(factories, 0, 0, 2).instrumentation)
+        deals = results.instrumentation.phases['deal'].count
+        results.merge(playChunk(factories, 0, 2, 4, instrument=True))
+        self.assertTrue(results.instrumentation.phases['deal'].count > deals)
+
+
+if __name__ == '__main__':
+    unittest.main()
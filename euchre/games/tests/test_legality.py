@@ -0,0 +1,128 @@
+import unittest
+
+from euchre import Team
+from euchre.cards import Card
+from euchre.cards import CardSet
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.games import StandardGame
+from euchre.games import gameRng
+from euchre.games.legality import HandIndex
+from euchre.games.legality import LegalMoves
+from euchre.games.tests.test_standardgame import OrderingAIPlayer
+
+
+class RenegingAIPlayer(OrderingAIPlayer):
+    """OrderingAIPlayer that plays off suit whenever it can, unless its
+    last card was refused."""
+
+    def __init__(self, name):
+        OrderingAIPlayer.__init__(self, name)
+        self.penalties = 0
+        self.refused = 0
+        self.comply = False
+
+    def playCard(self, leader, cards_played, trump):
+        led = None
+        if leader is not self:
+            trick_number = len(cards_played[self])
+            led = EFFECTIVE_SUITS[trump][cards_played[leader][trick_number]
+                                         .index]
+        legal = self.hand.legalPlays(led, trump)
+        reneges = self.hand - legal
+        if self.comply:
+            reneges, self.comply = None, False
+        card = min(reneges if reneges else legal, key=lambda c: c.index)
+        self.hand.remove(card)
+        return card
+
+    def penaltyMsg(self, player, card):
+        self.penalties += 1
+
+    def invalidCardMsg(self):
+        self.refused += 1
+        self.comply = True
+
+
+def playRenegingGame(reneges):
+    players = [RenegingAIPlayer('AI' + str(i)) for i in range(4)]
+    game = StandardGame(Team(players[0], players[1]),
+                        Team(players[2], players[3]),
+                        rng=gameRng(0, 0), reneges=reneges)
+    game.play()
+    return game, players
+
+
+class TestHandIndex(unittest.TestCase):
+
+    def test_index(self):
+        """
+        Test hands are indexed by effective suit, left bower as trump.
+        """
+        hand = HandIndex([Card.str2card(s) for s in ['JS', 'AC', '9H', 'KS']],
+                         'C')
+        self.assertEqual(CardSet.fromMask(hand.suits['C']),
+                         CardSet([Card.str2card('JS'), Card.str2card('AC')]))
+        self.assertEqual(CardSet.fromMask(hand.legal('S')),
+                         CardSet([Card.str2card('KS')]))
+        self.assertEqual(hand.legal('D'), hand.mask)
+        self.assertTrue(hand.isLegal(Card.str2card('JS'), 'C'))
+        self.assertFalse(hand.isLegal(Card.str2card('JS'), 'S'))
+
+    def test_remove(self):
+        """
+        Test removing cards updates the index.
+        """
+        hand = HandIndex([Card.str2card('KS'), Card.str2card('9H')], 'C')
+        hand.remove(Card.str2card('KS'))
+        self.assertFalse(hand.holds(Card.str2card('KS')))
+        self.assertEqual(hand.legal('S'), hand.mask)
+        with self.assertRaises(KeyError):
+            hand.remove(Card.str2card('KS'))
+
+    def test_play(self):
+        """
+        Test plays are checked against the hand before the card is removed.
+        """
+        moves = LegalMoves({'p': [Card.str2card('KS'), Card.str2card('9H')]},
+                           'H')
+        self.assertFalse(moves.play('p', Card.str2card('9H'), 'S'))
+        self.assertTrue(moves.play('p', Card.str2card('KS'), 'S'))
+        self.assertEqual(len(moves.hand('p')), 0)
+
+
+class TestRenegeModes(unittest.TestCase):
+
+    def test_flag(self):
+        """
+        Test reneges are penalized at the end of the round.
+        """
+        game, players = playRenegingGame('flag')
+        self.assertTrue(players[0].penalties > 0)
+        self.assertEqual(sum(p.refused for p in players), 0)
+
+    def test_enforce(self):
+        """
+        Test reneging cards are refused and players play again.
+        """
+        game, players = playRenegingGame('enforce')
+        self.assertTrue(sum(p.refused for p in players) > 0)
+        self.assertEqual(sum(p.penalties for p in players), 0)
+
+    def test_off(self):
+        """
+        Test reneges go through without penalties.
+        """
+        game, players = playRenegingGame('off')
+        self.assertEqual(sum(p.penalties for p in players), 0)
+        self.assertEqual(sum(p.refused for p in players), 0)
+
+    def test_invalid_mode(self):
+        """
+        Test unknown renege modes are refused.
+        """
+        with self.assertRaises(ValueError):
+            playRenegingGame('sometimes')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+import gzip
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+import unittest
+
+from euchre import StandardGame
+from euchre import Team
+from euchre.games import gameRng
+from euchre.games.logsink import GzipJsonlSink
+from euchre.games.logsink import JsonlSink
+from euchre.games.logsink import NullSink
+from euchre.games.tests.test_standardgame import OrderingAIPlayer
+
+
+class FailingAIPlayer(OrderingAIPlayer):
+    """OrderingAIPlayer that raises once it played some cards."""
+
+    def __init__(self, name, plays):
+        OrderingAIPlayer.__init__(self, name)
+        self.plays = plays
+
+    def playCard(self, leader, cards_played, trump):
+        self.plays -= 1
+        if self.plays < 0:
+            raise RuntimeError("player left")
+        return OrderingAIPlayer.playCard(self, leader, cards_played, trump)
+
+
+class SlowJsonlSink(JsonlSink):
+    """JsonlSink giving other threads a chance to run before writing."""
+
+    def writeBatch(self, batch):
+        time.sleep(random.random() / 1000)
+        JsonlSink.writeBatch(self, batch)
+
+
+def playLoggedGame(game_index, **kwargs):
+    players = [OrderingAIPlayer('AI' + str(i)) for i in range(4)]
+    game = StandardGame(Team(players[0], players[1]),
+                        Team(players[2], players[3]),
+                        rng=gameRng(0, game_index), **kwargs)
+    game.play()
+    return game
+
+
+class TestLogSinks(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'log.jsonl')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def readLines(self, opener=open):
+        with opener(self.path, 'rt') as f:
+            return [json.loads(line) for line in f]
+
+    def test_batches(self):
+        """
+        Test records are written once a batch is full or on flush.
+        """
+        with JsonlSink(self.path, batch_size=3) as sink:
+            sink.write({'round': 0})
+            sink.write('misdeal')
+            self.assertEqual(self.readLines(), [])
+            sink.write({'round': 2})
+            sink.flush()
+            self.assertEqual(len(self.readLines()), 3)
+            sink.write({'round': 3})
+        self.assertEqual(self.readLines(),
+                         [{'round': 0}, 'misdeal', {'round': 2},
+                          {'round': 3}])
+        with self.assertRaises(ValueError):
+            sink.write({'round': 4})
+
+    def test_background(self):
+        """
+        Test the background thread writes batches without flush.
+        """
+        sink = JsonlSink(self.path, batch_size=2, background=True,
+                         flush_interval=0.01)
+        sink.write({'round': 0})
+        lines = []
+        for _ in range(500):
+            with sink.file_lock:
+                sink.file.flush()
+            lines = self.readLines()
+            if lines:
+                break
+            time.sleep(0.01)
+        self.assertEqual(lines, [{'round': 0}])
+        sink.close()
+        self.assertFalse(sink.thread.is_alive())
+
+    def test_ordered(self):
+        """
+        Test flushes racing the background thread keep records in order.
+        """
+        sink = SlowJsonlSink(self.path, batch_size=4, background=True,
+                             flush_interval=0.001)
+        done = threading.Event()
+
+        def flushLoop():
+            while not done.is_set():
+                sink.flush()
+
+        flusher = threading.Thread(target=flushLoop)
+        flusher.start()
+        for round_number in range(1000):
+            sink.write({'round': round_number})
+            if round_number % 3 == 0:
+                time.sleep(0) # Let the flushes run
+        done.set()
+        flusher.join()
+        sink.close()
+        self.assertEqual(self.readLines(),
+                         [{'round': n} for n in range(1000)])
+
+    def test_rounds_written(self):
+        """
+        Test rounds logged to log_file are written as they are played.
+        """
+        players = [OrderingAIPlayer('AI' + str(i)) for i in range(4)]
+        game = StandardGame(Team(players[0], players[1]),
+                            Team(players[2], players[3]),
+                            rng=gameRng(0, 0), log_file=self.path)
+        for round_number in range(5):
+            game.playRound()
+            self.assertEqual(len(self.readLines()), round_number + 1)
+        game.close()
+        self.assertTrue(game.log_sink.file.closed)
+
+        # A game that stops midway keeps the rounds it played
+        os.remove(self.path)
+        players = [FailingAIPlayer('AI' + str(i), 12) for i in range(4)]
+        game = StandardGame(Team(players[0], players[1]),
+                            Team(players[2], players[3]),
+                            rng=gameRng(0, 0), log_file=self.path)
+        with self.assertRaises(RuntimeError):
+            game.play()
+        self.assertTrue(game.log_sink.file.closed)
+        self.assertTrue(self.readLines())
+
+    def test_gzip(self):
+        """
+        Test gzip sinks append members that read back as one file.
+        """
+        for round_number in range(2):
+            with GzipJsonlSink(self.path) as sink:
+                sink.write({'round': round_number})
+        self.assertEqual(self.readLines(gzip.open),
+                         [{'round': 0}, {'round': 1}])
+
+    def test_shared_sink(self):
+        """
+        Test games sharing a sink log like games with their own log file.
+        """
+        own = os.path.join(self.dir.name, 'own.jsonl')
+        for game_index in range(3):
+            playLoggedGame(game_index, log_file=own)
+        with JsonlSink(self.path) as sink:
+            for game_index in range(3):
+                playLoggedGame(game_index, log_sink=sink)
+        with open(own) as f:
+            expected = [json.loads(line) for line in f]
+        records = self.readLines()
+        self.assertEqual(records, expected)
+
+        # Players play the cards of their logged hands
+        for record in records:
+            if record == 'misdeal':
+                continue
+            for player, cards in record['cards_played'].items():
+                self.assertEqual(sorted(cards),
+                                 sorted(record['hands'][player]))
+            self.assertEqual(record['dealer'], record['table'][3])
+
+        game = playLoggedGame(0, log_sink=NullSink())
+        self.assertTrue(game.getWinner())
+
+
+if __name__ == '__main__':
+    unittest.main()
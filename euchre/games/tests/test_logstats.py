@@ -0,0 +1,123 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from euchre.cards import Card
+from euchre.cards.card import SUITS
+from euchre.games import roundrecords
+from euchre.games.logstats import LogStats
+from euchre.games.logstats import logChunks
+from euchre.games.logstats import logStats
+from euchre.games.logstats import statsChunk
+from euchre.games.tests.test_replay import AloneAIPlayer
+from euchre.games.tests.test_replay import logGames
+
+
+def countRecords(records):
+    """LogStats of JSONL records counted one by one."""
+    stats = LogStats()
+    for record in records:
+        stats.rounds += 1
+        if record == 'misdeal':
+            stats.misdeals += 1
+            continue
+        table = record['table']
+        seat = table.index(record['maker'])
+        team = {table[seat], table[(seat + 2) % 4]}
+        tricks = sum(taker in team for taker in record['takers'])
+        called = record['trump'] != Card.str2card(record['top_card']).suit
+        stats.calls[int(called), seat, SUITS.index(record['trump'])] += 1
+        stats.made[seat] += tricks >= 3
+        stats.marched[seat] += tricks == 5
+        if record['going_alone']:
+            stats.alone[seat] += 1
+            stats.alone_made[seat] += tricks >= 3
+            stats.alone_marched[seat] += tricks == 5
+        for name in record['renegers']:
+            stats.reneges[table.index(name)] += 1
+        stats.renege_rounds += bool(record['renegers'])
+    return stats
+
+
+class TestLogStats(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, 'log.jsonl')
+        logGames(cls.path, 3)
+        logGames(cls.path, 2, AloneAIPlayer)
+        with open(cls.path) as f:
+            cls.records = [json.loads(line) for line in f]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def assertStatsEqual(self, stats, expected):
+        for name in ('rounds', 'misdeals', 'renege_rounds'):
+            self.assertEqual(getattr(stats, name), getattr(expected, name))
+        for name in ('calls',) + LogStats.COUNTS:
+            np.testing.assert_array_equal(getattr(stats, name),
+                                          getattr(expected, name))
+
+    def test_chunks(self):
+        """
+        Test every line is counted once however the log is chunked.
+        """
+        expected = countRecords(self.records)
+        self.assertGreater(expected.alone.sum(), 0)
+        for chunk_bytes in (97, 777, 1 << 20):
+            stats = LogStats()
+            for chunk in logChunks(self.path, chunk_bytes):
+                stats.merge(statsChunk(*chunk))
+            self.assertStatsEqual(stats, expected)
+
+    def test_formats(self):
+        """
+        Test gzip logs and round record files count like the JSONL log.
+        """
+        expected = countRecords(self.records)
+        gz_path = os.path.join(self.tmp.name, 'log.jsonl.gz')
+        with open(self.path, 'rb') as f, gzip.open(gz_path, 'wb') as gz:
+            shutil.copyfileobj(f, gz)
+        self.assertStatsEqual(statsChunk(gz_path, 0, 0), expected)
+
+        records_path = os.path.join(self.tmp.name, 'log.rounds')
+        roundrecords.convertJsonl(self.path, records_path)
+        stats = LogStats()
+        for chunk in logChunks(records_path, 1000):
+            stats.merge(statsChunk(*chunk))
+        self.assertStatsEqual(stats, expected)
+
+    def test_long_names(self):
+        """
+        Test logs of players with names too long for round record files
+        are counted.
+        """
+        long_path = os.path.join(self.tmp.name, 'long.jsonl')
+        with open(self.path) as f, open(long_path, 'w') as out:
+            for line in f:
+                out.write(line.replace('"AI', '"' + 'x' * 40))
+        stats = LogStats()
+        for chunk in logChunks(long_path):
+            stats.merge(statsChunk(*chunk))
+        self.assertStatsEqual(stats, countRecords(self.records))
+
+    def test_workers(self):
+        """
+        Test logs counted by a pool of workers add up.
+        """
+        expected = countRecords(self.records + self.records)
+        stats = logStats([self.path, self.path], workers=2, chunk_bytes=4096)
+        self.assertStatsEqual(stats, expected)
+        self.assertIn('ordered up', stats.prettyString())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import json
+import os
+import tempfile
+import unittest
+
+from euchre import Team
+from euchre.games import StandardGame
+from euchre.games import gameRng
+from euchre.games.replay import RoundLog
+from euchre.games.replay import replayChunk
+from euchre.games.replay import replayRange
+from euchre.games.replay import replayRound
+from euchre.players.local import TableAIPlayer
+
+
+class AloneAIPlayer(TableAIPlayer):
+    """TableAIPlayer that always goes alone."""
+
+    def goAlone(self):
+        return True
+
+
+class TopDiscardAIPlayer(TableAIPlayer):
+    """TableAIPlayer that discards the top card it picks up."""
+
+    def discardCard(self, top_card):
+        return top_card
+
+
+def logGames(path, count, player_class=TableAIPlayer):
+    for game_index in range(count):
+        players = [player_class('AI' + str(i)) for i in range(4)]
+        StandardGame(Team(players[0], players[1]),
+                     Team(players[2], players[3]), log_file=path,
+                     rng=gameRng(3, game_index)).play()
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'log.jsonl')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_random_access(self):
+        """
+        Test rounds are read by number, and the index follows the log.
+        """
+        logGames(self.path, 2)
+        with open(self.path) as f:
+            lines = [json.loads(line) for line in f]
+        with RoundLog(self.path) as log:
+            self.assertEqual(len(log), len(lines))
+            for n in reversed(range(len(lines))):
+                self.assertEqual(log[n], lines[n])
+            with self.assertRaises(IndexError):
+                log[len(lines)]
+
+        logGames(self.path, 1)
+        with open(self.path) as f:
+            lines = [json.loads(line) for line in f]
+        with RoundLog(self.path) as log:
+            self.assertEqual(len(log), len(lines))
+            self.assertEqual(log[len(lines) - 1], lines[-1])
+
+        # A line still being written isn't indexed until it is complete
+        line = json.dumps(lines[-1]) + '\n'
+        with open(self.path, 'a') as f:
+            f.write(line[:10])
+        with RoundLog(self.path) as log:
+            self.assertEqual(len(log), len(lines))
+        with open(self.path, 'a') as f:
+            f.write(line[10:])
+        with RoundLog(self.path) as log:
+            self.assertEqual(len(log), len(lines) + 1)
+            self.assertEqual(log[len(lines)], lines[-1])
+
+    def test_replay_matches_log(self):
+        """
+        Test logged rounds replay the way they were logged.
+        """
+        logGames(self.path, 3)
+        logGames(self.path, 2, AloneAIPlayer)
+        with RoundLog(self.path) as log:
+            records = [log[n] for n in range(len(log))]
+        played = [record for record in records if record != 'misdeal']
+        self.assertTrue(any(record['discard'] is None for record in played))
+        self.assertTrue(any(record['discard'] is not None
+                            for record in played))
+        self.assertTrue(any(record['going_alone'] for record in played))
+
+        for record in played:
+            self.assertEqual(json.loads(json.dumps(replayRound(record))),
+                             record)
+        self.assertEqual(replayChunk(self.path, 0, len(records)), [])
+
+    def test_replay_top_card_discarded(self):
+        """
+        Test rounds where the dealer discards the top card replay.
+        """
+        logGames(self.path, 2, TopDiscardAIPlayer)
+        with RoundLog(self.path) as log:
+            records = [log[n] for n in range(len(log))]
+        self.assertTrue(any(record != 'misdeal'
+                            and record['discard'] == record['top_card']
+                            for record in records))
+        self.assertEqual(replayChunk(self.path, 0, len(records)), [])
+
+    def test_replay_finds_changed_rounds(self):
+        """
+        Test rounds that don't replay the way they were logged are found.
+        """
+        logGames(self.path, 2)
+        with open(self.path) as f:
+            records = [json.loads(line) for line in f]
+        changed = [n for n in (3, 10) if records[n] != 'misdeal']
+        for n in changed:
+            records[n]['takers'].reverse()
+            records[n]['takers'][0] = 'nobody'
+        with open(self.path, 'w') as f:
+            f.writelines(json.dumps(record) + '\n' for record in records)
+
+        # Workers open a log indexed beforehand, past its last round too
+        self.assertEqual(replayRange(self.path, 0, len(records) + 100,
+                                     workers=2, chunk_size=4), changed)
+        self.assertEqual(replayRange(self.path, workers=2, chunk_size=4),
+                         changed)
+        self.assertEqual(replayRange(self.path, 5, 12, workers=1),
+                         [n for n in changed if 5 <= n < 12])
+
+
+if __name__ == '__main__':
+    unittest.main()
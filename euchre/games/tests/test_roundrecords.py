@@ -0,0 +1,150 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from euchre.cards import Card
+from euchre.cards.card import SUITS
+from euchre.games import JsonlSink
+from euchre.games import roundrecords
+from euchre.games.roundrecords import NO_CARD
+from euchre.games.roundrecords import ROUND_DTYPE
+from euchre.games.roundrecords import RoundRecordSink
+from euchre.games.tests.test_logsink import playLoggedGame
+
+
+class TestRoundRecords(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.jsonl = os.path.join(self.dir.name, 'log.jsonl')
+        self.path = os.path.join(self.dir.name, 'log.rounds')
+        with JsonlSink(self.jsonl) as sink:
+            for game_index in range(4):
+                playLoggedGame(game_index, log_sink=sink)
+        with open(self.jsonl) as f:
+            self.records = [json.loads(line) for line in f]
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_fields(self):
+        """
+        Test records hold the rounds of the JSONL log.
+        """
+        self.assertEqual(ROUND_DTYPE.itemsize, 50)
+        count = roundrecords.convertJsonl(self.jsonl, self.path)
+        self.assertEqual(count, len(self.records))
+        names, rounds = roundrecords.readRounds(self.path)
+        self.assertEqual(len(rounds), count)
+        self.assertEqual(sorted(names), ['AI0', 'AI1', 'AI2', 'AI3'])
+
+        misdeals = roundrecords.misdeals(rounds)
+        makers = roundrecords.makerSeats(rounds)
+        trumps = roundrecords.trumpSuits(rounds)
+        alone = roundrecords.goingAlone(rounds)
+        takers = roundrecords.trickTakers(rounds)
+        for i, record in enumerate(self.records):
+            self.assertEqual(misdeals[i], record == 'misdeal')
+            if record == 'misdeal':
+                continue
+            table = [names[p] for p in rounds[i]['players']]
+            self.assertEqual(table, record['table'])
+            self.assertEqual(table[makers[i]], record['maker'])
+            self.assertEqual(SUITS[trumps[i]], record['trump'])
+            self.assertEqual(alone[i], record['going_alone'])
+            self.assertEqual([table[seat] for seat in takers[i]],
+                             record['takers'])
+            for seat, name in enumerate(table):
+                self.assertEqual(
+                    rounds[i]['hands'][seat],
+                    sum(1 << Card.str2card(card).index
+                        for card in record['hands'][name]))
+                played = [card for card in rounds[i]['cards'][:, seat]
+                          if card != NO_CARD]
+                self.assertEqual(
+                    [str(Card.fromIndex(card)) for card in played],
+                    record['cards_played'].get(name, []))
+
+    def test_sink(self):
+        """
+        Test games logging to a sink write the records of the converter
+        and appending keeps the name table.
+        """
+        roundrecords.convertJsonl(self.jsonl, self.path)
+        direct = os.path.join(self.dir.name, 'direct.rounds')
+        for game_index in range(4):
+            with RoundRecordSink(direct) as sink:
+                playLoggedGame(game_index, log_sink=sink)
+        names, rounds = roundrecords.readRounds(self.path)
+        direct_names, direct_rounds = roundrecords.readRounds(direct)
+        self.assertEqual(direct_names, names)
+        self.assertTrue(np.array_equal(direct_rounds, rounds))
+
+    def test_names(self):
+        """
+        Test names that don't fit the name table are refused whole.
+        """
+        record = next(record for record in self.records
+                      if record != 'misdeal')
+        renamed = json.loads(json.dumps(record).replace(
+            '"AI0"', json.dumps('\u00e9' * 16)))
+        name_ids = {}
+        roundrecords.encodeRound(renamed, name_ids)
+        with RoundRecordSink(self.path) as sink:
+            sink.write(renamed)
+        self.assertIn('\u00e9' * 16, roundrecords.readNames(self.path))
+
+        too_long = json.loads(json.dumps(record).replace(
+            '"AI0"', json.dumps('a' + '\u00e9' * 16)))
+        name_ids = {}
+        with self.assertRaises(ValueError):
+            roundrecords.encodeRound(too_long, name_ids)
+        self.assertEqual(name_ids, {})
+
+    def test_shared_sink(self):
+        """
+        Test threads writing to one sink write every record whole.
+        """
+        played = [record for record in self.records if record != 'misdeal']
+        with RoundRecordSink(self.path, batch_size=7) as sink:
+            threads = [threading.Thread(
+                target=lambda: [sink.write(record) for record in played])
+                for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        names, rounds = roundrecords.readRounds(self.path)
+        self.assertEqual(len(rounds), 4 * len(played))
+        expected = {roundrecords.encodeRound(record, {})[1]
+                    for record in played}
+        self.assertEqual({tuple(int(mask) for mask in hands)
+                          for hands in rounds['hands']}, expected)
+
+    def test_old_logs(self):
+        """
+        Test logs without the table order convert to the same seats.
+        """
+        old = os.path.join(self.dir.name, 'old.jsonl')
+        with open(old, 'w') as f:
+            for record in self.records:
+                if record != 'misdeal':
+                    record = dict(record, table=record['players'])
+                    for key in ['dealer', 'hands', 'discard']:
+                        del record[key]
+                f.write(json.dumps(record) + '\n')
+        roundrecords.convertJsonl(self.jsonl, self.path)
+        old_path = os.path.join(self.dir.name, 'old.rounds')
+        roundrecords.convertJsonl(old, old_path)
+        _, rounds = roundrecords.readRounds(self.path)
+        _, old_rounds = roundrecords.readRounds(old_path)
+        for field in ['players', 'cards', 'takers', 'flags', 'top_card']:
+            self.assertTrue(np.array_equal(old_rounds[field], rounds[field]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import functools
+import random
+import unittest
+
+from euchre.cards import Card
+from euchre.games import DoubleDummySolver
+from euchre.games.solver import distinctMoves
+from euchre.games.tests.test_gamestate import randomState
+
+
+@functools.lru_cache(maxsize=None)
+def minimax(state):
+    """Tricks of seats 0 and 2 with every continuation searched."""
+    if state.isTerminal():
+        return state.tricks[0]
+    values = [minimax(state.apply(move)) for move in state.legal_moves()]
+    return max(values) if state.to_move % 2 == 0 else min(values)
+
+
+def mask(names):
+    return sum(1 << Card.str2card(name).index for name in names.split())
+
+
+class TestDoubleDummySolver(unittest.TestCase):
+
+    def test_minimax(self):
+        """
+        Test solved tricks match a search of every continuation.
+        """
+        rng = random.Random(0)
+        solver = DoubleDummySolver()
+        for i in range(24):
+            state = randomState(rng, alone=i % 3 == 0)
+            # Start from later tricks and from the middle of tricks too
+            for _ in range(rng.randrange(2, 9)):
+                state = state.apply(rng.choice(state.legal_moves()))
+            tricks = solver.solveState(state)
+            self.assertEqual(tricks[0], minimax(state))
+            self.assertEqual(sum(tricks), 5)
+        minimax.cache_clear()
+
+    def test_solve(self):
+        """
+        Test a round where the maker holds every trump that matters.
+        """
+        hands = [mask('JH JD AH KH QH'), mask('9C 1C QC KC AC'),
+                 mask('9S 1S QS KS AS'), mask('9D 1D QD KD AD')]
+        solver = DoubleDummySolver()
+        self.assertEqual(solver.solve(hands, 'H', 0, 0), (5, 0))
+        self.assertEqual(solver.solve(hands, 'H', 1, 0, alone=True), (5, 0))
+        # Diamonds trump, seat 0 only takes the tricks of the bowers
+        self.assertEqual(solver.solve(hands, 'D', 0, 3), (2, 3))
+
+    def test_equivalent_moves(self):
+        """
+        Test touching cards collapse into one move.
+        """
+        # Right bower, left bower and ace of hearts touch
+        hand = mask('JH JD AH QH 9C')
+        live = hand | mask('KH 1H 9H AC')
+        moves = distinctMoves(hand, live, 'H')
+        self.assertEqual(len(moves), 3)
+        self.assertIn(Card.str2card('JH').index, moves)
+        # Once the king is played the queen touches the ace too
+        self.assertEqual(len(distinctMoves(hand, live ^ mask('KH'), 'H')), 2)
+
+    def test_move_values(self):
+        """
+        Test the best move keeps the solved tricks of the team to move.
+        """
+        rng = random.Random(1)
+        solver = DoubleDummySolver()
+        for _ in range(10):
+            state = randomState(rng)
+            team = state.to_move % 2
+            values = solver.moveValues(state)
+            self.assertEqual(set(values), set(state.legal_moves()))
+            self.assertEqual(max(values.values()),
+                             solver.solveState(state)[team])
+
+    def test_small_table(self):
+        """
+        Test a table too small for a deal still solves it exactly.
+        """
+        rng = random.Random(2)
+        states = [randomState(rng) for _ in range(20)]
+        solver = DoubleDummySolver()
+        small = DoubleDummySolver(table_bits=2)
+        for state in states:
+            self.assertEqual(small.solveState(state),
+                             solver.solveState(state))
+        self.assertEqual(len(small.table), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+
+from euchre import StandardGame
+from euchre import Team
+from euchre.games import Instrumentation
+from euchre.games import gameRng
+from euchre.games import shardRange
+from euchre.players import BasicAIPlayer
+
+
+class OrderingAIPlayer(BasicAIPlayer):
+    """BasicAIPlayer that always orders up so rounds get played."""
+
+    def orderUp(self):
+        return True
+
+
+class CountingAIPlayer(OrderingAIPlayer):
+    """OrderingAIPlayer that counts the cards it sees played."""
+
+    def __init__(self, name):
+        OrderingAIPlayer.__init__(self, name)
+        self.seen = 0
+        self.claims = 0
+
+    def playedMsg(self, player, card):
+        self.seen += 1
+
+    def claimMsg(self, plays, takers):
+        self.seen += len(plays)
+        self.claims += 1
+
+
+class TimingOutAIPlayer(OrderingAIPlayer):
+    """OrderingAIPlayer that never plays a card in time, and records the
+    time it was given."""
+
+    def __init__(self, name):
+        OrderingAIPlayer.__init__(self, name)
+        self.budgets = []
+
+    def playCard(self, leader, cards_played, trump):
+        self.budgets.append(self.remainingTime())
+        raise TimeoutError
+
+
+def playSeededGame(seed, game_index, **kwargs):
+    """Plays a seeded game and returns a summary of how it went."""
+    players = [OrderingAIPlayer('AI' + str(i)) for i in range(4)]
+    team1 = Team(players[0], players[1])
+    team2 = Team(players[2], players[3])
+    game = StandardGame(team1, team2, rng=gameRng(seed, game_index),
+                        **kwargs)
+    seating = [str(player) for player in game.gs['players']]
+    game.play()
+    return seating, team1.points, team2.points, \
+        [str(card) for card in game.gs['kitty']]
+
+
+class TestStandardGame(unittest.TestCase):
+
+    def test_game_ends(self):
+        """
+        Test a game is played until a team has at least 10 points.
+        """
+        seating, points1, points2, _ = playSeededGame(0, 0)
+        self.assertEqual(len(seating), 4)
+        self.assertTrue(max(points1, points2) >= 10)
+
+    def test_seeded_games_reproduce(self):
+        """
+        Test games with the same seed and index are identical.
+        """
+        for game_index in range(5):
+            self.assertEqual(playSeededGame(7, game_index),
+                             playSeededGame(7, game_index))
+        games = [playSeededGame(7, game_index) for game_index in range(5)]
+        self.assertNotEqual(games[0], games[1])
+
+    def test_subscriptions(self):
+        """
+        Test only consumed notifications are subscribed to.
+        """
+        silent = OrderingAIPlayer('AI0')
+        counting = CountingAIPlayer('AI1')
+        players = [silent, counting, OrderingAIPlayer('AI2'),
+                   OrderingAIPlayer('AI3')]
+        game = StandardGame(Team(players[0], players[1]),
+                            Team(players[2], players[3]), rng=gameRng(0, 0))
+        self.assertEqual(game.subscribers['takerMsg'], [])
+        self.assertEqual(game.subscribers['playedMsg'], [counting])
+        game.play()
+        self.assertTrue(counting.seen > 0)
+
+    def test_claims(self):
+        """
+        Test claiming decided endings scores like playing them out.
+        """
+        for game_index in range(10):
+            self.assertEqual(playSeededGame(3, game_index, claims=True),
+                             playSeededGame(3, game_index))
+
+        counting = CountingAIPlayer('AI1')
+        players = [OrderingAIPlayer('AI0'), counting, OrderingAIPlayer('AI2'),
+                   OrderingAIPlayer('AI3')]
+        game = StandardGame(Team(players[0], players[1]),
+                            Team(players[2], players[3]), rng=gameRng(0, 0),
+                            claims=True)
+        game.play()
+        self.assertTrue(counting.claims > 0)
+
+    def test_deadlines(self):
+        """
+        Test players that time out are played for by the fallback and late
+        answers are counted.
+        """
+        slow = TimingOutAIPlayer('AI0')
+        players = [slow, OrderingAIPlayer('AI1'), OrderingAIPlayer('AI2'),
+                   OrderingAIPlayer('AI3')]
+        game = StandardGame(Team(players[0], players[1]),
+                            Team(players[2], players[3]), rng=gameRng(0, 0),
+                            reneges='enforce',
+                            instrumentation=Instrumentation(),
+                            deadlines={'playCard': 5.0, 'goAlone': 0.0})
+        game.play()
+        self.assertTrue(max(team.points for team in game.gs['teams']) >= 10)
+        self.assertTrue(all(0.0 < budget <= 5.0 for budget in slow.budgets))
+        self.assertEqual(slow.deadline, None)
+        # Every card of the slow player and every goAlone is a miss
+        rounds = sum(histogram.count for (_, kind), histogram
+                     in game.instrumentation.decisions.items()
+                     if kind == 'goAlone')
+        self.assertTrue(rounds > 0)
+        self.assertEqual(sum(game.deadline_misses.values()),
+                         len(slow.budgets) + rounds)
+
+    def test_shards(self):
+        """
+        Test shards cover every game exactly once.
+        """
+        for n_shards in [1, 3, 4, 7]:
+            indexes = []
+            for shard in range(n_shards):
+                indexes.extend(shardRange(10, n_shards, shard))
+            self.assertEqual(indexes, list(range(10)))
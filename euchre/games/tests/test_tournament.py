@@ -0,0 +1,57 @@
+import pickle
+import unittest
+
+from euchre.games.tournament import PlayerFactory
+from euchre.games.tournament import playChunk
+from euchre.games.tournament import runTournament
+from euchre.players import TableAIPlayer
+
+ORDERING = 'euchre.games.tests.test_standardgame:OrderingAIPlayer'
+
+
+class TestTournament(unittest.TestCase):
+
+    def test_player_factory(self):
+        """
+        Test factories survive pickling and create players by class path.
+        """
+        factory = pickle.loads(pickle.dumps(
+            PlayerFactory('euchre.players.TableAIPlayer', threshold=0.5)))
+        player = factory('AI')
+        self.assertIsInstance(player, TableAIPlayer)
+        self.assertEqual(player.threshold, 0.5)
+        self.assertEqual(str(factory), 'TableAIPlayer')
+        self.assertEqual(str(PlayerFactory(ORDERING)), 'OrderingAIPlayer')
+
+    def test_results_independent_of_workers(self):
+        """
+        Test results only depend on the seed, not on chunks or workers.
+        """
+        factories = (PlayerFactory(ORDERING), PlayerFactory(ORDERING))
+        serial = playChunk(factories, 5, 0, 12)
+        reported = []
+        pooled = runTournament(factories, 12, seed=5, workers=2, chunk_size=5,
+                               callback=lambda r: reported.append(r.games))
+        self.assertEqual(pooled.games, 12)
+        self.assertEqual(sum(pooled.wins), 12)
+        self.assertEqual(pooled.wins, serial.wins)
+        self.assertEqual(pooled.points, serial.points)
+        self.assertEqual(sorted(reported)[-1], 12)
+        self.assertEqual(len(reported), 3)
+
+    def test_stateful_players(self):
+        """
+        Test players seeding themselves play the same games in any chunks.
+        """
+        pimc = PlayerFactory('euchre.players.PIMCPlayer', seed=1,
+                             max_samples=2, time_budget=60.0)
+        factories = (pimc, PlayerFactory('euchre.players.TableAIPlayer'))
+        whole = playChunk(factories, 2, 0, 3)
+        split = playChunk(factories, 2, 0, 1)
+        split.merge(playChunk(factories, 2, 1, 3))
+        self.assertEqual(split.wins, whole.wins)
+        self.assertEqual(split.points, whole.points)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import random
+import unittest
+
+import numpy as np
+
+from euchre.cards import CARDS
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import trick_winner
+from euchre.cards.card import SUITS
+from euchre.games import TrumpCountPolicy
+from euchre.games import VectorizedGames
+from euchre.games import VectorPolicy
+from euchre.games.vectorized import STRENGTH_ORDER
+from euchre.games.vectorized import strengthMasks
+
+
+class TestVectorizedGames(unittest.TestCase):
+
+    def test_games_end(self):
+        """
+        Test every game is played until a team has at least 10 points.
+        """
+        games = VectorizedGames(500, [TrumpCountPolicy()] * 4,
+                                np.random.default_rng(0))
+        winners = games.play()
+        self.assertTrue((games.points.max(axis=1) >= 10).all())
+        self.assertTrue((games.points[np.arange(500), winners] >= 10).all())
+        self.assertEqual(set(np.unique(winners)), {0, 1})
+
+    def test_seeded_games_reproduce(self):
+        """
+        Test games with the same seed are identical.
+        """
+        results = []
+        for _ in range(2):
+            games = VectorizedGames(100, [TrumpCountPolicy()] * 4,
+                                    np.random.default_rng(3))
+            games.play()
+            results.append((games.points.copy(), games.rounds.copy()))
+        np.testing.assert_array_equal(results[0][0], results[1][0])
+        np.testing.assert_array_equal(results[0][1], results[1][1])
+
+    def test_misdeal(self):
+        """
+        Test a round where everyone passes scores nothing.
+        """
+        games = VectorizedGames(50, [VectorPolicy()] * 4)
+        dealers = games.dealer.copy()
+        games.playRound()
+        np.testing.assert_array_equal(games.misdeals, 1)
+        np.testing.assert_array_equal(games.points, 0)
+        np.testing.assert_array_equal(games.dealer, (dealers + 1) % 4)
+
+        # Policies that never make trump would play forever
+        with self.assertRaises(RuntimeError):
+            games.play(max_misdeals=20)
+
+    def test_strength_order(self):
+        """
+        Test relabelled hands hold the same cards.
+        """
+        rng = random.Random(0)
+        for _ in range(100):
+            trump = rng.randrange(4)
+            indexes = rng.sample(range(24), 5)
+            mask = sum(1 << i for i in indexes)
+            relabelled = int(strengthMasks(np.array([mask]), trump)[0])
+            bits = [p for p in range(24) if (relabelled >> p) & 1]
+            self.assertEqual(sorted(STRENGTH_ORDER[trump][bits]),
+                             sorted(indexes))
+
+    def test_trick_resolution(self):
+        """
+        Test tricks go to the same seat as with trick_winner.
+        """
+        rng = np.random.default_rng(1)
+        n = 200
+        games = VectorizedGames(n, [VectorPolicy()] * 4, rng)
+        games.dealPhase(np.arange(n))
+        games.trump[:] = rng.integers(0, 4, n)
+        games.maker[:] = 0
+        hands = games.hands.copy()
+        games.hands[:] = strengthMasks(hands, games.trump[:, None])
+        leader = rng.integers(0, 4, n)
+        taker = games.playTrick(np.arange(n), leader)
+
+        # VectorPolicy plays the weakest legal card, replay it with Cards
+        for game in range(n):
+            trump = SUITS[games.trump[game]]
+            played = []
+            for k in range(4):
+                seat = (leader[game] + k) % 4
+                before = int(strengthMasks(hands[game, seat],
+                                           games.trump[game]))
+                after = int(games.hands[game, seat])
+                bit = (before ^ after).bit_length() - 1
+                played.append(CARDS[STRENGTH_ORDER[games.trump[game]][bit]])
+            led = EFFECTIVE_SUITS[trump][played[0].index]
+            self.assertEqual(taker[game],
+                             (leader[game] + trick_winner(played, led, trump))
+                             % 4)
+
+    def test_scoring(self):
+        """
+        Test points for making, marching, going alone and euchres.
+        """
+        games = VectorizedGames(5, [VectorPolicy()] * 4)
+        games.maker[:] = [0, 1, 2, 3, 0]
+        games.alone[:] = [False, False, True, False, False]
+        games.tricks[:] = [[3, 2], [0, 5], [5, 0], [3, 2], [0, 5]]
+        games.reneged[:] = False
+        games.reneged[4] = [False, True]
+        games.scoreRound(np.arange(5))
+        np.testing.assert_array_equal(
+            games.points, [[1, 0], [0, 2], [4, 0], [2, 0], [2, 0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
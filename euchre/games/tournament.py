@@ -0,0 +1,218 @@
+"""Runs large AI matchups across worker processes.
+
+Games are split into chunks of consecutive game indexes and each chunk is
+played by a worker process. Players are created inside the workers by
+PlayerFactory objects, so only the factories are pickled. Every game gets
+its own seeded generator (see euchre.games.seeding) and its own freshly
+created players, so the results don't depend on the number of workers or
+on how the games are chunked, even for players that keep state or seed
+themselves.
+"""
+import concurrent.futures
+import importlib
+import time
+
+import click
+
+from euchre.games.instrumentation import Instrumentation
+from euchre.games.seeding import gameRng
+from euchre.games.standardgame import StandardGame
+from euchre.players.team import Team
+
+
+class PlayerFactory:
+    """Picklable recipe for creating players in another process.
+
+    Args:
+        class_path (str): Import path of the Player class, like
+            'euchre.players.TableAIPlayer' or 'package.module:ClassName'
+        kwargs (dict): Keyword arguments passed to the class after the name
+    """
+
+    def __init__(self, class_path, **kwargs):
+        self.class_path = class_path
+        self.kwargs = kwargs
+
+    def playerClass(self):
+        """Imports the Player class.
+
+        Returns:
+            (type): The class at class_path
+        """
+        if ':' in self.class_path:
+            module_name, class_name = self.class_path.split(':', 1)
+        else:
+            module_name, _, class_name = self.class_path.rpartition('.')
+        if not module_name:
+            raise ValueError(f"{self.class_path} is not a module path")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    def __call__(self, name):
+        return self.playerClass()(name, **self.kwargs)
+
+    def __str__(self):
+        return self.class_path.replace(':', '.').rpartition('.')[2]
+
+
+class TournamentResults:
+    """Aggregated results of a set of games between two teams.
+
+    Attributes:
+        games (int): Number of games played
+        wins (list): Games won by each team
+        points (list): Points scored by each team over all games
+        seconds (float): Time spent playing the games, summed over workers
+        instrumentation (Instrumentation): Timings of the games, None if
+            they weren't timed
+    """
+
+    def __init__(self, games=0, wins=None, points=None, seconds=0.0,
+                 instrumentation=None):
+        self.games = games
+        self.wins = wins if wins is not None else [0, 0]
+        self.points = points if points is not None else [0, 0]
+        self.seconds = seconds
+        self.instrumentation = instrumentation
+
+    def merge(self, other):
+        """Adds the results of other to these results."""
+        self.games += other.games
+        for team in range(2):
+            self.wins[team] += other.wins[team]
+            self.points[team] += other.points[team]
+        self.seconds += other.seconds
+        if other.instrumentation is not None:
+            if self.instrumentation is None:
+                self.instrumentation = Instrumentation()
+            self.instrumentation.merge(other.instrumentation)
+
+    def winRate(self, team):
+        """Fraction of the games won by a team.
+
+        Args:
+            team (int): 0 for the first team, 1 for the second
+
+        Returns:
+            (float): Win rate, 0 if no game was played
+        """
+        return self.wins[team] / self.games if self.games else 0.0
+
+    def prettyString(self, names=('team1', 'team2')):
+        """Summary of the results on one line."""
+        games = max(self.games, 1)
+        return (f"{self.games} games  "
+                f"{names[0]} {self.winRate(0):.1%} "
+                f"({self.points[0] / games:.2f} pts/game)  "
+                f"{names[1]} {self.winRate(1):.1%} "
+                f"({self.points[1] / games:.2f} pts/game)")
+
+
+def playChunk(factories, seed, start, stop, instrument=False):
+    """Plays a chunk of seeded games in the current process.
+
+    The four players are created for every game, so no state carries over
+    from one game to the next, factories[0] plays for the first team and
+    factories[1] for the second.
+
+    Args:
+        factories (tuple): Two PlayerFactory, one per team
+        seed (int): Root seed of the tournament
+        start, stop (int): Range of game indexes to play
+        instrument (bool): Whether to time the phases and decisions of the
+            games, see euchre.games.instrumentation
+
+    Returns:
+        (TournamentResults): Results of the chunk
+    """
+    results = TournamentResults(
+        instrumentation=Instrumentation() if instrument else None)
+    begin = time.perf_counter()
+    for game_index in range(start, stop):
+        players = [factories[team](f"{factories[team]}{team}{i}")
+                   for team in range(2) for i in range(2)]
+        team1 = Team(players[0], players[1])
+        team2 = Team(players[2], players[3])
+        game = StandardGame(team1, team2, rng=gameRng(seed, game_index),
+                            instrumentation=results.instrumentation)
+        game.play()
+        results.games += 1
+        results.wins[0 if game.getWinner() is team1 else 1] += 1
+        results.points[0] += team1.points
+        results.points[1] += team2.points
+    results.seconds = time.perf_counter() - begin
+    return results
+
+
+def runTournament(factories, n_games, seed=0, workers=None, chunk_size=100,
+                  callback=None, instrument=False):
+    """Plays games between two teams across a pool of worker processes.
+
+    Args:
+        factories (tuple): Two PlayerFactory, one per team
+        n_games (int): Number of games to play
+        seed (int): Root seed, game i is played with gameRng(seed, i)
+        workers (int): Number of worker processes, default is the CPU count
+        chunk_size (int): Number of games per task
+        callback (function): Called with the aggregated TournamentResults
+            every time a chunk finishes
+        instrument (bool): Whether to time the phases and decisions of the
+            games, the merged timings are in the results' instrumentation
+
+    Returns:
+        (TournamentResults): Results of all the games
+    """
+    results = TournamentResults()
+    chunks = [(i, min(i + chunk_size, n_games))
+              for i in range(0, n_games, chunk_size)]
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(playChunk, tuple(factories), seed, i, j,
+                                   instrument)
+                   for i, j in chunks]
+        for future in concurrent.futures.as_completed(futures):
+            results.merge(future.result())
+            if callback is not None:
+                callback(results)
+    return results
+
+
+@click.command()
+@click.argument("team1")
+@click.argument("team2")
+@click.option("--games", "-n", "n_games", default=1000)
+@click.option("--seed", "seed", default=0)
+@click.option("--workers", "workers", default=None, type=int)
+@click.option("--chunk-size", "chunk_size", default=100)
+@click.option("--profile", "profile", is_flag=True)
+def main(team1, team2, n_games, seed, workers, chunk_size, profile):
+    """Plays N_GAMES between two teams of AI players.
+
+    TEAM1 and TEAM2 are the import paths of the Player class of each team,
+    like euchre.players.TableAIPlayer. With --profile, the time spent in
+    each phase and in each decision of the players is printed at the end.
+    """
+    factories = (PlayerFactory(team1), PlayerFactory(team2))
+    names = tuple(str(factory) for factory in factories)
+    begin = time.perf_counter()
+    last_report = begin
+
+    def report(results):
+        # Report at most once a second, and always for the last chunk
+        nonlocal last_report
+        now = time.perf_counter()
+        if now - last_report < 1.0 and results.games < n_games:
+            return
+        last_report = now
+        print(f"{results.prettyString(names)}  "
+              f"{results.games / (now - begin):.0f} games/s")
+
+    results = runTournament(factories, n_games, seed, workers, chunk_size,
+                            report, profile)
+    elapsed = time.perf_counter() - begin
+    print(f"done in {elapsed:.1f}s, "
+          f"{results.seconds / max(elapsed, 1e-9):.1f}x parallel speedup")
+    if results.instrumentation is not None:
+        print(results.instrumentation.prettyString())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,530 @@
+"""Lockstep simulator for many AI-only games of euchre.
+
+VectorizedGames holds the state of N games in NumPy arrays and advances
+every game together, one bidding turn or one card at a time. Suits are
+indexes into euchre.cards.card.SUITS and seats are 0 to 3, where seats 0 and
+2 are team 0 and seats 1 and 3 are team 1.
+
+Hands are 24-bit masks. While bidding, bit i of a hand is the card with
+index i (see Card.index). Once trump is made the hands are relabelled in
+strength order: bit p is the card STRENGTH_ORDER[trump][p], the cards that
+aren't trump come first from weakest to strongest and the 7 trump cards are
+the top bits. Within a suit a higher bit always takes a lower one, so most
+card play decisions come down to a lowest or highest set bit.
+
+The rules match StandardGame: ordering up and calling trump, the dealer
+discarding after picking up the top card, misdeals when everyone passes,
+going alone, reneges penalized at the end of the round and games played
+until a team has at least 10 points.
+
+Players are vectorized policies, see VectorPolicy.
+"""
+import numpy as np
+
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import TRICK_RANKS
+from euchre.cards import Deck
+from euchre.cards.card import SUITS
+
+CARD_BITS = np.int64(1) << np.arange(24, dtype=np.int64)
+CARD_SUITS = np.arange(24, dtype=np.int64) // 6
+
+
+def _strengthOrder(trump):
+    """Card indexes ordered by strength, trump cards last."""
+    effective = EFFECTIVE_SUITS[trump]
+
+    def key(index):
+        suit = effective[index]
+        return (suit == trump, TRICK_RANKS[trump][suit][index],
+                SUITS.index(suit))
+    return sorted(range(24), key=key)
+
+
+# STRENGTH_ORDER[trump][p] is the card index of bit p in strength order
+STRENGTH_ORDER = np.array([_strengthOrder(trump) for trump in SUITS],
+                          dtype=np.int64)
+TRUMP_BITS = ((1 << 7) - 1) << 17
+
+# Flat tables indexed by trump * 4 + suit and trump * 24 + bit
+STRENGTH_SUIT_MASKS = np.array(
+    [[sum(1 << p for p, index in enumerate(STRENGTH_ORDER[t])
+          if EFFECTIVE_SUITS[trump][index] == suit) for suit in SUITS]
+     for t, trump in enumerate(SUITS)], dtype=np.int64).ravel()
+STRENGTH_SUITS = np.array(
+    [[SUITS.index(EFFECTIVE_SUITS[trump][index])
+      for index in STRENGTH_ORDER[t]] for t, trump in enumerate(SUITS)],
+    dtype=np.int64).ravel()
+
+
+def _relabelTable():
+    """Strength order masks of each byte of a card index mask, indexed by
+    (trump * 3 + byte) * 256 + value."""
+    table = np.zeros((4, 3, 256), dtype=np.int64)
+    for t in range(4):
+        positions = np.argsort(STRENGTH_ORDER[t])
+        for byte in range(3):
+            for value in range(256):
+                table[t, byte, value] = sum(
+                    1 << int(positions[byte * 8 + i])
+                    for i in range(8) if (value >> i) & 1)
+    return table.ravel()
+
+
+_RELABEL = _relabelTable()
+_POPCOUNT_8 = np.array([bin(i).count('1') for i in range(256)],
+                       dtype=np.int64)
+
+
+def popcount(masks):
+    """Number of cards in each mask."""
+    return (_POPCOUNT_8[masks & 255] + _POPCOUNT_8[(masks >> 8) & 255]
+            + _POPCOUNT_8[(masks >> 16) & 255])
+
+
+def lowestBit(masks):
+    """Position of the lowest set bit of each non-empty mask."""
+    return np.frexp(masks & -masks)[1] - 1
+
+
+def highestBit(masks):
+    """Position of the highest set bit of each non-empty mask."""
+    return np.frexp(masks)[1] - 1
+
+
+def strengthMasks(masks, trump):
+    """Relabels card index masks in strength order.
+
+    Args:
+        masks (numpy.ndarray): Masks of card indexes
+        trump (numpy.ndarray): Trump suit of each mask
+
+    Returns:
+        (numpy.ndarray): Masks in strength order
+    """
+    base = trump * 768
+    return (_RELABEL[base + (masks & 255)]
+            | _RELABEL[base + 256 + ((masks >> 8) & 255)]
+            | _RELABEL[base + 512 + (masks >> 16)])
+
+
+def trumpMasks(masks, trump):
+    """Trump cards of card index masks, left bower included."""
+    left_bower = CARD_BITS[(trump ^ 1) * 6 + 3]
+    return masks & ((np.int64(63) << (trump * 6)) | left_bower)
+
+
+class VectorPolicy:
+    """Vectorized player policy.
+
+    Every method decides for a batch of games at once. games are the indexes
+    of the deciding games, seats the seat deciding in each of them and
+    engine the VectorizedGames, whose arrays can be read by indexing them
+    with games (hands with games and seats). Extra arguments are aligned
+    with games.
+
+    The base policy always passes, discards the top card, plays its weakest
+    legal card and never goes alone.
+    """
+
+    def orderUp(self, engine, games, seats):
+        """
+        Returns:
+            (numpy.ndarray): bool, True to order up the top card
+        """
+        return np.zeros(len(games), dtype=bool)
+
+    def callTrump(self, engine, games, seats):
+        """
+        Returns:
+            (numpy.ndarray): Suit to call, -1 to pass. Calling the suit of
+                the top card counts as passing
+        """
+        return np.full(len(games), -1, dtype=np.int64)
+
+    def goAlone(self, engine, games, seats):
+        """Called on the maker once trump is made.
+
+        Returns:
+            (numpy.ndarray): bool, True to go alone
+        """
+        return np.zeros(len(games), dtype=bool)
+
+    def discard(self, engine, games, seats):
+        """Called on the dealer once the top card is ordered up, the hands
+        don't hold the top card yet.
+
+        Returns:
+            (numpy.ndarray): Card index to discard, can be the top card
+        """
+        return engine.top_card[games]
+
+    def playCard(self, engine, games, seats, legal, led, best, winner):
+        """
+        Args:
+            legal (numpy.ndarray): Masks in strength order of the cards that
+                can be played without reneging
+            led (numpy.ndarray): Effective suit led, -1 when leading
+            best (numpy.ndarray): Bit of the card taking the trick, -1 when
+                leading
+            winner (numpy.ndarray): Seat taking the trick
+
+        Returns:
+            (numpy.ndarray): Bit in strength order of the card to play,
+                anything in the hand is accepted but cards outside of legal
+                are reneges
+        """
+        return lowestBit(legal)
+
+
+class TrumpCountPolicy(VectorPolicy):
+    """Makes trump with enough trump cards and plays to win tricks.
+
+    Orders up or calls the suit it holds the most trump of when it holds at
+    least min_trump of them, and goes alone with alone_trump. Discards its
+    weakest card that isn't trump, leads its strongest card and when
+    following plays the weakest card that takes the trick, or its weakest
+    card if it can't or its partner is already taking the trick.
+    """
+
+    def __init__(self, min_trump=3, alone_trump=5):
+        self.min_trump = min_trump
+        self.alone_trump = alone_trump
+
+    def orderUp(self, engine, games, seats):
+        trump = CARD_SUITS[engine.top_card[games]]
+        count = popcount(trumpMasks(engine.hands[games, seats], trump))
+        # The dealer gets the top card
+        count += seats == engine.dealer[games]
+        return count >= self.min_trump
+
+    def callTrump(self, engine, games, seats):
+        hands = engine.hands[games, seats]
+        counts = np.stack([popcount(trumpMasks(hands, suit))
+                           for suit in range(4)], axis=1)
+        rows = np.arange(len(games))
+        counts[rows, CARD_SUITS[engine.top_card[games]]] = -1
+        best = counts.argmax(axis=1)
+        return np.where(counts[rows, best] >= self.min_trump, best, -1)
+
+    def goAlone(self, engine, games, seats):
+        count = popcount(engine.hands[games, seats] & TRUMP_BITS)
+        return count >= self.alone_trump
+
+    def discard(self, engine, games, seats):
+        trump = engine.trump[games]
+        hands = engine.hands[games, seats] | CARD_BITS[engine.top_card[games]]
+        hands = strengthMasks(hands, trump)
+        off_trump = hands & ~TRUMP_BITS
+        bits = lowestBit(np.where(off_trump != 0, off_trump, hands))
+        return STRENGTH_ORDER.ravel()[trump * 24 + bits]
+
+    def playCard(self, engine, games, seats, legal, led, best, winner):
+        strongest = highestBit(legal)
+        if np.all(led < 0):
+            return strongest
+
+        # Cards of the led suit above the best card, or higher trump
+        trump = engine.trump[games]
+        partner = (winner - seats) % 2 == 0
+        above = ~((np.int64(2) << np.maximum(best, 0)) - 1)
+        takers = (STRENGTH_SUIT_MASKS[trump * 4 + np.maximum(led, 0)]
+                  | TRUMP_BITS)
+        winning = np.where(partner, 0, legal & above & takers)
+        weakest = lowestBit(np.where(winning != 0, winning, legal))
+        return np.where(led < 0, strongest, weakest)
+
+
+class VectorizedGames:
+    """N games of euchre played in lockstep.
+
+    Args:
+        n_games (int): Number of games
+        policies (list): VectorPolicy for each of the 4 seats, the same
+            policy can play several seats
+        rng (numpy.random.Generator): Random generator for dealers and
+            deals, default is a freshly seeded generator
+
+    Attributes:
+        points (numpy.ndarray): (n, 2) points of each team
+        dealer (numpy.ndarray): Seat of the current dealer
+        hands (numpy.ndarray): (n, 4) masks of the hands by seat, in
+            strength order once trump is made
+        top_card (numpy.ndarray): Card index turned up in the kitty
+        trump (numpy.ndarray): Trump suit, -1 before it is made
+        maker (numpy.ndarray): Seat of the maker, -1 before trump is made
+        alone (numpy.ndarray): Whether the maker is going alone
+        tricks (numpy.ndarray): (n, 2) tricks taken by each team this round
+        reneged (numpy.ndarray): (n, 2) teams that reneged this round
+        rounds (numpy.ndarray): Rounds dealt, misdeals included
+        misdeals (numpy.ndarray): Rounds where everyone passed
+    """
+
+    def __init__(self, n_games, policies, rng=None):
+        if len(policies) != 4:
+            raise AssertionError("Euchre requires 4 players to play")
+        self.n_games = n_games
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.policies = list(policies)
+
+        # Seats played by each distinct policy
+        self._policy_seats = {}
+        for seat, policy in enumerate(self.policies):
+            self._policy_seats.setdefault(id(policy), (policy, []))[1] \
+                .append(seat)
+
+        n = n_games
+        self.points = np.zeros((n, 2), dtype=np.int64)
+        self.dealer = self.rng.integers(0, 4, n)
+        self.hands = np.zeros((n, 4), dtype=np.int64)
+        self.top_card = np.zeros(n, dtype=np.int64)
+        self.trump = np.full(n, -1, dtype=np.int64)
+        self.maker = np.full(n, -1, dtype=np.int64)
+        self.alone = np.zeros(n, dtype=bool)
+        self.tricks = np.zeros((n, 2), dtype=np.int64)
+        self.reneged = np.zeros((n, 2), dtype=bool)
+        self.rounds = np.zeros(n, dtype=np.int64)
+        self.misdeals = np.zeros(n, dtype=np.int64)
+
+    @property
+    def active(self):
+        """Games that haven't been won yet."""
+        return self.points.max(axis=1) < 10
+
+    def _decide(self, method, games, seats, *args):
+        """Asks the policy of each seat for a decision in a batch of games.
+
+        Args:
+            method (str): Name of the VectorPolicy method
+            games (numpy.ndarray): Games deciding
+            seats (numpy.ndarray): Seat deciding in each game
+            args (numpy.ndarray): Extra arguments aligned with games
+
+        Returns:
+            (numpy.ndarray): Decisions aligned with games
+        """
+        if len(self._policy_seats) == 1:
+            policy, _ = next(iter(self._policy_seats.values()))
+            return np.asarray(getattr(policy, method)(self, games, seats,
+                                                      *args))
+        result = None
+        for policy, policy_seats in self._policy_seats.values():
+            select = np.isin(seats, policy_seats)
+            if not select.any():
+                continue
+            decision = np.asarray(getattr(policy, method)(
+                self, games[select], seats[select],
+                *[arg[select] for arg in args]))
+            if result is None:
+                result = np.empty(len(games), dtype=decision.dtype)
+            result[select] = decision
+        return result
+
+    # Phases of a round
+    # -------------------------------------------------------------------------
+    def dealPhase(self, games):
+        """Deals new hands to a batch of games."""
+        deals = Deck.deal_batch(len(games), self.rng).astype(np.int64)
+        hands, up_cards, _ = Deck.splitBatch(deals)
+        masks = CARD_BITS[hands].sum(axis=2)
+        for k in range(4):
+            seats = (self.dealer[games] + 1 + k) % 4
+            self.hands[games, seats] = masks[:, k]
+        self.top_card[games] = up_cards
+        self.trump[games] = -1
+        self.maker[games] = -1
+        self.alone[games] = False
+        self.tricks[games] = 0
+        self.reneged[games] = False
+        self.rounds[games] += 1
+
+    def orderPhase(self, games):
+        """Asks players to order up the top card, starting left of dealer."""
+        undecided = games
+        for k in range(4):
+            if len(undecided) == 0:
+                break
+            seats = (self.dealer[undecided] + 1 + k) % 4
+            ordered = self._decide('orderUp', undecided, seats).astype(bool)
+            made = undecided[ordered]
+            self.maker[made] = seats[ordered]
+            self.trump[made] = CARD_SUITS[self.top_card[made]]
+            undecided = undecided[~ordered]
+
+        # Dealers pick up the top card and discard
+        ordered = games[self.maker[games] >= 0]
+        if len(ordered):
+            dealers = self.dealer[ordered]
+            discards = self._decide('discard', ordered, dealers)
+            hands = (self.hands[ordered, dealers]
+                     | CARD_BITS[self.top_card[ordered]])
+            if np.any(hands & CARD_BITS[discards] == 0):
+                raise ValueError("Dealer discarded a card it doesn't hold")
+            self.hands[ordered, dealers] = hands ^ CARD_BITS[discards]
+
+    def trumpPhase(self, games):
+        """Asks players to call trump, starting left of dealer."""
+        undecided = games
+        for k in range(4):
+            if len(undecided) == 0:
+                break
+            seats = (self.dealer[undecided] + 1 + k) % 4
+            calls = self._decide('callTrump', undecided, seats)
+            valid = ((calls >= 0) & (calls < 4)
+                     & (calls != CARD_SUITS[self.top_card[undecided]]))
+            made = undecided[valid]
+            self.maker[made] = seats[valid]
+            self.trump[made] = calls[valid]
+            undecided = undecided[~valid]
+
+    def playTricks(self, games):
+        """Plays the 5 tricks of a round."""
+        trump = self.trump[games]
+        self.hands[games] = strengthMasks(self.hands[games], trump[:, None])
+
+        makers = self.maker[games]
+        self.alone[games] = self._decide('goAlone', games, makers)
+
+        # Games with a player going alone skip a seat, play them apart so
+        # the others play every seat without any masking
+        alone = self.alone[games]
+        for group, sitting_out in [(games[~alone], None),
+                                   (games[alone], (makers[alone] + 2) % 4)]:
+            if len(group) == 0:
+                continue
+            leader = (self.dealer[group] + 1) % 4
+            if sitting_out is not None:
+                leader = np.where(leader == sitting_out, (leader + 1) % 4,
+                                  leader)
+            for _ in range(5):
+                leader = self.playTrick(group, leader, sitting_out)
+
+    def playTrick(self, games, leader, sitting_out=None):
+        """Plays one trick in a batch of games.
+
+        Args:
+            games (numpy.ndarray): Games playing the trick
+            leader (numpy.ndarray): Seat leading in each game
+            sitting_out (numpy.ndarray): Seat of the partner of the player
+                going alone in each game, None if nobody is
+
+        Returns:
+            (numpy.ndarray): Seat that took the trick in each game
+        """
+        flat_hands = self.hands.reshape(-1)
+        suit_base = self.trump[games] * 4
+        led = np.full(len(games), -1)
+        best = np.full(len(games), -1)
+        winner = leader
+        for k in range(4):
+            seats = (leader + k) % 4
+            if sitting_out is not None:
+                playing = seats != sitting_out
+                g, s, t = games[playing], seats[playing], suit_base[playing]
+                l, b, w = led[playing], best[playing], winner[playing]
+            else:
+                g, s, t, l, b, w = games, seats, suit_base, led, best, winner
+
+            # Cards following the led suit, or the whole hand if none do
+            rows = g * 4 + s
+            hands = flat_hands[rows]
+            if k == 0:
+                legal = hands
+            else:
+                following = hands & STRENGTH_SUIT_MASKS[t + l]
+                legal = np.where(following != 0, following, hands)
+
+            bits = self._decide('playCard', g, s, legal, l, b, w)
+            cards = np.int64(1) << bits
+            if np.any(hands & cards == 0):
+                raise ValueError("Policy played a card it doesn't hold")
+            flat_hands[rows] = hands ^ cards
+            renege = legal & cards == 0
+            if renege.any():
+                self.reneged[g[renege], s[renege] % 2] = True
+
+            # Trump takes the led suit and higher bits take lower ones
+            if k == 0:
+                l = STRENGTH_SUITS[t * 6 + bits]
+            takes = (bits > b) & (((cards & STRENGTH_SUIT_MASKS[t + l]) != 0)
+                                  | (bits >= 17))
+            b = np.where(takes, bits, b)
+            w = np.where(takes, s, w)
+
+            if sitting_out is not None:
+                led, best, winner = led.copy(), best.copy(), winner.copy()
+                led[playing], best[playing], winner[playing] = l, b, w
+            else:
+                led, best, winner = l, b, w
+
+        self.tricks[games, winner % 2] += 1
+        return winner
+
+    def scoreRound(self, games):
+        """Scores a round, penalizing reneges like StandardGame.penalize."""
+        reneged = self.reneged[games]
+        alone = self.alone[games]
+
+        # Teams that didn't renege get 2 points, 4 if the maker went alone
+        penalized = reneged.any(axis=1)
+        penalty = np.where(alone, 4, 2)[:, None] * ~reneged
+        self.points[games] += np.where(penalized[:, None], penalty, 0)
+
+        # Score rounds without reneges
+        scored = games[~penalized]
+        maker_team = self.maker[scored] % 2
+        maker_tricks = self.tricks[scored, maker_team]
+        made = maker_tricks >= 3
+        points = np.where(maker_tricks == 5,
+                          np.where(self.alone[scored], 4, 2), 1)
+        self.points[scored[made], maker_team[made]] += points[made]
+        self.points[scored[~made], 1 - maker_team[~made]] += 2
+
+    def playRound(self):
+        """Plays a round in every active game.
+
+        Returns:
+            (int): Number of games that played the round
+        """
+        games = np.flatnonzero(self.active)
+        if len(games) == 0:
+            return 0
+        self.dealPhase(games)
+        self.orderPhase(games)
+        self.trumpPhase(games[self.maker[games] < 0])
+
+        # Everyone passed, misdeal
+        self.misdeals[games[self.maker[games] < 0]] += 1
+
+        made = games[self.maker[games] >= 0]
+        if len(made):
+            self.playTricks(made)
+            self.scoreRound(made)
+
+        self.dealer[games] = (self.dealer[games] + 1) % 4
+        return len(games)
+
+    def play(self, max_misdeals=1000):
+        """Plays every game until a team reaches 10 points.
+
+        Args:
+            max_misdeals (int): Misdeals in a row after which a game is
+                taken to never end, like games of policies that always pass
+
+        Returns:
+            (numpy.ndarray): Winning team of each game, 0 for seats 0 and 2
+                and 1 for seats 1 and 3
+
+        Raises:
+            RuntimeError: A game had max_misdeals misdeals in a row
+        """
+        in_a_row = np.zeros(self.n_games, dtype=np.int64)
+        misdeals = self.misdeals.copy()
+        while self.playRound():
+            misdealt = self.misdeals > misdeals
+            in_a_row = np.where(misdealt, in_a_row + 1, 0)
+            if (in_a_row >= max_misdeals).any():
+                raise RuntimeError(f"{max_misdeals} misdeals in a row, the "
+                                   f"policies never make trump")
+            misdeals = self.misdeals.copy()
+        return self.points.argmax(axis=1)
@@ -2,4 +2,8 @@ from .player import Player
 from .team import Team
 from .local.basicai import BasicAIPlayer
 from .local.consoleplayer import ConsolePlayer
+from .local.ismctsai import ISMCTSPlayer
+from .local.pimcai import PIMCPlayer
+from .local.smartai import SmartAIPlayer
+from .local.tableai import TableAIPlayer
 from .online.webplayer import WebPlayer
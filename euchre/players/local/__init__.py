@@ -1,2 +1,6 @@
 from .basicai import BasicAIPlayer
 from .consoleplayer import ConsolePlayer
+from .ismctsai import ISMCTSPlayer
+from .pimcai import PIMCPlayer
+from .smartai import SmartAIPlayer
+from .tableai import TableAIPlayer
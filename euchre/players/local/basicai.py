@@ -1,12 +1,18 @@
 import abc
 
+from euchre.cards import CardSet
+from euchre.cards import EFFECTIVE_SUITS
 from euchre.players.player import Player
 
 
 class BasicAIPlayer(Player, abc.ABC):
     """A Player class that returns valid responses.
+
+    Keeps its hand as a CardSet.
     """
 
+    subscriptions = frozenset()
+
     def __init__(self, name='AI'):
         Player.__init__(self, name)
 
@@ -18,7 +24,7 @@ class BasicAIPlayer(Player, abc.ABC):
     def discardCard(self, top_card):
         # Put an arbitrary card in kitty
         discard_card = self.hand.pop()
-        self.hand.append(top_card)
+        self.hand.add(top_card)
         return discard_card
 
     def orderTrump(self):
@@ -36,10 +42,8 @@ class BasicAIPlayer(Player, abc.ABC):
             card = self.hand.pop()
         else:
             # Play an arbitrary valid card
-            leadSuit = cards_played[leader][-1].suit
-            playable = [card for card in self.hand if card.getSuit(
-                trump) == leadSuit]
-            card = playable[0] if playable else self.hand[0]
+            leadSuit = EFFECTIVE_SUITS[trump][cards_played[leader][-1].index]
+            card = self.hand.legalPlays(leadSuit, trump).pop()
             self.hand.remove(card)
 
         return card
@@ -47,7 +51,7 @@ class BasicAIPlayer(Player, abc.ABC):
     # Information updates that don't require a return value
     # -------------------------------------------------------------------------
     def updateHand(self, cards):
-        self.hand = cards
+        self.hand = CardSet(cards)
 
     def pointsMsg(self, team1, team2):
         pass
@@ -0,0 +1,234 @@
+"""Offline builder for the bidding strength table.
+
+The table holds the expected points of a round for the team of a player
+that makes trump, for every canonical (hand, top card, trump) position (see
+euchre.cards.canonical), every seat and with or without going alone. It is
+stored as a float16 .npy file of shape (INDEX_COUNT, 4, 2) indexed by
+[canonicalIndex, seat, alone], where seat 0 is left of the dealer and seat 3
+is the dealer. Entries that haven't been built are NaN.
+
+When trump is the suit of the top card the dealer picks up the top card,
+otherwise the top card stays turned down. Each entry is estimated by dealing
+the unseen cards at random and playing the round out with the heuristics in
+euchre.players.local.heuristics.
+
+Building the whole table takes a while, use --start and --stop to build it
+in parts or resume a partial build.
+"""
+import concurrent.futures
+import os
+
+import click
+import numpy as np
+
+from euchre.cards import CARDS
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import TRICK_RANKS
+from euchre.cards.canonical import INDEX_COUNT
+from euchre.cards.canonical import canonicalIndex
+from euchre.cards.canonical import fromCanonicalIndex
+from euchre.cards.canonical import isCanonicalIndex
+from euchre.games.seeding import gameSeedSequence
+from euchre.players.local.heuristics import discardIndex
+from euchre.players.local.heuristics import playIndex
+
+TABLE_SHAPE = (INDEX_COUNT, 4, 2)
+TABLE_DTYPE = np.float16
+DEALER_SEAT = 3
+
+
+def playRound(hands, trump, sitting_out=None):
+    """Plays the 5 tricks of a round with the heuristics.
+
+    Args:
+        hands (list): Bitmasks of the hands by seat, seat 3 is the dealer.
+            The hands are emptied as cards are played
+        trump (str): Trump suit
+        sitting_out (int): Seat of the partner of a player going alone
+
+    Returns:
+        tricks (list): Tricks taken by each seat
+    """
+    tricks = [0, 0, 0, 0]
+    leader = 1 if sitting_out == 0 else 0
+    effective = EFFECTIVE_SUITS[trump]
+    for _ in range(5):
+        led = None
+        best_rank = -1
+        winner = leader
+        for k in range(4):
+            seat = (leader + k) % 4
+            if seat == sitting_out:
+                continue
+            partner_winning = led is not None and (winner - seat) % 2 == 0
+            index = playIndex(hands[seat], led, best_rank, partner_winning,
+                              trump)
+            hands[seat] ^= 1 << index
+            if led is None:
+                led = effective[index]
+            rank = TRICK_RANKS[trump][led][index]
+            if rank > best_rank:
+                best_rank = rank
+                winner = seat
+        tricks[winner] += 1
+        leader = winner
+    return tricks
+
+
+def roundPoints(team_tricks, alone):
+    """Points of a round for the making team, negative when euchred.
+
+    Args:
+        team_tricks (int): Tricks taken by the making team
+        alone (bool): Whether the maker went alone
+
+    Returns:
+        (int): Points scored by the making team, or minus the points scored
+            by the defending team
+    """
+    if team_tricks < 3:
+        return -2
+    if team_tricks == 5:
+        return 4 if alone else 2
+    return 1
+
+
+def expectedPoints(hand_mask, top_index, trump, seat, samples, rng):
+    """Estimates the expected points of making trump.
+
+    Args:
+        hand_mask (int): Bitmask of the maker's hand
+        top_index (int): Index of the top card
+        trump (str): Trump suit, the dealer picks up the top card when it is
+            the suit of the top card
+        seat (int): Seat of the maker, 0 is left of the dealer
+        samples (int): Number of random deals to play out
+        rng (numpy.random.Generator): Random generator
+
+    Returns:
+        (tuple): Expected points without and with going alone
+    """
+    unseen = [i for i in range(len(CARDS))
+              if not (hand_mask >> i) & 1 and i != top_index]
+    others = [s for s in range(4) if s != seat]
+    picked_up = CARDS[top_index].suit == trump
+    totals = [0, 0]
+    for _ in range(samples):
+        deal = rng.permutation(unseen)
+        hands = [0, 0, 0, 0]
+        hands[seat] = hand_mask
+        for k, other in enumerate(others):
+            for i in deal[k * 5:k * 5 + 5]:
+                hands[other] |= 1 << int(i)
+        if picked_up:
+            hands[DEALER_SEAT] |= 1 << top_index
+            hands[DEALER_SEAT] ^= 1 << discardIndex(hands[DEALER_SEAT], trump)
+
+        for alone in (0, 1):
+            partner = (seat + 2) % 4
+            tricks = playRound(list(hands), trump,
+                               partner if alone else None)
+            team_tricks = tricks[seat] + tricks[partner]
+            totals[alone] += roundPoints(team_tricks, alone)
+    return totals[0] / samples, totals[1] / samples
+
+
+def lookup(table, hand, top_card, trump, seat, alone=False):
+    """Looks up the expected points of making trump.
+
+    Args:
+        table (numpy.ndarray): Table from loadTable
+        hand (CardSet or list): The 5 cards in the hand
+        top_card (Card): The card turned up in the kitty
+        trump (str): Suit to make trump
+        seat (int): Seat of the maker, 0 is left of the dealer
+        alone (bool): Whether the maker goes alone
+
+    Returns:
+        (float): Expected points, NaN if the entry hasn't been built
+    """
+    return float(table[canonicalIndex(hand, top_card, trump), seat,
+                       int(alone)])
+
+
+def loadTable(path):
+    """Memory-maps a bidding table.
+
+    Args:
+        path (path): Path of the .npy table
+
+    Returns:
+        (numpy.ndarray): Read-only table indexed by
+            [canonicalIndex, seat, alone]
+    """
+    return np.load(path, mmap_mode='r')
+
+
+def _buildChunk(start, stop, samples, seed):
+    """Computes the entries of a range of indexes.
+
+    Returns:
+        start (int): First index of the range
+        values (numpy.ndarray): (stop - start, 4, 2) entries of the range
+    """
+    values = np.full((stop - start, 4, 2), np.nan, dtype=TABLE_DTYPE)
+    for index in range(start, stop):
+        if not isCanonicalIndex(index):
+            continue
+        rng = np.random.default_rng(gameSeedSequence(seed, index))
+        hand, top_card, trump = fromCanonicalIndex(index)
+        for seat in range(4):
+            values[index - start, seat] = expectedPoints(
+                hand.mask, top_card.index, trump, seat, samples, rng)
+    return start, values
+
+
+def buildTable(path, samples=64, seed=0, start=0, stop=INDEX_COUNT,
+               workers=None, chunk_size=512):
+    """Builds a range of the bidding table, creating the file if needed.
+
+    Args:
+        path (path): Path of the .npy table
+        samples (int): Random deals played out per entry
+        seed (int): Root seed, each index gets its own stream
+        start, stop (int): Range of indexes to build
+        workers (int): Number of worker processes, default is the CPU count
+        chunk_size (int): Number of indexes per task
+    """
+    if os.path.exists(path):
+        table = np.load(path, mmap_mode='r+')
+        if table.shape != TABLE_SHAPE:
+            raise ValueError(f"{path} is not a bidding table")
+    else:
+        table = np.lib.format.open_memmap(path, mode='w+', dtype=TABLE_DTYPE,
+                                          shape=TABLE_SHAPE)
+        table[:] = np.nan
+
+    chunks = [(i, min(i + chunk_size, stop))
+              for i in range(start, stop, chunk_size)]
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(_buildChunk, i, j, samples, seed)
+                   for i, j in chunks]
+        for done, future in enumerate(
+                concurrent.futures.as_completed(futures), 1):
+            chunk_start, values = future.result()
+            table[chunk_start:chunk_start + len(values)] = values
+            if done % 100 == 0 or done == len(futures):
+                table.flush()
+                print(f"built {done}/{len(futures)} chunks")
+
+
+@click.command()
+@click.argument("path")
+@click.option("--samples", "samples", default=64)
+@click.option("--seed", "seed", default=0)
+@click.option("--start", "start", default=0)
+@click.option("--stop", "stop", default=INDEX_COUNT)
+@click.option("--workers", "workers", default=None, type=int)
+@click.option("--chunk-size", "chunk_size", default=512)
+def main(path, samples, seed, start, stop, workers, chunk_size):
+    buildTable(path, samples, seed, start, stop, workers, chunk_size)
+
+
+if __name__ == "__main__":
+    main()
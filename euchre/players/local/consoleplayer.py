@@ -146,6 +146,17 @@ class ConsolePlayer(Player, abc.ABC):
         print(
             "Must call valid suit ['C','S','H','D'] that does not match the suit of the top card")
 
+    def claimMsg(self, plays, takers):
+        print("The rest of the round is decided")
+        for player, card in plays:
+            print(f"{player} played {card.prettyString()}")
+        for taker in takers:
+            print(f"{taker} takes the hand")
+        time.sleep(self.print_delay)
+
+    def invalidCardMsg(self):
+        print("Must play a card in your hand that follows the suit led")
+
     def trickStartMsg(self):
         print()
 
@@ -0,0 +1,97 @@
+"""Card play heuristics shared by the table driven AI and its table builder.
+
+Cards are card indexes (see Card.index) and hands are bitmasks of card
+indexes, like CardSet.mask.
+"""
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import TRICK_RANKS
+from euchre.cards.cardset import SUIT_MASKS
+
+
+def _indexes(mask):
+    """Card indexes in a bitmask."""
+    indexes = []
+    while mask:
+        low = mask & -mask
+        indexes.append(low.bit_length() - 1)
+        mask ^= low
+    return indexes
+
+
+def strength(index, trump):
+    """Strength of a card on its own, ignoring the led suit.
+
+    Trump cards are stronger than every other card and the bowers are the
+    strongest trump.
+
+    Args:
+        index (int): Card index
+        trump (str): Trump suit
+
+    Returns:
+        (int): Rank of the card when its own suit is led
+    """
+    return TRICK_RANKS[trump][EFFECTIVE_SUITS[trump][index]][index]
+
+
+def lowestIndex(mask, led, trump):
+    """Weakest card of a hand for a trick.
+
+    Args:
+        mask (int): Bitmask of the cards to pick from
+        led (str): Effective suit led, None when leading
+        trump (str): Trump suit
+
+    Returns:
+        (int): Index of the card least able to take the trick
+    """
+    ranks = TRICK_RANKS[trump][led] if led is not None else None
+    return min(_indexes(mask), key=lambda i: (
+        ranks[i] if ranks is not None else 0, strength(i, trump)))
+
+
+def discardIndex(mask, trump):
+    """Card to throw in the kitty, the weakest card that isn't trump.
+
+    Args:
+        mask (int): Bitmask of the dealer's hand with the top card
+        trump (str): Trump suit
+
+    Returns:
+        (int): Index of the card to discard
+    """
+    off_trump = mask & ~SUIT_MASKS[trump][trump]
+    return lowestIndex(off_trump if off_trump else mask, None, trump)
+
+
+def playIndex(mask, led, best_rank, partner_winning, trump):
+    """Card to play to a trick.
+
+    Leads the strongest card. When following, plays the weakest legal card
+    if the partner is winning, otherwise the weakest legal card that takes
+    the trick, or the weakest legal card if none can.
+
+    Args:
+        mask (int): Bitmask of the hand
+        led (str): Effective suit led, None when leading
+        best_rank (int): Rank of the card currently taking the trick
+        partner_winning (bool): Whether the partner is taking the trick
+        trump (str): Trump suit
+
+    Returns:
+        (int): Index of the card to play
+    """
+    if led is None:
+        return max(_indexes(mask), key=lambda i: strength(i, trump))
+
+    following = mask & SUIT_MASKS[trump][led]
+    legal = following if following else mask
+    if not partner_winning:
+        ranks = TRICK_RANKS[trump][led]
+        winning = 0
+        for i in _indexes(legal):
+            if ranks[i] > best_rank:
+                winning |= 1 << i
+        if winning:
+            return lowestIndex(winning, led, trump)
+    return lowestIndex(legal, led, trump)
@@ -0,0 +1,192 @@
+import concurrent.futures
+import math
+import random
+import weakref
+
+import numpy as np
+
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import TRICK_RANKS
+from euchre.players.local.pimcai import PIMCPlayer
+from euchre.players.local.pimcai import pointsDifference
+from euchre.players.local.pimcai import sampleHands
+
+
+class _Node:
+    """Node of an information set tree.
+
+    Attributes:
+        team (int): Team of the player whose move leads to the node
+        children (dict): Maps card indexes to child nodes
+        visits (int): Iterations through the node
+        reward (float): Sum of the rewards of team over the visits
+        avail (int): Iterations in which the move leading to the node was
+            legal
+    """
+    __slots__ = ('team', 'children', 'visits', 'reward', 'avail')
+
+    def __init__(self, team):
+        self.team = team
+        self.children = {}
+        self.visits = 0
+        self.reward = 0.0
+        self.avail = 0
+
+
+def searchTree(state, pool, needs, voids, iterations, exploration, seed):
+    """Single observer information set Monte Carlo tree search.
+
+    The tree is searched from the view of the player to move. Its nodes are
+    the information sets of that player, reached by the cards played since
+    the root, and every iteration deals the hidden cards anew and only
+    follows the moves legal in that deal. Children are picked by UCB, with
+    the number of iterations a move was legal in as the parent visits, and
+    rounds are played out at random from the first new node. Rewards are
+    the round points of a team minus the other's, divided by 4.
+
+    Args:
+        state, pool, needs, voids: Position seen, see
+            PIMCPlayer.observedState
+        iterations (int): Number of iterations to search
+        exploration (float): Exploration constant of UCB
+        seed (int): Seed of the deals and the playouts
+
+    Returns:
+        (dict): Maps the legal card indexes of the player to move to the
+            visits of their nodes
+    """
+    rng = np.random.default_rng(seed)
+    playout = random.Random(seed)
+    maker_team = state.maker % 2
+    alone = state.alone
+    root = _Node(None)
+    for _ in range(iterations):
+        sample = sampleHands(rng, state, pool, needs, voids)
+        node = root
+        path = []
+        # Select down the tree, until a move is expanded
+        while not sample.isTerminal():
+            moves = sample.legal_moves()
+            children = node.children
+            untried = []
+            for move in moves:
+                child = children.get(move)
+                if child is None:
+                    untried.append(move)
+                else:
+                    child.avail += 1
+            if untried:
+                move = untried[playout.randrange(len(untried))]
+                node = children[move] = _Node(sample.to_move % 2)
+                node.avail = 1
+                sample = sample.apply(move)
+                path.append(node)
+                break
+            best = -math.inf
+            for move in moves:
+                child = children[move]
+                value = child.reward / child.visits + exploration \
+                    * math.sqrt(math.log(child.avail) / child.visits)
+                if value > best:
+                    best, chosen = value, move
+            node = children[chosen]
+            sample = sample.apply(chosen)
+            path.append(node)
+
+        while not sample.isTerminal():
+            moves = sample.legal_moves()
+            sample = sample.apply(moves[playout.randrange(len(moves))])
+
+        rewards = [pointsDifference(sample.tricks[team],
+                                    team == maker_team, alone) / 4
+                   for team in (0, 1)]
+        for node in path:
+            node.visits += 1
+            node.reward += rewards[node.team]
+    return {move: child.visits for move, child in root.children.items()}
+
+
+class ISMCTSPlayer(PIMCPlayer):
+    """A Player class that plays cards by information set Monte Carlo tree
+    search, see searchTree.
+
+    Searches are root parallel: every worker searches its own tree with its
+    own seed and the visits of the cards to play are summed over the trees.
+    The worker processes are started at the first search and kept for the
+    following ones. They are stopped by close, by leaving the player used
+    as a context manager, or once the player is garbage collected. With one
+    worker the search runs in the calling process. Don't use more than one
+    worker in players created inside worker processes, like the players of
+    euchre.games.tournament and euchre.games.dataset, each of them would
+    start its own pool. Bidding is done by TableAIPlayer and what the player
+    sees of the round is tracked by PIMCPlayer.
+
+    Args:
+        name (str): Name of the player
+        iterations (int): Iterations per card played, over all workers
+        exploration (float): Exploration constant of UCB
+        workers (int): Number of processes searching in parallel
+        seed (int): Seed of the searches, None for an unseeded player
+        table_path, threshold: Bidding options, see TableAIPlayer
+
+    Attributes:
+        visits (dict): Summed visits of the cards for the last card played
+    """
+
+    def __init__(self, name='AI', iterations=1000, exploration=0.7,
+                 workers=1, seed=None, table_path=None, threshold=0.0):
+        PIMCPlayer.__init__(self, name, seed=seed, table_path=table_path,
+                            threshold=threshold)
+        self.iterations = iterations
+        self.exploration = exploration
+        self.workers = workers
+        self.executor = None
+        self.finalizer = None # Stops the executor if close isn't called
+        self.visits = {}
+
+    def close(self):
+        """Stops the worker processes."""
+        if self.executor is not None:
+            self.finalizer()
+            self.executor = None
+            self.finalizer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def bestMove(self, state, moves, pool, needs, voids):
+        """Card with the most visits over the trees of the workers.
+
+        Returns:
+            (int): Card index, the lowest ranked card of the best ones
+        """
+        seeds = self.rng.integers(1 << 62, size=self.workers)
+        counts = [self.iterations // self.workers
+                  + (i < self.iterations % self.workers)
+                  for i in range(self.workers)]
+        args = [(state, pool, needs, voids, count, self.exploration,
+                 int(seed)) for count, seed in zip(counts, seeds) if count]
+        if len(args) == 1:
+            results = [searchTree(*args[0])]
+        else:
+            if self.executor is None:
+                self.executor = concurrent.futures.ProcessPoolExecutor(
+                    self.workers)
+                self.finalizer = weakref.finalize(
+                    self, self.executor.shutdown)
+            futures = [self.executor.submit(searchTree, *task)
+                       for task in args]
+            results = [future.result() for future in futures]
+
+        self.visits = dict.fromkeys(moves, 0)
+        for result in results:
+            for move, visits in result.items():
+                self.visits[move] += visits
+        self.samples = sum(counts)
+        ranks = TRICK_RANKS[state.trump]
+        effective = EFFECTIVE_SUITS[state.trump]
+        return max(moves, key=lambda move: (
+            self.visits[move], -ranks[effective[move]][move]))
@@ -0,0 +1,259 @@
+import time
+
+import numpy as np
+
+from euchre.cards import CARDS
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import TRICK_RANKS
+from euchre.cards.cardset import FULL_MASK
+from euchre.cards.cardset import SUIT_MASKS
+from euchre.games.gamestate import GameState
+from euchre.games.solver import DoubleDummySolver
+from euchre.players.local.tableai import TableAIPlayer
+
+
+def pointsDifference(tricks, making, alone):
+    """Points a team scores in a round minus the points the other team
+    scores, the way GameEngine.scoreRound scores rounds.
+
+    Args:
+        tricks (int): Tricks the team took
+        making (bool): Whether the team made trump
+        alone (bool): Whether the maker went alone
+
+    Returns:
+        (int): Points difference, from -4 to 4
+    """
+    if making:
+        if tricks == 5:
+            return 4 if alone else 2
+        return 1 if tricks >= 3 else -2
+    if tricks >= 3:
+        return 2
+    if tricks == 0:
+        return -4 if alone else -2
+    return -1
+
+
+def sampleHands(rng, state, pool, needs, voids):
+    """Deals the hidden cards to the other players at random.
+
+    Players out of the most suits are dealt first, and a deal that can't
+    satisfy every void is retried a few times before voids are ignored.
+
+    Args:
+        rng (numpy.random.Generator): Generator to deal with
+        state, pool, needs, voids: Position seen, see
+            PIMCPlayer.observedState
+
+    Returns:
+        (GameState): state with the hands of the other players dealt
+    """
+    order = sorted(needs, key=lambda seat: -bin(voids[seat]).count('1'))
+    for attempt in range(8):
+        hands = list(state.hands)
+        left = pool
+        for seat in order:
+            allowed = left if attempt == 7 else left & ~voids[seat]
+            cards = [i for i in range(24) if allowed >> i & 1]
+            if len(cards) < needs[seat]:
+                break
+            for i in rng.choice(cards, needs[seat], replace=False):
+                hands[seat] |= 1 << int(i)
+                left &= ~(1 << int(i))
+        else:
+            return state._replace(hands=tuple(hands))
+    raise AssertionError("Not enough hidden cards to deal")
+
+
+class PIMCPlayer(TableAIPlayer):
+    """A Player class that plays cards by perfect information Monte Carlo.
+
+    For every card to play, the hidden cards are dealt at random to the
+    other players consistently with what was seen: the cards played, the
+    suits players showed they are out of, the top card picked up by the
+    dealer and this player's own discard. Every sample is solved with the
+    DoubleDummySolver and the card with the best average points is played.
+
+    Sampling is anytime: it stops once max_samples samples are solved or
+    time_budget seconds have passed, whichever comes first, and within the
+    deadline of the decision when the game sets one. At least one sample is
+    always solved. Bidding is done by TableAIPlayer.
+
+    Args:
+        name (str): Name of the player
+        time_budget (float): Seconds to spend sampling per card played
+        max_samples (int): Samples to solve per card played
+        seed (int): Seed of the sampling, None for an unseeded player
+        table_path, threshold: Bidding options, see TableAIPlayer
+
+    Attributes:
+        samples (int): Samples solved for the last card played
+    """
+
+    subscriptions = TableAIPlayer.subscriptions | frozenset({
+        'dealerMsg', 'orderUpMsg', 'orderedTrumpMsg', 'playedMsg'})
+
+    def __init__(self, name='AI', time_budget=0.05, max_samples=32, seed=None,
+                 table_path=None, threshold=0.0):
+        TableAIPlayer.__init__(self, name, table_path, threshold)
+        self.time_budget = time_budget
+        self.max_samples = max_samples
+        self.rng = np.random.default_rng(seed)
+        self.solver = DoubleDummySolver()
+        self.samples = 0
+        self.dealer = None
+        self.first_bidder = None # Left of the dealer, bids first
+        self.maker = None
+        self.discarded = None # This player's discard as dealer
+        self.plays = [] # (player, card) of the round, in order
+
+    def orderUp(self):
+        if self.first_bidder is None:
+            self.first_bidder = self
+        return TableAIPlayer.orderUp(self)
+
+    def discardCard(self, top_card):
+        self.discarded = TableAIPlayer.discardCard(self, top_card)
+        return self.discarded
+
+    def playCard(self, leader, cards_played, trump):
+        state, pool, needs, voids = self.observedState(leader, cards_played,
+                                                       trump)
+        moves = state.legal_moves()
+        card = CARDS[moves[0]]
+        if len(moves) > 1:
+            card = CARDS[self.bestMove(state, moves, pool, needs, voids)]
+        self.hand.remove(card)
+        self.plays.append((self, card))
+        return card
+
+    def observedState(self, leader, cards_played, trump):
+        """Position of the round as far as this player can see it.
+
+        Args:
+            leader (Player): Player leading the current trick
+            cards_played (dict): Maps the players of the round to the cards
+                they played
+            trump (str): Trump suit
+
+        Returns:
+            state (GameState): Position with only this player's hand and
+                the cards known to be held by the other players filled in
+            pool (int): Bitmask of the cards that can be dealt to the other
+                players, it includes the kitty
+            needs (dict): Maps seats to the number of cards to deal them
+            voids (dict): Maps seats to the bitmask of the cards they can't
+                hold
+        """
+        table = [self.first_bidder or self, None, None, self.dealer or self]
+        table[1] = table[3].getTeammate()
+        table[2] = table[0].getTeammate()
+        seats = {player: seat for seat, player in enumerate(table)}
+        maker = seats[self.maker or self]
+        alone = len(cards_played) == 3
+        size = len(cards_played)
+        effective = EFFECTIVE_SUITS[trump]
+
+        # Replay the tricks seen to find the voids, the tricks taken and the
+        # cards of the current trick
+        voids = {seat: 0 for seat in range(4)}
+        tricks = [0, 0]
+        held = [5] * 4
+        played = 0
+        trick = []
+        for player, card in self.plays:
+            played |= 1 << card.index
+            held[seats[player]] -= 1
+            trick.append((seats[player], card.index))
+            led = effective[trick[0][1]]
+            if effective[card.index] != led:
+                voids[seats[player]] |= SUIT_MASKS[trump][led]
+            if len(trick) == size:
+                ranks = TRICK_RANKS[trump][led]
+                taker = max(trick, key=lambda play: ranks[play[1]])[0]
+                tricks[taker % 2] += 1
+                trick = []
+
+        hands = [0] * 4
+        me = seats[self]
+        hands[me] = self.hand.mask
+        pool = FULL_MASK & ~self.hand.mask & ~played
+        if self.discarded is not None:
+            pool &= ~(1 << self.discarded.index)
+        top = self.top_card.index
+        pool &= ~(1 << top)
+        if trump == self.top_card.suit and self.dealer is not self \
+                and table[3] in cards_played and not played >> top & 1 \
+                and not voids[3] & (1 << top):
+            # The dealer picked up the top card, and hasn't shown they
+            # discarded it
+            hands[3] |= 1 << top
+            held[3] -= 1
+        needs = {seat: held[seat] for seat in range(4)
+                 if seat != me and table[seat] in cards_played}
+        state = GameState(tuple(hands), trump, maker, alone, seats[leader],
+                          tuple(card for _, card in trick), tuple(tricks))
+        return state, pool, needs, voids
+
+    def sampleHands(self, state, pool, needs, voids):
+        """Deals the pool to the other players at random, see sampleHands.
+
+        Returns:
+            (GameState): state with the hands of the other players dealt
+        """
+        return sampleHands(self.rng, state, pool, needs, voids)
+
+    def bestMove(self, state, moves, pool, needs, voids):
+        """Card with the best average points over sampled deals.
+
+        Returns:
+            (int): Card index, the lowest ranked card of the best ones
+        """
+        team = state.to_move % 2
+        making = state.maker % 2 == team
+        totals = dict.fromkeys(moves, 0)
+        budget = self.time_budget
+        remaining = self.remainingTime()
+        if remaining is not None:
+            budget = min(budget, remaining / 2)
+        begin = time.perf_counter()
+        self.samples = 0
+        while self.samples < self.max_samples and (
+                self.samples == 0 or time.perf_counter() - begin < budget):
+            sample = self.sampleHands(state, pool, needs, voids)
+            for move, tricks in self.solver.moveValues(sample).items():
+                totals[move] += pointsDifference(tricks, making, state.alone)
+            self.samples += 1
+        ranks = TRICK_RANKS[state.trump]
+        effective = EFFECTIVE_SUITS[state.trump]
+        return max(moves, key=lambda move: (
+            totals[move], -ranks[effective[move]][move]))
+
+    # Information updates that don't require a return value
+    # -------------------------------------------------------------------------
+    def dealerMsg(self, dealer):
+        self.dealer = dealer
+
+    def topCardMsg(self, top_card):
+        TableAIPlayer.topCardMsg(self, top_card)
+        self.first_bidder = None
+        self.maker = None
+        self.discarded = None
+        self.plays = []
+
+    def orderUpMsg(self, player, top_card):
+        if self.first_bidder is None:
+            self.first_bidder = player
+        self.maker = player
+
+    def deniedUpMsg(self, player):
+        if self.first_bidder is None:
+            self.first_bidder = player
+        TableAIPlayer.deniedUpMsg(self, player)
+
+    def orderedTrumpMsg(self, player, trump_suit):
+        self.maker = player
+
+    def playedMsg(self, player, card):
+        self.plays.append((player, card))
@@ -1,92 +1,184 @@
 import abc
 
+from euchre.cards import CARDS
+from euchre.cards import CardSet
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import TRICK_RANKS
+from euchre.cards.card import SUITS
+from euchre.cards.cardset import SUIT_MASKS
+from euchre.players.local.heuristics import strength
 from euchre.players.player import Player
 
 
+def _ascendingOrders(trump):
+    """Card indexes of each effective suit, lowest first."""
+    return {suit: tuple(sorted(
+        (i for i in range(24) if EFFECTIVE_SUITS[trump][i] == suit),
+        key=lambda i: TRICK_RANKS[trump][suit][i])) for suit in SUITS}
+
+
+# _ASCENDING[trump][suit], cards of an effective suit lowest first
+_ASCENDING = {trump: _ascendingOrders(trump) for trump in SUITS}
+
+
 class SmartAIPlayer(Player, abc.ABC):
     """A Player class that returns smart responses.
 
-    TODO:
     Here are some things that make this smarter than the basic AI:
-    - Orders up jack if it's the dealer
+    - Orders up a jack if it's the dealer
     - Orders up if it has at least 3 trump cards
         and the top card goes to its team
     - Orders trump if it has 3 or more cards of the same suit
-    - Plays highest card if it wins the trick
-    - Plays lowest card if highest card can't win
-    - Plays random trump if can't follow lead
+    - Discards its lowest card that isn't trump
+    - Leads its highest card
+    - Plays its highest card if it wins the trick
+    - Plays its lowest card if its highest card can't win, or if its
+        partner is winning the trick
+    - Plays its lowest trump that wins if it can't follow the lead
+
+    Once trump is known, the hand is indexed by effective suit with the
+    cards of each suit lowest first. The index is built once a round and
+    cards are taken out of it as they leave the hand, so no decision sorts
+    the hand.
+
+    Attributes:
+        suits (dict): Maps effective suits to the card indexes of the hand
+            in the suit, lowest first. None until trump is known
+        trump (str): Trump suit the hand is indexed for
     """
 
+    subscriptions = frozenset({'dealerMsg', 'topCardMsg'})
+
     def __init__(self, name='AI'):
         Player.__init__(self, name)
+        self.dealer = None
+        self.top_card = None
+        self.call = None # Suit to call after ordering trump
+        self.suits = None
+        self.trump = None
+
+    def indexHand(self, trump):
+        """Indexes the hand by effective suit of trump."""
+        mask = self.hand.mask
+        self.suits = {suit: [i for i in order if mask >> i & 1]
+                      for suit, order in _ASCENDING[trump].items()}
+        self.trump = trump
+
+    def getLowestCard(self, suits, trump_suit):
+        # Return lowest value card of the suits
+        return min((self.suits[suit][0] for suit in suits
+                    if self.suits[suit]),
+                   key=lambda i: strength(i, trump_suit))
+
+    def getHighestCard(self, suits, trump_suit):
+        # Return high value card of the suits
+        return max((self.suits[suit][-1] for suit in suits
+                    if self.suits[suit]),
+                   key=lambda i: strength(i, trump_suit))
+
+    def takeCard(self, index):
+        """Removes a card from the hand and its index.
+
+        Returns:
+            (Card): Card removed
+        """
+        self.suits[EFFECTIVE_SUITS[self.trump][index]].remove(index)
+        card = CARDS[index]
+        self.hand.remove(card)
+        return card
 
-    def getLowestCard(self, led_card, trump_suit):
-        # Return lowest value card
-        pass
-
-    def getHighestCard(self, led_card, trump_suit):
-        # Return high value card
-        pass
-
-    def updateHand(self, cards):
-        self.hand = cards
-
-    def orderUp(self):
-        return False
+    def trumpCount(self, mask, trump):
+        """Number of trump cards in a hand bitmask, bowers included."""
+        return bin(mask & SUIT_MASKS[trump][trump]).count('1')
 
     # Decision methods that require a return value
     # -------------------------------------------------------------------------
+    def orderUp(self):
+        trump = self.top_card.suit
+        if self.dealer is self:
+            if self.top_card.rank == 'J':
+                return True
+            mask = self.hand.mask | 1 << self.top_card.index
+            return self.trumpCount(mask, trump) >= 3
+        if self.dealer is self.getTeammate():
+            return self.trumpCount(self.hand.mask, trump) >= 3
+        return False
 
     def discardCard(self, top_card):
-        # Put lowest valued card in the kitty
-        self.hand.append(top_card)
-        values = {}
-        for card in self.hand:
-            values[card] = card.value(card.suit, top_card.suit)
-        discard_card = max(values, key=values.get)
-        self.hand.remove(discard_card)
-        return discard_card
+        # Put lowest valued card that isn't trump in the kitty
+        self.hand.add(top_card)
+        trump = top_card.suit
+        self.indexHand(trump)
+        off_suits = [suit for suit in SUITS if suit != trump]
+        if not any(self.suits[suit] for suit in off_suits):
+            off_suits = [trump]
+        return self.takeCard(self.getLowestCard(off_suits, trump))
 
     def orderTrump(self):
-        return False
+        mask = self.hand.mask
+        counts = {suit: self.trumpCount(mask, suit) for suit in SUITS
+                  if suit != self.top_card.suit}
+        self.call = max(counts, key=counts.get)
+        return counts[self.call] >= 3
 
     def callTrump(self, up_suit):
-        return None
+        return self.call
 
     def goAlone(self):
         return False
 
     def playCard(self, leader, cards_played, trump):
-        # Play an arbitrary card if player is leader
-        if leader is self:
-            card = self.hand.pop()
-        else:
-            # Play an arbitrary valid card
-            leadSuit = cards_played[leader][-1].suit
-            playable = [card for card in self.hand if card.getSuit(
-                        trump) == leadSuit]
-            card = playable[0] if playable else self.hand[0]
-            self.hand.remove(card)
+        if self.suits is None or self.trump != trump:
+            self.indexHand(trump)
 
-        return card
+        # Lead the highest card
+        if leader is self:
+            return self.takeCard(self.getHighestCard(SUITS, trump))
+
+        trick_number = len(cards_played[self])
+        led = EFFECTIVE_SUITS[trump][cards_played[leader][trick_number].index]
+        ranks = TRICK_RANKS[trump][led]
+        best_rank = -1
+        for player, cards in cards_played.items():
+            if len(cards) > trick_number:
+                rank = ranks[cards[trick_number].index]
+                if rank > best_rank:
+                    best_rank = rank
+                    winner = player
+        partner_winning = winner is self.getTeammate()
+
+        following = self.suits[led]
+        if following:
+            if not partner_winning and ranks[following[-1]] > best_rank:
+                return self.takeCard(following[-1])
+            return self.takeCard(following[0])
+        if not partner_winning:
+            for index in self.suits[trump]:
+                if ranks[index] > best_rank:
+                    return self.takeCard(index)
+        return self.takeCard(self.getLowestCard(SUITS, trump))
 
     # Information updates that don't require a return value
     # -------------------------------------------------------------------------
 
+    def updateHand(self, cards):
+        self.hand = CardSet(cards)
+        self.suits = None
+
     def pointsMsg(self, team1, team2):
         pass
 
     def dealerMsg(self, dealer):
-        pass
+        self.dealer = dealer
 
     def topCardMsg(self, top_card):
-        pass
+        self.top_card = top_card
 
     def roundResultsMsg(self, taking_team, points_scored,
                         team_tricks):
         pass
 
-    def orderedUpMsg(self, player, top_card):
+    def orderUpMsg(self, player, top_card):
         pass
 
     def deniedUpMsg(self, player):
@@ -98,7 +190,7 @@ class SmartAIPlayer(Player, abc.ABC):
     def deniedTrumpMsg(self, player):
         pass
 
-    def gameResultsMsg(self):
+    def gameResultsMsg(self, winning_team):
         pass
 
     def misdealMsg(self):
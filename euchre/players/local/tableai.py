@@ -0,0 +1,187 @@
+import abc
+import math
+
+from euchre.cards import CARDS
+from euchre.cards import CardSet
+from euchre.cards import EFFECTIVE_SUITS
+from euchre.cards import TRICK_RANKS
+from euchre.players.player import Player
+from euchre.players.local import biddingtable
+from euchre.players.local.heuristics import discardIndex
+from euchre.players.local.heuristics import playIndex
+
+
+class TableAIPlayer(Player, abc.ABC):
+    """A Player class that bids from a precomputed bidding table.
+
+    Each bidding decision is one lookup of the expected points of making
+    trump in the table built by euchre.players.local.biddingtable. Cards are
+    played with the same heuristics the table was built with.
+
+    Positions missing from the table fall back to counting trump: make trump
+    with at least 3 trump cards.
+
+    Attributes:
+        table (numpy.ndarray): Memory-mapped bidding table, None if no table
+        threshold (float): Expected points needed to make trump
+    """
+
+    subscriptions = frozenset({'topCardMsg', 'deniedUpMsg', 'deniedTrumpMsg'})
+
+    def __init__(self, name='AI', table_path=None, threshold=0.0):
+        Player.__init__(self, name)
+        self.table = (biddingtable.loadTable(table_path)
+                      if table_path is not None else None)
+        self.threshold = threshold
+        self.top_card = None
+        self.bid = None  # (hand, trump, seat) of the last trump made
+        self.passes = 0  # Passes seen in the current bidding phase
+
+    def expectedPoints(self, trump, seat, alone=False):
+        """Expected points of making trump with the current hand.
+
+        Args:
+            trump (str): Suit to make trump
+            seat (int): Seat of this player, 0 is left of the dealer
+            alone (bool): Whether going alone
+
+        Returns:
+            (float): Expected points for this Player's team
+        """
+        points = math.nan
+        if self.table is not None:
+            points = biddingtable.lookup(self.table, self.hand, self.top_card,
+                                         trump, seat, alone)
+        if math.isnan(points):
+            # Count trump when the position isn't in the table
+            trump_count = len(self.hand.ofSuit(trump, trump))
+            if seat == 3 and self.top_card.suit == trump:
+                trump_count += 1
+            points = 1.0 if trump_count >= 3 else -1.0
+            if alone:
+                points -= 1.0
+        return points
+
+    # Decision methods that require a return value
+    # -------------------------------------------------------------------------
+    def orderUp(self):
+        seat = self.passes
+        trump = self.top_card.suit
+        if self.expectedPoints(trump, seat) > self.threshold:
+            self.bid = (self.hand.copy(), trump, seat)
+            return True
+        return False
+
+    def discardCard(self, top_card):
+        self.hand.add(top_card)
+        discard_card = CARDS[discardIndex(self.hand.mask, top_card.suit)]
+        self.hand.remove(discard_card)
+        return discard_card
+
+    def orderTrump(self):
+        seat = self.passes
+        best = None
+        for trump in ['C', 'S', 'H', 'D']:
+            if trump == self.top_card.suit:
+                continue
+            points = self.expectedPoints(trump, seat)
+            if best is None or points > best[0]:
+                best = (points, trump)
+        if best[0] > self.threshold:
+            self.bid = (self.hand.copy(), best[1], seat)
+            return True
+        return False
+
+    def callTrump(self, up_suit):
+        return self.bid[1]
+
+    def goAlone(self):
+        if self.bid is None:
+            return False
+        hand, trump, seat = self.bid
+        current_hand = self.hand
+        self.hand = hand
+        alone = (self.expectedPoints(trump, seat, True)
+                 > self.expectedPoints(trump, seat))
+        self.hand = current_hand
+        return alone
+
+    def playCard(self, leader, cards_played, trump):
+        trick_number = len(cards_played[self])
+        led = None
+        best_rank = -1
+        winner = None
+        if leader is not self:
+            led = EFFECTIVE_SUITS[trump][cards_played[leader][trick_number]
+                                         .index]
+            ranks = TRICK_RANKS[trump][led]
+            for player, cards in cards_played.items():
+                if len(cards) > trick_number:
+                    rank = ranks[cards[trick_number].index]
+                    if rank > best_rank:
+                        best_rank = rank
+                        winner = player
+        partner_winning = winner is not None and winner is self.getTeammate()
+        card = CARDS[playIndex(self.hand.mask, led, best_rank,
+                               partner_winning, trump)]
+        self.hand.remove(card)
+        return card
+
+    # Information updates that don't require a return value
+    # -------------------------------------------------------------------------
+    def updateHand(self, cards):
+        self.hand = CardSet(cards)
+        self.bid = None
+
+    def pointsMsg(self, team1, team2):
+        pass
+
+    def dealerMsg(self, dealer):
+        pass
+
+    def topCardMsg(self, top_card):
+        self.top_card = top_card
+        self.passes = 0
+
+    def roundResultsMsg(self, taking_team, points_scored,
+                        team_tricks):
+        pass
+
+    def orderUpMsg(self, player, top_card):
+        pass
+
+    def deniedUpMsg(self, player):
+        self.passes = (self.passes + 1) % 4
+
+    def orderedTrumpMsg(self, player, trump_suit):
+        pass
+
+    def deniedTrumpMsg(self, player):
+        self.passes = (self.passes + 1) % 4
+
+    def gameResultsMsg(self, winning_team):
+        pass
+
+    def misdealMsg(self):
+        pass
+
+    def leaderMsg(self, leader):
+        pass
+
+    def playedMsg(self, player, card):
+        pass
+
+    def takerMsg(self, taker):
+        pass
+
+    def penaltyMsg(self, player, card):
+        pass
+
+    def invalidSuitMsg(self):
+        pass
+
+    def trickStartMsg(self):
+        pass
+
+    def newTrumpMsg(self, trump):
+        pass
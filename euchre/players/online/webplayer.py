@@ -88,16 +88,28 @@ class WebPlayer(Player, abc.ABC):
 
     def request(self, request_type):
         """Send a TCP request to the client and await a relevant response.
+
+        Raises:
+            TimeoutError: The deadline of the decision passed before the
+                client responded
         """
         while True:
+            # Drop a late response to a request that timed out
+            self.updates['new_update'] = False
+
             # Send request to client
             self.sendMessage({'message_type': 'request',
                               'request_type': request_type})
 
             # Wait for response
-            # Blocking is OK since game can't continue without client response
+            # Blocking is OK since game can't continue without client
+            #   response, unless the game set a deadline
             while self.updates['new_update'] != True:
-                time.sleep(0.1)
+                remaining = self.remainingTime()
+                if remaining == 0.0:
+                    raise TimeoutError(f"{self} missed the deadline "
+                                       f"of {request_type}")
+                time.sleep(0.1 if remaining is None else min(0.1, remaining))
 
             if self.updates['response_type'] != request_type:
                 # Invalid response
@@ -139,7 +151,7 @@ class WebPlayer(Player, abc.ABC):
 
     def discardCard(self, top_card):
         ans = self.request('discard_card')
-        return ans
+        return Card.str2card(ans)
 
     # Information updates that don't require a return value
     # -------------------------------------------------------------------------
@@ -284,6 +296,22 @@ class WebPlayer(Player, abc.ABC):
         }
         self.sendMessage(msg)
 
+    def claimMsg(self, plays, takers):
+        msg = {
+            'message_type': 'info',
+            'info_type': 'claim',
+            'plays': [(str(player), str(card)) for player, card in plays],
+            'takers': [str(taker) for taker in takers]
+        }
+        self.sendMessage(msg)
+
+    def invalidCardMsg(self):
+        msg = {
+            'message_type': 'info',
+            'info_type': 'invalid_card'
+        }
+        self.sendMessage(msg)
+
     def trickStartMsg(self):
         msg = {
             'message_type': 'info',
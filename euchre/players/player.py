@@ -1,5 +1,6 @@
 import abc
 import itertools
+import time
 
 from euchre.utils import printCards as utilPrintCards
 
@@ -9,20 +10,44 @@ class Player(abc.ABC):
 
     Player objects are directly called by the game.
 
+    The game calls every notification (the *Msg methods) on every player
+    unless the class declares the ones it consumes in subscriptions. Set it
+    to an empty set when all notifications are no-ops. A subclass that
+    overrides a notification method is still notified of it.
+
+    Games with deadlines set deadline before asking for a decision. Players
+    that search should stop once remainingTime runs out, and players that
+    wait on someone else should raise TimeoutError, the game then decides
+    for them.
+
     Attributes:
         name (str): Name of the player
         team (Team): Team that the player is on
-        hand (list): Cards in the players hand
+        hand (list or CardSet): Cards in the players hand
+        subscriptions (frozenset): Names of the notifications the class
+            consumes, None for all of them
+        deadline (float): time.monotonic() by which the current decision
+            must be made, None if there is no limit
     """
 
     id_iter = itertools.count()
 
+    NOTIFICATIONS = (
+        'pointsMsg', 'dealerMsg', 'topCardMsg', 'roundResultsMsg',
+        'orderUpMsg', 'deniedUpMsg', 'orderedTrumpMsg', 'deniedTrumpMsg',
+        'gameResultsMsg', 'misdealMsg', 'leaderMsg', 'playedMsg', 'takerMsg',
+        'penaltyMsg', 'trickStartMsg', 'newTrumpMsg', 'claimMsg',
+    )
+
+    subscriptions = None
+
     def __init__(self, name=None):
         self._id = next(Player.id_iter)
 
         self.name = str(self._id) if name is None else name
         self.team = None
         self.hand = None
+        self.deadline = None
 
     def __str__(self):
         """Gets name of player
@@ -45,6 +70,38 @@ class Player(abc.ABC):
         """
         utilPrintCards(self.hand)
 
+    def remainingTime(self):
+        """Time left to make the current decision.
+
+        Returns:
+            (float): Seconds until the deadline, 0 once it has passed and
+                None if there is no deadline
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def subscribes(self, notification):
+        """Whether this player consumes a notification.
+
+        Args:
+            notification (str): Name of the notification method
+
+        Returns:
+            (bool): True if the game needs to call the notification
+        """
+        cls = type(self)
+        for declaring_cls in cls.__mro__:
+            if 'subscriptions' in declaring_cls.__dict__:
+                break
+        if declaring_cls.subscriptions is None \
+                or notification in declaring_cls.subscriptions:
+            return True
+
+        # Subclasses that override a notification still want it
+        return getattr(cls, notification) is not \
+            getattr(declaring_cls, notification)
+
     # Decision methods that require a return value
     # -------------------------------------------------------------------------
     @abc.abstractmethod
@@ -108,7 +165,8 @@ class Player(abc.ABC):
         """Updates cards in players hand
 
         Args:
-            (list): Cards dealt to player
+            (list or CardSet): Cards dealt to player, players that prefer the
+                other type convert with CardSet(cards) or list(cards)
         """
         pass
 
@@ -280,6 +338,28 @@ class Player(abc.ABC):
         """
         pass
 
+    def claimMsg(self, plays, takers):
+        """Passes the rest of a round that was played out without asking
+        the players, because the tricks each team takes were decided.
+
+        Sent instead of the trickStartMsg, playedMsg and takerMsg of the
+        claimed plays.
+
+        Args:
+            plays (list): (Player, Card) of each claimed play, in order
+            takers (list): Player that took each claimed trick
+        """
+        pass
+
+    def invalidCardMsg(self):
+        """Called when the game refuses the card this Player played.
+
+        The card isn't in the hand, or reneges are enforced and it doesn't
+        follow the led suit. The hand is restored with updateHand and the
+        Player is asked to play again.
+        """
+        pass
+
     @abc.abstractmethod
     def trickStartMsg(self):
         """Called when a new trick starts.
@@ -0,0 +1,84 @@
+import gc
+import unittest
+
+from euchre import StandardGame
+from euchre import Team
+from euchre.games import gameRng
+from euchre.players import ISMCTSPlayer
+from euchre.players import TableAIPlayer
+from euchre.players.local.ismctsai import searchTree
+
+
+class RecordingISMCTSPlayer(ISMCTSPlayer):
+    """ISMCTSPlayer keeping the positions it searched."""
+
+    def __init__(self, name, **kwargs):
+        ISMCTSPlayer.__init__(self, name, **kwargs)
+        self.positions = []
+        self.executors = set()
+
+    def bestMove(self, state, moves, pool, needs, voids):
+        self.positions.append((state, pool, needs, voids))
+        move = ISMCTSPlayer.bestMove(self, state, moves, pool, needs, voids)
+        self.executors.add(id(self.executor))
+        return move
+
+
+class TestISMCTSAI(unittest.TestCase):
+
+    def test_search(self):
+        """
+        Test every iteration visits one card of the root, and seeds repeat
+        searches.
+        """
+        player = RecordingISMCTSPlayer('ISMCTS0', iterations=20, seed=0)
+        players = [player, TableAIPlayer('AI1'), TableAIPlayer('AI2'),
+                   TableAIPlayer('AI3')]
+        StandardGame(Team(players[0], players[2]),
+                     Team(players[1], players[3]), rng=gameRng(0, 0)).play()
+        self.assertTrue(player.positions)
+        for position in player.positions[:10]:
+            visits = searchTree(*position, 50, 0.7, 1)
+            self.assertEqual(sum(visits.values()), 50)
+            self.assertTrue(set(visits) <= set(position[0].legal_moves()))
+            self.assertEqual(visits, searchTree(*position, 50, 0.7, 1))
+
+    def test_workers(self):
+        """
+        Test root parallel searches sum the visits of each worker and keep
+        the worker pool between decisions.
+        """
+        players = [RecordingISMCTSPlayer('ISMCTS' + str(i), iterations=9,
+                                         workers=2, seed=i)
+                   for i in range(2)]
+        players += [TableAIPlayer('AI2'), TableAIPlayer('AI3')]
+        team1 = Team(players[0], players[2])
+        team2 = Team(players[1], players[3])
+        with players[0], players[1]:
+            StandardGame(team1, team2, rng=gameRng(1, 0)).play()
+        self.assertTrue(max(team1.points, team2.points) >= 10)
+        for player in players[:2]:
+            self.assertEqual(len(player.executors), 1)
+            self.assertEqual(sum(player.visits.values()), 9)
+            self.assertIsNone(player.executor)
+
+    def test_pool_collected(self):
+        """
+        Test the worker pool is stopped with players that aren't closed.
+        """
+        player = RecordingISMCTSPlayer('ISMCTS0', iterations=4, workers=2,
+                                       seed=0)
+        players = [player] + [TableAIPlayer('AI' + str(i))
+                              for i in range(1, 4)]
+        StandardGame(Team(players[0], players[2]),
+                     Team(players[1], players[3]), rng=gameRng(0, 0)).play()
+        executor = player.executor
+        self.assertIsNotNone(executor)
+        del player, players
+        gc.collect()
+        with self.assertRaises(RuntimeError):
+            executor.submit(int)
+
+
+if __name__ == '__main__':
+    unittest.main()
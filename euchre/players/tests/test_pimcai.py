@@ -0,0 +1,86 @@
+import unittest
+
+from euchre import StandardGame
+from euchre import Team
+from euchre.games import gameRng
+from euchre.players import PIMCPlayer
+from euchre.players import TableAIPlayer
+from euchre.players.local.pimcai import pointsDifference
+
+
+class CheckedPIMCPlayer(PIMCPlayer):
+    """PIMCPlayer checking what it infers against the hands of the others."""
+
+    def __init__(self, name, test):
+        PIMCPlayer.__init__(self, name, max_samples=2, seed=0)
+        self.test = test
+        self.checked = 0
+
+    def sampleHands(self, state, pool, needs, voids):
+        sample = PIMCPlayer.sampleHands(self, state, pool, needs, voids)
+        table = [self.first_bidder, self.dealer.getTeammate(),
+                 self.first_bidder.getTeammate(), self.dealer]
+        self.test.assertIs(table[state.to_move], self)
+        dealt = 0
+        for seat, hand in enumerate(sample.hands):
+            if seat not in needs:
+                continue
+            cards = hand & ~state.hands[seat]
+            self.test.assertEqual(bin(cards).count('1'), needs[seat])
+            self.test.assertFalse(cards & ~pool)
+            self.test.assertFalse(cards & dealt)
+            dealt |= cards
+            # The real hands fit what was inferred
+            real = table[seat].hand.mask
+            self.test.assertFalse(real & voids[seat])
+            self.test.assertFalse(real & ~(pool | state.hands[seat]))
+            self.test.assertEqual(bin(real).count('1'),
+                                  bin(hand).count('1'))
+        self.checked += 1
+        return sample
+
+
+class TestPIMCAI(unittest.TestCase):
+
+    def test_points_difference(self):
+        """
+        Test points differences follow how the engine scores rounds.
+        """
+        self.assertEqual(pointsDifference(3, True, False), 1)
+        self.assertEqual(pointsDifference(5, True, False), 2)
+        self.assertEqual(pointsDifference(5, True, True), 4)
+        self.assertEqual(pointsDifference(2, True, True), -2)
+        self.assertEqual(pointsDifference(3, False, False), 2)
+        self.assertEqual(pointsDifference(1, False, True), -1)
+        self.assertEqual(pointsDifference(0, False, True), -4)
+
+    def test_samples(self):
+        """
+        Test sampled hands are consistent with the play seen.
+        """
+        players = [CheckedPIMCPlayer('PIMC0', self),
+                   TableAIPlayer('AI1'),
+                   CheckedPIMCPlayer('PIMC2', self),
+                   TableAIPlayer('AI3')]
+        team1 = Team(players[0], players[2])
+        team2 = Team(players[1], players[3])
+        StandardGame(team1, team2, rng=gameRng(0, 0)).play()
+        self.assertTrue(max(team1.points, team2.points) >= 10)
+        self.assertTrue(players[0].checked > 0)
+        self.assertTrue(players[0].samples <= 2)
+
+    def test_time_budget(self):
+        """
+        Test a zero time budget still solves one sample per card.
+        """
+        players = [PIMCPlayer('PIMC' + str(i), time_budget=0.0, seed=i)
+                   for i in range(4)]
+        team1 = Team(players[0], players[1])
+        team2 = Team(players[2], players[3])
+        StandardGame(team1, team2, rng=gameRng(1, 0)).play()
+        self.assertTrue(max(team1.points, team2.points) >= 10)
+        self.assertTrue(all(player.samples == 1 for player in players))
+
+
+if __name__ == '__main__':
+    unittest.main()
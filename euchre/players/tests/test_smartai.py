@@ -0,0 +1,115 @@
+import unittest
+
+from euchre import Card
+from euchre import StandardGame
+from euchre import Team
+from euchre.games import gameRng
+from euchre.players import SmartAIPlayer
+from euchre.players import TableAIPlayer
+
+
+def cards(names):
+    return [Card.str2card(name) for name in names]
+
+
+class TestSmartAI(unittest.TestCase):
+
+    def setUp(self):
+        self.players = [SmartAIPlayer('AI' + str(i)) for i in range(4)]
+        Team(self.players[0], self.players[2])
+        Team(self.players[1], self.players[3])
+
+    def test_bidding(self):
+        """
+        Test the dealer orders up a jack and trump is made with 3 cards.
+        """
+        dealer, partner = self.players[3], self.players[1]
+        for player in self.players:
+            player.dealerMsg(dealer)
+            player.topCardMsg(Card.str2card('JH'))
+            player.updateHand(cards(['9C', '1S', 'QS', 'KD', 'AD']))
+        self.assertTrue(dealer.orderUp())
+        self.assertFalse(partner.orderUp())
+        partner.updateHand(cards(['9H', 'AH', 'JD', 'QS', 'AD']))
+        self.assertTrue(partner.orderUp())
+        # Opponents don't give the top card to the dealer
+        self.players[0].updateHand(cards(['9H', 'AH', 'JD', 'QS', 'AD']))
+        self.assertFalse(self.players[0].orderUp())
+
+        self.assertFalse(self.players[0].orderTrump())
+        self.players[0].updateHand(cards(['9C', 'AC', 'JS', 'QS', 'AD']))
+        self.assertTrue(self.players[0].orderTrump())
+        self.assertEqual(self.players[0].callTrump('H'), 'C')
+
+    def test_discard(self):
+        """
+        Test the dealer discards its lowest card that isn't trump.
+        """
+        dealer = self.players[3]
+        dealer.updateHand(cards(['9H', 'AC', 'QS', '1S', 'AD']))
+        discard = dealer.discardCard(Card.str2card('JH'))
+        self.assertEqual(discard, Card.str2card('1S'))
+        self.assertEqual(len(dealer.hand), 5)
+        self.assertEqual(sum(map(len, dealer.suits.values())), 5)
+
+        dealer.updateHand(cards(['9H', 'AH', 'QH', 'JD', 'KH']))
+        discard = dealer.discardCard(Card.str2card('1H'))
+        self.assertEqual(discard, Card.str2card('9H'))
+
+    def test_play(self):
+        """
+        Test the highest card is played when it wins, otherwise the lowest.
+        """
+        leader, second, third, fourth = self.players
+        for player in self.players:
+            player.updateHand(cards(['9C', 'QC', 'AC', '1H', 'JS']))
+        third.updateHand(cards(['9C', 'KC', '1C', '1H', 'QS']))
+        fourth.updateHand(cards(['9D', 'KD', 'AH', '1D', 'QD']))
+        played = {player: [] for player in self.players}
+
+        def play(player):
+            card = player.playCard(leader, played, 'S')
+            played[player].append(card)
+            return card
+
+        # The highest card is led, the jack of spades is the right bower
+        self.assertEqual(play(leader), Card.str2card('JS'))
+        second.updateHand(cards(['9S', 'AS', 'JC', '1H', 'QD']))
+        # Can't beat the right bower
+        self.assertEqual(play(second), Card.str2card('9S'))
+        # Partner is winning
+        self.assertEqual(play(third), Card.str2card('QS'))
+        # Void in trump, the lowest card is thrown
+        self.assertEqual(play(fourth), Card.str2card('9D'))
+
+        for player in self.players:
+            player.updateHand(cards(['9C', 'QC', 'AC', '1H', 'KS']))
+        second.updateHand(cards(['9H', 'AH', 'JC', '1D', 'QD']))
+        third.updateHand(cards(['9D', 'QH', '1S', '1C', 'KD']))
+        played = {player: [] for player in self.players}
+        self.assertEqual(play(leader), Card.str2card('KS'))
+        # The left bower wins
+        self.assertEqual(play(second), Card.str2card('JC'))
+        # Can't beat the left bower, the lowest trump is played
+        self.assertEqual(play(third), Card.str2card('1S'))
+        # Hand and index stay in step
+        for player in self.players[:3]:
+            self.assertEqual(len(player.hand), 4)
+            self.assertEqual(sorted(i for suit in player.suits.values()
+                                    for i in suit),
+                             sorted(card.index for card in player.hand))
+
+    def test_game(self):
+        """
+        Test a game against table driven players finishes.
+        """
+        players = [SmartAIPlayer('AI0'), TableAIPlayer('AI1'),
+                   SmartAIPlayer('AI2'), TableAIPlayer('AI3')]
+        team1 = Team(players[0], players[2])
+        team2 = Team(players[1], players[3])
+        StandardGame(team1, team2, rng=gameRng(0, 0)).play()
+        self.assertTrue(max(team1.points, team2.points) >= 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
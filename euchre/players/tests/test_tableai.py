@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from euchre import Card
+from euchre import StandardGame
+from euchre import Team
+from euchre.cards import CardSet
+from euchre.cards.canonical import fromCanonicalIndex
+from euchre.games import gameRng
+from euchre.players import TableAIPlayer
+from euchre.players.local import biddingtable
+
+
+class TestTableAI(unittest.TestCase):
+
+    def test_expected_points(self):
+        """
+        Test a hand with both bowers is worth more than a weak one.
+        """
+        rng = np.random.default_rng(0)
+        top_index = Card.str2card('9C').index
+        strong = CardSet(Card.str2card(s) for s in
+                         ['JC', 'JS', 'AC', 'KC', 'AH'])
+        weak = CardSet(Card.str2card(s) for s in
+                       ['1C', '1S', 'QH', 'KD', '9D'])
+        strong_points = biddingtable.expectedPoints(
+            strong.mask, top_index, 'C', 0, 50, rng)
+        weak_points = biddingtable.expectedPoints(
+            weak.mask, top_index, 'C', 0, 50, rng)
+        self.assertTrue(strong_points[0] > weak_points[0])
+        self.assertTrue(weak_points[0] < 0)
+
+    def test_lookup(self):
+        """
+        Test built entries can be looked up by position.
+        """
+        start, values = biddingtable._buildChunk(0, 20, 4, 0)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'table.npy')
+            table = np.lib.format.open_memmap(
+                path, mode='w+', dtype=biddingtable.TABLE_DTYPE,
+                shape=biddingtable.TABLE_SHAPE)
+            table[start:start + len(values)] = values
+            table.flush()
+            del table
+
+            player = TableAIPlayer('AI', table_path=path)
+            hand, top_card, trump = fromCanonicalIndex(0)
+            points = biddingtable.lookup(player.table, hand, top_card,
+                                         trump, 2)
+            self.assertEqual(points, float(values[0, 2, 0]))
+            del player
+
+    def test_game(self):
+        """
+        Test a game between table driven players finishes.
+        """
+        players = [TableAIPlayer('AI' + str(i)) for i in range(4)]
+        team1 = Team(players[0], players[1])
+        team2 = Team(players[2], players[3])
+        StandardGame(team1, team2, rng=gameRng(0, 0)).play()
+        self.assertTrue(max(team1.points, team2.points) >= 10)
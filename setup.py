@@ -21,7 +21,13 @@ setup(
         'console_scripts': [
             'euchre-server = euchre.server.server:main',
             'euchre-webconsole = euchre.clients.webconsole:main',
-            'euchre-play = euchre.play:play'
+            'euchre-play = euchre.play:play',
+            'euchre-bidding-table = euchre.players.local.biddingtable:main',
+            'euchre-tournament = euchre.games.tournament:main',
+            'euchre-round-records = euchre.games.roundrecords:main',
+            'euchre-replay = euchre.games.replay:main',
+            'euchre-stats = euchre.games.logstats:main',
+            'euchre-dataset = euchre.games.dataset:main'
         ]
     },
 )